@@ -0,0 +1,241 @@
+"""
+Background bulk indexing for Elasticsearch.
+
+Documents are buffered in memory and sent through the `_bulk` API by a daemon thread once the buffer reaches a
+number of documents or bytes, or after a time interval. Items rejected with 429 or 5xx are retried with backoff.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+import requests
+
+from core.utilities.logging.custom_logger import create_logger
+
+log = create_logger("Elastic Bulk Indexer")
+
+# bulk item statuses worth sending again
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class BulkIndexer:
+    """
+    Buffers bulk actions and flushes them to Elasticsearch from a background thread.
+
+    Thread-safe: any thread may add documents; sends are serialized so actions on the same document id reach
+    Elasticsearch in the order they were added.
+    """
+
+    def __init__(self, session_factory: Callable[[], Tuple[requests.Session, str]], *, max_docs: int = 500,
+                 max_bytes: int = 5 * 1024 * 1024, flush_interval: float = 2.0, max_retries: int = 3,
+                 backoff: float = 0.5, timeout: float = 20):
+        """
+        Initializes the indexer. The background thread starts with the first document.
+
+        Args:
+            session_factory: Returns the requests.Session and base URL of the cluster.
+            max_docs: Number of buffered actions that triggers a flush.
+            max_bytes: Size in bytes of the buffered actions that triggers a flush.
+            flush_interval: Seconds after which buffered actions are flushed regardless of their number.
+            max_retries: Number of times a request or an item rejected with 429/5xx is sent again.
+            backoff: The delay before retry n is backoff * 2 ** n seconds.
+            timeout: Timeout in seconds of a bulk request.
+        """
+        self.session_factory = session_factory
+        self.max_docs = max_docs
+        self.max_bytes = max_bytes
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+
+        self.stats: Dict[str, int] = {"queued": 0, "indexed": 0, "failed": 0, "retried": 0, "flushes": 0}
+        self._flush_hooks: List[Callable[[], None]] = []
+        self._reset()
+        if hasattr(os, 'register_at_fork'):
+            # a forked worker inherits the buffer but not the thread; start it clean
+            os.register_at_fork(after_in_child=self._reset)
+        atexit.register(self.close)
+
+    def _reset(self):
+        self._condition = threading.Condition()
+        self._send_lock = threading.Lock()
+        self._buffer: List[bytes] = []
+        self._buffer_bytes = 0
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def add_flush_hook(self, hook: Callable[[], None]):
+        """
+        Registers a callable run at the start of every flush, e.g. to queue aggregated documents.
+        Flushes run at least every flush_interval seconds once the indexer has started.
+
+        Args:
+            hook: The callable.
+        """
+        self._flush_hooks.append(hook)
+
+    def start(self):
+        """
+        Starts the background thread if it is not running.
+        """
+        with self._condition:
+            if self._thread is None or not self._thread.is_alive():
+                self._start()
+
+    def add(self, index: str, document: Dict[str, Any], doc_id: Optional[str] = None, op_type: str = 'index',
+            **metadata):
+        """
+        Queues a document for indexing.
+
+        Args:
+            index: The target index.
+            document: The document, or the body of an 'update' action (e.g. {"script": ..., "upsert": ...}).
+            doc_id: Optional document id.
+            op_type: The bulk action: 'index', 'create' or 'update'.
+            **metadata: Additional action metadata, e.g. retry_on_conflict=3.
+        """
+        action = {"_index": index, **metadata}
+        if doc_id is not None:
+            action["_id"] = doc_id
+        lines = (json.dumps({op_type: action}) + "\n" + json.dumps(document) + "\n").encode("utf-8")
+
+        with self._condition:
+            if self._thread is None or not self._thread.is_alive():
+                self._start()
+            self._buffer.append(lines)
+            self._buffer_bytes += len(lines)
+            self.stats["queued"] += 1
+            if len(self._buffer) >= self.max_docs or self._buffer_bytes >= self.max_bytes:
+                self._condition.notify()
+
+    def _start(self):
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="elastic-bulk-indexer", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                deadline = time.monotonic() + self.flush_interval
+                while not self._closed and len(self._buffer) < self.max_docs and self._buffer_bytes < self.max_bytes:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                closed = self._closed
+
+            try:
+                self.flush()
+            except Exception as e:
+                log.warning("Elasticsearch bulk flush failed: %s", e)
+
+            if closed:
+                return
+
+    def _take(self) -> List[bytes]:
+        with self._condition:
+            actions, self._buffer, self._buffer_bytes = self._buffer, [], 0
+            return actions
+
+    def flush(self) -> int:
+        """
+        Sends every buffered action now, in the calling thread.
+
+        Returns:
+            The number of actions sent.
+        """
+        with self._send_lock:
+            for hook in self._flush_hooks:
+                try:
+                    hook()
+                except Exception as e:
+                    log.warning("Elasticsearch bulk flush hook failed: %s", e)
+            actions = self._take()
+            if not actions:
+                return 0
+
+            self.stats["flushes"] += 1
+            sent = len(actions)
+            attempt = 0
+            while actions:
+                failed = self._send(actions)
+                if not failed or attempt >= self.max_retries:
+                    self.stats["failed"] += len(failed)
+                    break
+                self.stats["retried"] += len(failed)
+                time.sleep(self.backoff * (2 ** attempt))
+                attempt += 1
+                actions = failed
+        return sent
+
+    def _send(self, actions: List[bytes]) -> List[bytes]:
+        """
+        Sends actions in one bulk request.
+
+        Returns:
+            The actions to retry.
+        """
+        session, base = self.session_factory()
+        try:
+            response = session.post(urljoin(base, "_bulk"), data=b"".join(actions), timeout=self.timeout,
+                                    headers={"Content-Type": "application/x-ndjson"})
+        except requests.RequestException as e:
+            log.warning("Elasticsearch bulk request failed: %s", e)
+            return actions
+
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            log.warning("Elasticsearch bulk request rejected (%s)", response.status_code)
+            return actions
+        if response.status_code >= 400:
+            log.warning("Elasticsearch bulk request failed (%s): %s", response.status_code, response.text)
+            self.stats["failed"] += len(actions)
+            return []
+
+        body = response.json()
+        if not body.get("errors"):
+            self.stats["indexed"] += len(actions)
+            return []
+
+        retry = []
+        for action, item in zip(actions, body.get("items", [])):
+            result = next(iter(item.values()))
+            status = result.get("status", 500)
+            if status < 300:
+                self.stats["indexed"] += 1
+            elif status in RETRYABLE_STATUS_CODES:
+                retry.append(action)
+            else:
+                self.stats["failed"] += 1
+                log.warning("Elasticsearch rejected document %s (%s): %s", result.get("_id"), status,
+                            result.get("error"))
+        return retry
+
+    def close(self, timeout: float = 30):
+        """
+        Flushes the remaining actions and stops the background thread.
+
+        Args:
+            timeout: Seconds to wait for the background thread.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            thread = self._thread
+
+        if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout)
+        self.flush()
+
+    @property
+    def pending(self) -> int:
+        """
+        Returns the number of buffered actions.
+        """
+        with self._condition:
+            return len(self._buffer)
@@ -0,0 +1,103 @@
+"""
+In-process pass/fail counters of decorated functions, pushed to Elasticsearch as scripted upserts.
+
+Recording an outcome only updates a local counter; the accumulated increments are sent periodically as one
+`update` action per function, so the cost of a decorated call does not depend on the size of the index.
+"""
+import os
+import threading
+
+from typing import Dict, List, Optional, Tuple
+
+# the 'last_failed' value of a function whose latest call passed
+NEVER_FAILED = '2000-01-01T00:00'
+
+# applies the increments of one push to the stored document
+UPSERT_SCRIPT = """
+ctx._source.passed = (ctx._source.passed == null ? 0 : ctx._source.passed) + params.passed;
+ctx._source.failed = (ctx._source.failed == null ? 0 : ctx._source.failed) + params.failed;
+double total = ctx._source.passed + ctx._source.failed;
+ctx._source.pass_fail_percent = total > 0 ? 100.0 * ctx._source.passed / total : 0;
+ctx._source.last_failed = params.last_failed;
+if (params.exception_message != null) {
+    ctx._source.exception_message = params.exception_message;
+    ctx._source.args = params.args;
+}
+ctx._source.date = params.date;
+ctx._source.machine = params.machine;
+""".strip()
+
+
+class FunctionCounter:
+    """
+    The increments recorded for one function since the last push, and the details of its latest call.
+    """
+    __slots__ = ("passed", "failed", "last_failed", "exception_message", "args", "date")
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+        self.last_failed = NEVER_FAILED
+        # exception and arguments of the latest failure
+        self.exception_message: Optional[str] = None
+        self.args = ''
+        self.date = ''
+
+
+class CounterStore:
+    """
+    Thread-safe counters keyed by index and function path.
+    """
+
+    def __init__(self):
+        self._reset()
+        if hasattr(os, 'register_at_fork'):
+            # a forked worker would push the parent's counts again, and may inherit the lock while held
+            os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, str], FunctionCounter] = {}
+
+    def record(self, index: str, path: str, passed: bool, date: str, args: str = '',
+               exception_message: Optional[str] = None):
+        """
+        Records the outcome of one call.
+
+        Args:
+            index: The index the function is logged to.
+            path: The module and qualified name of the function.
+            passed: Whether the call returned without raising.
+            date: The time of the call, in the configured time format.
+            args: The arguments of the call, as logged.
+            exception_message: The name of the exception raised, if the call failed.
+        """
+        with self._lock:
+            counter = self._counters.get((index, path))
+            if counter is None:
+                counter = self._counters[(index, path)] = FunctionCounter()
+
+            counter.date = date
+            if passed:
+                counter.passed += 1
+                counter.last_failed = NEVER_FAILED
+            else:
+                counter.failed += 1
+                counter.last_failed = date
+                counter.exception_message = exception_message
+                counter.args = args
+
+    def drain(self) -> List[Tuple[str, str, FunctionCounter]]:
+        """
+        Takes every counter recorded since the last call.
+
+        Returns:
+            (index, path, counter) for every function called since the last drain.
+        """
+        with self._lock:
+            counters, self._counters = self._counters, {}
+        return [(index, path, counter) for (index, path), counter in counters.items()]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._counters)
@@ -1,12 +1,14 @@
-import jsonmerge
 import requests
 import functools
 import base64
+import time
 
 from core.apps.config import AppNames, AppConfigLoader
+from core.apps.es_logging.app.bulk import BulkIndexer
+from core.apps.es_logging.app.counters import CounterStore, UPSERT_SCRIPT
+from core.apps.es_logging.app.outcomes import OutcomeQueue
 from core.apps.es_logging.models.document import DtoFunctionLogger, update_interval_map
 from core.config.env_variables import ENV_ENABLE_PROXY
-from core.utilities.data.qlist import QList
 
 from datetime import datetime
 from http import HTTPStatus
@@ -33,51 +35,52 @@ except Exception as _init_err:
     _ES_CONFIGURED = False
 
 
-def log_result(logging_index=LOGGING_INDEX):
+def log_result(logging_index=LOGGING_INDEX, mode: str | None = None):
+    """
+    Records the pass/fail outcome of every call of the decorated function in the logging index.
+
+    Outcomes are counted in-process and pushed periodically by the bulk indexer as one scripted upsert per
+    function, so the decorated call never waits on Elasticsearch. Exceptions are logged and swallowed.
+
+    Args:
+        logging_index: The index the outcomes are logged to.
+        mode: 'sync' to count the outcome in the calling thread, or 'async' to only append it to a bounded
+              queue drained by a daemon thread; in async mode the arguments are only formatted for failed calls.
+              Defaults to app_data.log_result.mode, else 'sync'.
+    """
+    asynchronous = (mode or _log_result_settings.get('mode') or 'sync').lower() == 'async'
+
     def decorator(func):
+        path = "{0}.{1}".format(func.__module__, func.__qualname__)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             if not _ES_CONFIGURED:
                 return func(*args, **kwargs)
 
-            path = "{0}.{1}".format(func.__module__, func.__qualname__)
-            try:
-                logs = QList(get_index_data(logging_index, type_hook=DtoFunctionLogger))
-                target = logs.where(lambda x: x.name == path).first() if len(logs) > 0 else None
-            except Exception:
-                target = None
-
-            args_str = ''.join(['"{0}" '.format(str(arg)) for arg in args])
-            index_dto = DtoFunctionLogger(name=path,
-                                          passed=0,
-                                          failed=0,
-                                          last_failed='2000-01-01T00:00',
-                                          pass_fail_percent=0,
-                                          exception_message='None',
-                                          args=args_str) \
-                if not target else target
-
+            if asynchronous:
+                started = time.time()
+                try:
+                    f = func(*args, **kwargs)
+                except Exception as e:
+                    outcome_queue.put((logging_index, path, False, started, _format_args(args), e.__class__.__name__))
+                    log.warning("Exception encountered in decorated function. {0}\nProceed with process".format(e))
+                    return None
+                outcome_queue.put((logging_index, path, True, started, '', None))
+                return f
+
+            args_str = _format_args(args)
             f = error = None
             now = datetime.now().strftime(ELASTIC_TIME_FORMAT)
             try:
                 f = func(*args, **kwargs)
-                index_dto.passed += 1
-                index_dto.last_failed = '2000-01-01T00:00'
             except Exception as e:
                 error = e
-                index_dto.failed += 1
-                index_dto.last_failed = now
-                index_dto.exception_message = error.__class__.__name__
-                index_dto.args = args_str
             finally:
-                index_dto.date = now
-                index_dto.compute_stat()
-
                 try:
-                    post(json_dump=index_dto.get_dict(),
-                         index_name=logging_index,
-                         use_interval_map=False,
-                         location_key=path)
+                    counter_store.record(logging_index, path, passed=error is None, date=now, args=args_str,
+                                         exception_message=error.__class__.__name__ if error else None)
+                    bulk_indexer.start()
                 except Exception as es_error:
                     log.warning(f"Elasticsearch logging skipped for '{path}': {es_error}")
 
@@ -91,6 +94,10 @@ def log_result(logging_index=LOGGING_INDEX):
     return decorator
 
 
+def _format_args(args) -> str:
+    return ''.join(['"{0}" '.format(str(arg)) for arg in args])
+
+
 def _looks_base64(s: str) -> bool:
     try:
         # tolerate padding variations
@@ -126,6 +133,88 @@ def _es_session():
     return sess, (config.parameters["url"].rstrip("/") + "/")
 
 
+@functools.lru_cache(maxsize=1)
+def _shared_es_session():
+    """
+    The Elasticsearch session reused by the bulk indexer, so flushes keep their connections alive.
+    """
+    return _es_session()
+
+
+_bulk_settings = app_data.get('bulk') or {}
+bulk_indexer = BulkIndexer(_shared_es_session,
+                           max_docs=_bulk_settings.get('max_docs', 500),
+                           max_bytes=_bulk_settings.get('max_bytes', 5 * 1024 * 1024),
+                           flush_interval=_bulk_settings.get('flush_interval', 2.0),
+                           max_retries=_bulk_settings.get('max_retries', 3))
+
+
+counter_store = CounterStore()
+
+
+def _record_outcome(outcome):
+    index, path, passed, started, args_str, exception_message = outcome
+    date = datetime.fromtimestamp(started).strftime(ELASTIC_TIME_FORMAT)
+    counter_store.record(index, path, passed=passed, date=date, args=args_str, exception_message=exception_message)
+    bulk_indexer.start()
+
+
+_log_result_settings = app_data.get('log_result') or {}
+outcome_queue = OutcomeQueue(_record_outcome,
+                             max_size=_log_result_settings.get('max_size', 10_000),
+                             policy=_log_result_settings.get('policy', 'drop_oldest'),
+                             interval=_log_result_settings.get('interval', 0.5),
+                             block_timeout=_log_result_settings.get('block_timeout', 1.0))
+
+
+def _push_counters():
+    """
+    Queues the counters recorded by log_result as scripted upserts, one per function.
+    """
+    outcome_queue.drain()
+    for index, path, counter in counter_store.drain():
+        upsert = DtoFunctionLogger(name=path,
+                                   passed=counter.passed,
+                                   failed=counter.failed,
+                                   last_failed=counter.last_failed,
+                                   pass_fail_percent=0,
+                                   exception_message=counter.exception_message or 'None',
+                                   args=counter.args,
+                                   date=counter.date,
+                                   machine=DtoFunctionLogger.machine)
+        upsert.compute_stat()
+
+        script = {
+            "lang": "painless",
+            "source": UPSERT_SCRIPT,
+            "params": {
+                "passed": counter.passed,
+                "failed": counter.failed,
+                "last_failed": counter.last_failed,
+                "exception_message": counter.exception_message,
+                "args": counter.args,
+                "date": counter.date,
+                "machine": DtoFunctionLogger.machine,
+            },
+        }
+        bulk_indexer.add(index, {"script": script, "upsert": upsert.get_dict()}, doc_id=path, op_type='update',
+                         retry_on_conflict=3)
+
+
+bulk_indexer.add_flush_hook(_push_counters)
+
+
+def flush():
+    """
+    Sends every document queued with post_bulk and every outcome recorded by log_result now,
+    in both sync and async mode, e.g. before a worker shuts down.
+
+    Returns:
+        The number of documents sent.
+    """
+    return bulk_indexer.flush()
+
+
 def _map_hits(hits, type_hook):
     if type_hook is None:
         return hits
@@ -136,6 +225,40 @@ def _map_hits(hits, type_hook):
     return mapped
 
 
+def _document_id(location_key: str, use_interval_map=True, identifier='', update_interval: str = None) -> str:
+    update_interval_ = app_data['update_interval'] if update_interval is None else update_interval
+    update_interval_config = str(update_interval_).upper()
+    if use_interval_map:
+        id_ = '_' + update_interval_map[update_interval_config]
+    else:
+        id_ = '' if not identifier else '_' + identifier
+
+    return f"{location_key}{id_}"
+
+
+def _with_timestamp(json_dump: dict) -> dict:
+    # the document's own 'date' wins over the indexing timestamp
+    return {"date": datetime.now().strftime('%Y-%m-%dT%H:%M:%S.%f'), **json_dump}
+
+
+def post_bulk(json_dump, index_name: str, location_key: str, use_interval_map=True, identifier='',
+              update_interval: str = None):
+    """
+    Queues a JSON doc for indexing through the background bulk indexer and returns immediately.
+    Same document id and timestamp rules as post; failures are logged by the indexer instead of raised.
+
+    Args:
+        json_dump: The document.
+        index_name: The target index.
+        location_key: The base of the document id.
+        use_interval_map: Whether to suffix the id with the current update interval.
+        identifier: Suffix of the id when the interval map is not used.
+        update_interval: Overrides the configured update interval.
+    """
+    bulk_indexer.add(index_name, _with_timestamp(json_dump),
+                     doc_id=_document_id(location_key, use_interval_map, identifier, update_interval))
+
+
 def post(json_dump, index_name: str, location_key: str, use_interval_map=True, identifier='', update_interval: str =None):
     """
     Index a JSON doc into Elasticsearch with robust auth handling.
@@ -159,21 +282,12 @@ def post(json_dump, index_name: str, location_key: str, use_interval_map=True, i
       - config.parameters['url']: base ES URL like "https://localhost:9200/"
       - ENV_ENABLE_PROXY: "true"/"false"
     """
-    update_interval_ = app_data['update_interval'] if update_interval is None else update_interval
-    update_interval_config = str(update_interval_).upper()
-    if use_interval_map:
-        id_ = '_' + update_interval_map[update_interval_config]
-    else:
-        id_ = '' if not identifier else '_' + identifier
-
-    loc = f"{location_key}{id_}"
-    print(f"Using {update_interval_config} interval with generated location key {loc}")
+    loc = _document_id(location_key, use_interval_map, identifier, update_interval)
+    print(f"Using {str(update_interval or app_data['update_interval']).upper()} interval "
+          f"with generated location key {loc}")
 
     # Merge timestamp into payload
-    result = jsonmerge.merge(
-        {"date": datetime.now().strftime('%Y-%m-%dT%H:%M:%S.%f')},
-        json_dump
-    )
+    result = _with_timestamp(json_dump)
 
     # Build URL safely
     base = config.parameters['url'].rstrip('/') + '/'
@@ -256,6 +370,7 @@ def get_index_data(
 
     Returns:
       List of docs (either raw hits or type_hook(_source)).
+      For large scans use iter_index_data, which streams the docs in constant memory.
     """
     sess, base = _es_session()
     url = urljoin(base, f"{index_name}/_search")
@@ -354,4 +469,91 @@ def get_index_data(
         raise RuntimeError(f"Network error talking to Elasticsearch: {e}") from e
 
 
+def iter_index_data(
+    index_name: str,
+    type_hook=None,
+    search_string: str | None = None,
+    *,
+    query: dict | None = None,
+    page_size: int = 1_000,
+    source: list | bool | None = None,
+    sort: list | None = None,
+    max_docs: int | None = None,
+    keep_alive: str = "1m",
+    timeout: int = 20,
+):
+    """
+    Stream documents from an Elasticsearch index page by page, using a point in time and search_after.
+
+    Unlike get_index_data, only one page is held in memory and the first documents are yielded as soon as
+    the first page arrives, so any number of documents can be scanned.
+
+    Args:
+      index_name: target index.
+      type_hook: callable to map each _source -> object (e.g., dataclass(**_source)).
+      search_string: Lucene query string (e.g., 'status:active AND tag:foo').
+      query: full Query DSL query (dict), used instead of search_string.
+      page_size: number of docs fetched per request.
+      source: _source filtering, e.g. ['name', 'passed'] or False to return no _source.
+      sort: sort clauses; defaults to index order (_shard_doc), the fastest for full scans.
+      max_docs: stop after this many docs (defaults to all).
+      keep_alive: how long Elasticsearch keeps the point in time open between two pages.
+      timeout: request timeout in seconds.
+
+    Returns:
+      Iterator of docs (either raw hits or type_hook(_source)).
+    """
+    sess, base = _shared_es_session()
+
+    if query is None:
+        query = {"query_string": {"query": search_string}} if search_string is not None else {"match_all": {}}
+
+    try:
+        pit_resp = sess.post(urljoin(base, f"{index_name}/_pit"), params={"keep_alive": keep_alive}, timeout=timeout)
+        if pit_resp.status_code != HTTPStatus.OK:
+            raise RuntimeError(f"Opening point in time failed ({pit_resp.status_code}): {pit_resp.text}")
+        pit_id = pit_resp.json()["id"]
+    except requests.RequestException as e:
+        raise RuntimeError(f"Network error talking to Elasticsearch: {e}") from e
+
+    remaining = max_docs
+    search_after = None
+    try:
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            body = {
+                "size": size,
+                "query": query,
+                "pit": {"id": pit_id, "keep_alive": keep_alive},
+                "sort": sort or [{"_shard_doc": "asc"}],
+                "track_total_hits": False,
+            }
+            if source is not None:
+                body["_source"] = source
+            if search_after is not None:
+                body["search_after"] = search_after
+
+            try:
+                resp = sess.post(urljoin(base, "_search"), json=body, timeout=timeout)
+            except requests.RequestException as e:
+                raise RuntimeError(f"Network error talking to Elasticsearch: {e}") from e
+            if resp.status_code != HTTPStatus.OK:
+                raise RuntimeError(f"Search page failed ({resp.status_code}): {resp.text}")
+
+            payload = resp.json()
+            # the point in time id may change between pages
+            pit_id = payload.get("pit_id", pit_id)
+            hits = payload.get("hits", {}).get("hits", [])
+
+            yield from _map_hits(hits, type_hook)
 
+            if len(hits) < size:
+                break
+            search_after = hits[-1]["sort"]
+            if remaining is not None:
+                remaining -= len(hits)
+    finally:
+        try:
+            sess.delete(urljoin(base, "_pit"), json={"id": pit_id}, timeout=timeout)
+        except Exception:
+            pass
@@ -0,0 +1,175 @@
+"""
+A bounded in-memory queue of function outcomes, drained by a daemon thread.
+
+Producers append to a deque, which needs no lock in CPython, so recording an outcome costs about as much as
+a list append. The 'drop_new' and 'block' policies take a lock around the size check and the append, so that
+concurrent producers cannot push the queue past max_size. When the queue is full the policy decides what happens:
+- 'drop_oldest' (default): the oldest outcome is discarded.
+- 'drop_new': the new outcome is discarded.
+- 'block': the producer waits for the drainer, up to block_timeout seconds, then drops the new outcome.
+"""
+import os
+import threading
+import time
+
+from collections import deque
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from core.utilities.logging.custom_logger import create_logger
+
+log = create_logger("Elastic Outcome Queue")
+
+POLICIES = ('drop_oldest', 'drop_new', 'block')
+
+
+class OutcomeQueue:
+    """
+    Hands outcomes recorded on hot paths to a consumer running on a daemon thread.
+    """
+
+    def __init__(self, consumer: Callable[[Tuple[Any, ...]], None], *, max_size: int = 10_000,
+                 policy: str = 'drop_oldest', interval: float = 0.5, block_timeout: float = 1.0):
+        """
+        Initializes the queue. The daemon thread starts with the first outcome.
+
+        Args:
+            consumer: Called on the daemon thread with every outcome, in order.
+            max_size: Maximum number of outcomes waiting for the consumer.
+            policy: What to do when the queue is full: 'drop_oldest', 'drop_new' or 'block'.
+            interval: Seconds between two drains when the queue is not filling up.
+            block_timeout: Longest wait of a producer with the 'block' policy.
+
+        Raises:
+            ValueError: If the policy is unknown.
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown queue policy '{policy}'. Available: {', '.join(POLICIES)}")
+
+        self.consumer = consumer
+        self.max_size = max_size
+        self.policy = policy
+        self.interval = interval
+        self.block_timeout = block_timeout
+        # wake the drainer early once the queue is half full
+        self._high_water = max(1, max_size // 2)
+
+        self._reset()
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self):
+        self._queue = deque(maxlen=self.max_size if self.policy == 'drop_oldest' else None)
+        self._wake = threading.Event()
+        self._drain_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        # only taken by the 'drop_new' and 'block' policies, whose deque has no maxlen
+        self._put_lock = threading.Lock()
+        # only taken when dropping, never on the normal path
+        self._dropped_lock = threading.Lock()
+        self._dropped = 0
+        self._consumed = 0
+
+    def put(self, outcome: Tuple[Any, ...]) -> bool:
+        """
+        Records an outcome without waiting, unless the policy is 'block' and the queue is full.
+
+        Args:
+            outcome: The outcome passed to the consumer.
+
+        Returns:
+            False if the outcome was dropped.
+        """
+        if self._thread is None:
+            self._start()
+
+        if self.policy == 'drop_oldest':
+            queue = self._queue
+            if len(queue) >= self.max_size:
+                self._count_drop()
+            # the deque discards the oldest outcome itself
+            queue.append(outcome)
+            size = len(queue)
+        else:
+            size = self._append_bounded(outcome)
+            if not size:
+                self._count_drop()
+                return False
+
+        if size >= self._high_water:
+            self._wake.set()
+        return True
+
+    def _count_drop(self):
+        with self._dropped_lock:
+            self._dropped += 1
+
+    def _append_bounded(self, outcome: Tuple[Any, ...]) -> int:
+        # returns the size of the queue after the append, or 0 if the outcome was dropped
+        deadline = None
+        while True:
+            with self._put_lock:
+                size = len(self._queue)
+                if size < self.max_size:
+                    self._queue.append(outcome)
+                    return size + 1
+            if self.policy == 'drop_new':
+                return 0
+            if deadline is None:
+                deadline = time.monotonic() + self.block_timeout
+            # wait for the drainer without holding the lock, so that other producers time out on their own
+            self._wake.set()
+            if time.monotonic() >= deadline:
+                return 0
+            time.sleep(0.001)
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="elastic-outcome-queue", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                self.drain()
+            except Exception as e:
+                log.warning("Elasticsearch outcome queue drain failed: %s", e)
+
+    def drain(self) -> int:
+        """
+        Passes every queued outcome to the consumer in the calling thread.
+
+        Returns:
+            The number of outcomes consumed.
+        """
+        consumed = 0
+        with self._drain_lock:
+            queue = self._queue
+            while True:
+                try:
+                    outcome = queue.popleft()
+                except IndexError:
+                    break
+                self.consumer(outcome)
+                consumed += 1
+            self._consumed += consumed
+        return consumed
+
+    def flush(self) -> int:
+        """
+        Drains the queue now, e.g. at shutdown.
+
+        Returns:
+            The number of outcomes consumed.
+        """
+        return self.drain()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the number of queued, consumed and dropped outcomes.
+        """
+        return {"queued": len(self._queue), "consumed": self._consumed, "dropped": self._dropped}
@@ -0,0 +1,91 @@
+import json
+import threading
+import time
+
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from core.apps.es_logging.app.bulk import BulkIndexer
+
+
+class FakeBulkSession:
+    """Answers _bulk requests, rejecting the first attempt of the ids listed in reject_once with a 429."""
+
+    def __init__(self, reject_once=(), fail=()):
+        self.reject_once = set(reject_once)
+        self.fail = set(fail)
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def post(self, url, data=None, **kwargs):
+        lines = data.decode("utf-8").splitlines()
+        actions = [json.loads(line) for line in lines[0::2]]
+        items, errors = [], False
+        with self.lock:
+            self.requests.append(actions)
+            for action in actions:
+                doc_id = action["index"]["_id"]
+                status = 201
+                if doc_id in self.reject_once:
+                    self.reject_once.discard(doc_id)
+                    status = 429
+                elif doc_id in self.fail:
+                    status = 400
+                errors = errors or status >= 300
+                items.append({"index": {"_id": doc_id, "status": status}})
+
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"errors": errors, "items": items}
+        return response
+
+
+class TestsElasticBulkIndexer(TestCase):
+    def create(self, session, **kwargs):
+        indexer = BulkIndexer(lambda: (session, "http://es.local/"), backoff=0, **kwargs)
+        self.addCleanup(indexer.close)
+        return indexer
+
+    def test_flush_on_count(self):
+        session = FakeBulkSession()
+        indexer = self.create(session, max_docs=5, flush_interval=60)
+        for i in range(10):
+            indexer.add("logs", {"n": i}, doc_id=str(i))
+
+        deadline = time.monotonic() + 5
+        while indexer.stats["indexed"] < 10 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(indexer.stats["indexed"], 10)
+        self.assertTrue(all(len(actions) <= 10 for actions in session.requests))
+
+    def test_flush_on_interval(self):
+        session = FakeBulkSession()
+        indexer = self.create(session, max_docs=100, flush_interval=0.05)
+        indexer.add("logs", {"n": 1}, doc_id="1")
+
+        deadline = time.monotonic() + 5
+        while not session.requests and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(len(session.requests), 1)
+        self.assertEqual(indexer.pending, 0)
+
+    def test_partial_failures_are_retried(self):
+        session = FakeBulkSession(reject_once={"2"}, fail={"3"})
+        indexer = self.create(session, max_docs=100, flush_interval=60)
+        for i in range(1, 5):
+            indexer.add("logs", {"n": i}, doc_id=str(i))
+
+        self.assertEqual(indexer.flush(), 4)
+        self.assertEqual([a["index"]["_id"] for a in session.requests[1]], ["2"])
+        self.assertEqual(indexer.stats["indexed"], 3)
+        self.assertEqual(indexer.stats["failed"], 1)
+        self.assertEqual(indexer.stats["retried"], 1)
+
+    def test_close_flushes(self):
+        session = FakeBulkSession()
+        indexer = self.create(session, max_docs=100, flush_interval=60)
+        indexer.add("logs", {"n": 1}, doc_id="1")
+        indexer.close()
+
+        self.assertEqual(indexer.stats["indexed"], 1)
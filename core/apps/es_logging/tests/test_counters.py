@@ -0,0 +1,76 @@
+import json
+import os
+
+from unittest import TestCase, skipUnless
+from unittest.mock import MagicMock, patch
+
+from core.apps.es_logging.app import elasticsearch
+from core.apps.es_logging.app.counters import CounterStore, NEVER_FAILED
+
+
+class TestsElasticCounters(TestCase):
+    def test_record_and_drain(self):
+        store = CounterStore()
+        store.record("logs", "a.f", passed=True, date="t1", args='"1" ')
+        store.record("logs", "a.f", passed=False, date="t2", args='"2" ', exception_message="ValueError")
+        store.record("logs", "a.f", passed=True, date="t3", args='"3" ')
+
+        [(index, path, counter)] = store.drain()
+        self.assertEqual((index, path), ("logs", "a.f"))
+        self.assertEqual((counter.passed, counter.failed), (2, 1))
+        self.assertEqual(counter.last_failed, NEVER_FAILED)
+        self.assertEqual((counter.exception_message, counter.args), ("ValueError", '"2" '))
+        self.assertEqual(len(store), 0)
+
+    def test_log_result_pushes_scripted_upserts(self):
+        session = MagicMock()
+        session.post.return_value = MagicMock(status_code=200, json=MagicMock(return_value={"errors": False}))
+
+        @elasticsearch.log_result("logs")
+        def decorated(value):
+            if value < 0:
+                raise ValueError(value)
+            return value
+
+        with patch.object(elasticsearch.bulk_indexer, "session_factory", return_value=(session, "http://es.local/")), \
+                patch.object(elasticsearch, "get_index_data", side_effect=AssertionError("no index reads")):
+            self.assertEqual(decorated(1), 1)
+            self.assertIsNone(decorated(-1))
+            decorated(2)
+            elasticsearch.flush()
+
+        lines = [json.loads(line) for line in session.post.call_args.kwargs["data"].decode("utf-8").splitlines()]
+        action, body = lines[-2:]
+        self.assertEqual(action["update"]["_id"], f"{__name__}.{decorated.__qualname__}")
+        self.assertEqual(action["update"]["retry_on_conflict"], 3)
+        self.assertEqual(body["script"]["params"]["passed"], 2)
+        self.assertEqual(body["script"]["params"]["failed"], 1)
+        self.assertEqual(body["script"]["params"]["exception_message"], "ValueError")
+        self.assertAlmostEqual(body["upsert"]["pass_fail_percent"], 100 * 2 / 3)
+        # a new document gets the same arguments as an existing one
+        self.assertEqual(body["upsert"]["args"], '"-1" ')
+        self.assertEqual(body["script"]["params"]["args"], body["upsert"]["args"])
+
+    @skipUnless(hasattr(os, 'fork'), "requires os.fork")
+    def test_forked_worker_starts_without_counts(self):
+        store = CounterStore()
+        store.record("logs", "a.f", passed=True, date="t1")
+
+        read, write = os.pipe()
+        with store._lock:
+            pid = os.fork()
+            if pid == 0:
+                os.close(read)
+                # the lock was held by the parent when forking
+                acquired = store._lock.acquire(timeout=1)
+                if acquired:
+                    store._lock.release()
+                os.write(write, f"{len(store._counters)} {acquired}".encode())
+                os._exit(0)
+        os.close(write)
+        with os.fdopen(read) as pipe:
+            child = pipe.read()
+        os.waitpid(pid, 0)
+
+        self.assertEqual(child, "0 True")
+        self.assertEqual(len(store), 1)
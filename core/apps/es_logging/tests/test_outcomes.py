@@ -0,0 +1,123 @@
+import json
+import threading
+import time
+
+from collections import deque
+
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from core.apps.es_logging.app import elasticsearch
+from core.apps.es_logging.app.outcomes import OutcomeQueue
+
+
+class TestsElasticOutcomeQueue(TestCase):
+    def test_drain_keeps_order(self):
+        consumed = []
+        queue = OutcomeQueue(consumed.append, interval=60)
+        for i in range(5):
+            self.assertTrue(queue.put((i,)))
+
+        self.assertEqual(queue.drain(), 5)
+        self.assertEqual(consumed, [(i,) for i in range(5)])
+        self.assertEqual(queue.stats, {"queued": 0, "consumed": 5, "dropped": 0})
+
+    def test_drop_oldest(self):
+        consumed = []
+        queue = OutcomeQueue(consumed.append, max_size=3, interval=60)
+        # keep the drainer from emptying the queue while it fills up
+        with queue._drain_lock:
+            for i in range(5):
+                self.assertTrue(queue.put((i,)))
+
+        queue.flush()
+        self.assertEqual(consumed, [(2,), (3,), (4,)])
+        self.assertEqual(queue.stats["dropped"], 2)
+
+    def test_drop_new(self):
+        consumed = []
+        queue = OutcomeQueue(consumed.append, max_size=3, policy='drop_new', interval=60)
+        with queue._drain_lock:
+            results = [queue.put((i,)) for i in range(5)]
+
+        queue.flush()
+        self.assertEqual(results, [True, True, True, False, False])
+        self.assertEqual(consumed, [(0,), (1,), (2,)])
+        self.assertEqual(queue.stats["dropped"], 2)
+
+    def test_concurrent_producers_respect_max_size(self):
+        class YieldingDeque(deque):
+            # give other producers a chance to run between the size check and the append
+            def __len__(self):
+                size = super().__len__()
+                time.sleep(0.0001)
+                return size
+
+        for policy in ('drop_new', 'block'):
+            with self.subTest(policy=policy):
+                queue = OutcomeQueue(lambda outcome: None, max_size=50, policy=policy, interval=60,
+                                     block_timeout=0.01)
+                queue._queue = YieldingDeque()
+                accepted = []
+                start = threading.Barrier(8)
+
+                def produce():
+                    start.wait()
+                    accepted.append(sum(queue.put((i,)) for i in range(200)))
+
+                with queue._drain_lock:
+                    threads = [threading.Thread(target=produce) for _ in range(8)]
+                    for thread in threads:
+                        thread.start()
+                    for thread in threads:
+                        thread.join()
+                    self.assertEqual(len(queue._queue), 50)
+                    self.assertEqual(sum(accepted), 50)
+                    self.assertEqual(queue.stats["dropped"], 8 * 200 - 50)
+
+    def test_block_waits_for_the_drainer(self):
+        consumed = []
+        queue = OutcomeQueue(consumed.append, max_size=2, policy='block', interval=60, block_timeout=5)
+        for i in range(10):
+            self.assertTrue(queue.put((i,)))
+
+        queue.flush()
+        self.assertEqual(consumed, [(i,) for i in range(10)])
+        self.assertEqual(queue.stats["dropped"], 0)
+
+    def test_block_drops_after_timeout(self):
+        queue = OutcomeQueue(lambda outcome: None, max_size=1, policy='block', interval=60, block_timeout=0.05)
+        with queue._drain_lock:
+            self.assertTrue(queue.put((0,)))
+            self.assertFalse(queue.put((1,)))
+        self.assertEqual(queue.stats["dropped"], 1)
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            OutcomeQueue(lambda outcome: None, policy='spill')
+
+    def test_async_log_result_is_counted_on_flush(self):
+        session = MagicMock()
+        session.post.return_value = MagicMock(status_code=200, json=MagicMock(return_value={"errors": False}))
+
+        @elasticsearch.log_result("logs", mode="async")
+        def decorated(value):
+            if value < 0:
+                raise ValueError(value)
+            return value
+
+        with patch.object(elasticsearch.bulk_indexer, "session_factory", return_value=(session, "http://es.local/")):
+            threads = [threading.Thread(target=decorated, args=(i,)) for i in (1, -1, 2, 3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elasticsearch.flush()
+
+        lines = [json.loads(line) for line in session.post.call_args.kwargs["data"].decode("utf-8").splitlines()]
+        action, body = lines[-2:]
+        self.assertEqual(action["update"]["_id"], f"{__name__}.{decorated.__qualname__}")
+        self.assertEqual(body["script"]["params"]["passed"], 3)
+        self.assertEqual(body["script"]["params"]["failed"], 1)
+        self.assertEqual(body["script"]["params"]["exception_message"], "ValueError")
+        self.assertEqual(body["script"]["params"]["args"], '"-1" ')
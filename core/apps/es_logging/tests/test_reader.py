@@ -0,0 +1,66 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from core.apps.es_logging.app import elasticsearch
+from core.web.services.core.json import JsonObject
+
+
+class FakePitSession:
+    """Serves an index of `total` documents through the point in time and search_after APIs."""
+
+    def __init__(self, total):
+        self.docs = [{"_source": {"name": f"doc{i}", "passed": i}, "sort": [i]} for i in range(total)]
+        self.bodies = []
+        self.closed = []
+
+    def post(self, url, params=None, json=None, **kwargs):
+        if url.endswith("/_pit"):
+            return MagicMock(status_code=200, json=MagicMock(return_value={"id": "pit-0"}))
+
+        self.bodies.append(json)
+        start = json["search_after"][0] + 1 if "search_after" in json else 0
+        page = self.docs[start:start + json["size"]]
+        payload = {"pit_id": f"pit-{len(self.bodies)}", "hits": {"hits": page}}
+        return MagicMock(status_code=200, json=MagicMock(return_value=payload))
+
+    def delete(self, url, json=None, **kwargs):
+        self.closed.append(json["id"])
+
+
+class Doc(JsonObject):
+    name = ''
+    passed = 0
+
+
+class TestsElasticReader(TestCase):
+    def read(self, total, **kwargs):
+        session = FakePitSession(total)
+        with patch.object(elasticsearch, "_shared_es_session", return_value=(session, "http://es.local/")):
+            return session, list(elasticsearch.iter_index_data("logs", **kwargs))
+
+    def test_pages_until_exhausted(self):
+        session, docs = self.read(25, page_size=10, type_hook=Doc, source=["name", "passed"])
+
+        self.assertEqual([d.passed for d in docs], list(range(25)))
+        self.assertEqual(len(session.bodies), 3)
+        self.assertEqual(session.bodies[1]["search_after"], [9])
+        self.assertEqual(session.bodies[2]["pit"]["id"], "pit-2")
+        self.assertEqual(session.bodies[0]["_source"], ["name", "passed"])
+        self.assertEqual(session.closed, ["pit-3"])
+
+    def test_max_docs(self):
+        session, docs = self.read(25, page_size=10, max_docs=15)
+
+        self.assertEqual(len(docs), 15)
+        self.assertEqual([b["size"] for b in session.bodies], [10, 5])
+
+    def test_is_lazy_and_closes_point_in_time(self):
+        session = FakePitSession(100)
+        with patch.object(elasticsearch, "_shared_es_session", return_value=(session, "http://es.local/")):
+            reader = elasticsearch.iter_index_data("logs", page_size=10)
+            first = next(reader)
+            self.assertEqual(len(session.bodies), 1)
+            reader.close()
+
+        self.assertEqual(first["_source"]["name"], "doc0")
+        self.assertEqual(session.closed, ["pit-1"])
@@ -0,0 +1,39 @@
+"""Micro-benchmarks for the hot paths of harqis-core, runnable with `python -m core.benchmarks.<name>`."""
+import timeit
+
+from typing import Callable, Iterable, Tuple
+
+
+def measure(func: Callable[[], object], number: int = 100, repeat: int = 5) -> float:
+    """
+    Times a callable and returns the best average duration of one call, in seconds.
+
+    Args:
+        func: The callable to time.
+        number: The number of calls per measurement.
+        repeat: The number of measurements; the fastest is kept to reduce noise.
+
+    Returns:
+        The duration of one call in seconds.
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def report(title: str, rows: Iterable[Tuple[str, float]], baseline: str = None) -> None:
+    """
+    Prints timings as a table, with the speed-up relative to the baseline row if given.
+
+    Args:
+        title: The title of the table.
+        rows: Pairs of (label, seconds per call).
+        baseline: The label of the row to compare the others against.
+    """
+    rows = list(rows)
+    reference = dict(rows).get(baseline)
+    width = max(len(label) for label, _ in rows)
+
+    print(f"\n{title}")
+    print("-" * (width + 30))
+    for label, seconds in rows:
+        speedup = f"{reference / seconds:8.1f}x" if reference else ""
+        print(f"{label:<{width}}  {seconds * 1e6:12.2f} us  {speedup}")
@@ -0,0 +1,68 @@
+"""Compares YAML configuration loading: FullLoader with the in-place env walk vs the C loader with a compiled plan."""
+import os
+import tempfile
+
+import yaml
+
+from core.benchmarks import measure, report
+from core.config.cache import ConfigCache
+from core.config.types.yaml import ConfigFileYaml, FAST_LOADER
+
+
+def write_config(directory: str, apps: int = 300) -> str:
+    sections = {}
+    for i in range(apps):
+        sections[f"APP_{i}"] = {
+            "client": "rest",
+            "parameters": {"base_url": "https://${HARQIS_BENCH_HOST}/api/v%d" % (i % 3), "verify": False,
+                           "timeout": 30, "retry": {"total": 3, "statuses": [502, 503, 504]}},
+            "headers": {"Authorization": "Bearer ${HARQIS_BENCH_TOKEN}", "Accept": "application/json"},
+            "app_data": {"api_key": "${HARQIS_BENCH_TOKEN}", "tags": ["a", "b", "c"], "limits": list(range(10))},
+        }
+    with open(os.path.join(directory, "apps_config.yaml"), "w") as f:
+        yaml.safe_dump(sections, f)
+    return directory
+
+
+def load_legacy(path: str):
+    # the loader before the compiled plan: FullLoader and an in-place walk of dicts only
+    with open(path) as f:
+        data = yaml.load(f, Loader=yaml.FullLoader)
+
+    def replace_env_variables(config_item):
+        if isinstance(config_item, dict):
+            for key, value in config_item.items():
+                config_item[key] = replace_env_variables(value)
+        elif isinstance(config_item, str):
+            if config_item.startswith('${') and config_item.endswith('}'):
+                return os.getenv(config_item[2:-1], config_item)
+        return config_item
+
+    return replace_env_variables(data)
+
+
+def main():
+    os.environ.setdefault("HARQIS_BENCH_HOST", "example.com")
+    os.environ.setdefault("HARQIS_BENCH_TOKEN", "secret")
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_config(directory)
+        path = os.path.join(directory, "apps_config.yaml")
+        full = ConfigFileYaml(base_path=directory)
+        fast = ConfigFileYaml(base_path=directory, fast=True)
+
+        cache = ConfigCache()
+        cache.load(fast)
+        template, plan = fast.parse()
+
+        report(f"apps_config.yaml, 300 apps ({os.path.getsize(path) // 1024} KiB, {FAST_LOADER.__name__})", [
+            ("FullLoader + in-place walk", measure(lambda: load_legacy(path), 3, 3)),
+            ("FullLoader + compiled plan", measure(full.load, 3, 3)),
+            ("fast loader + compiled plan", measure(fast.load, 3, 3)),
+            ("apply plan only", measure(lambda: plan.apply(template), 100)),
+            ("cached snapshot", measure(lambda: cache.load(fast), 1000)),
+        ], baseline="FullLoader + in-place walk")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Compares create_logger() naming the logger from inspect.stack() against the frame-only lookup."""
+import inspect
+import logging
+import subprocess
+import sys
+
+from core.benchmarks import measure, report
+from core.utilities.logging import custom_logger
+from core.utilities.logging.custom_logger import create_logger
+
+# modules calling create_logger() while they are imported
+MODULES = ["core.web.services.core.json", "core.exception.error_wrapper",
+           "core.web.services.core.clients.reflection_client_base", "core.utilities.asserts.status"]
+
+IMPORT_SCRIPT = """
+import time
+from core.utilities.logging import custom_logger
+
+if {legacy}:
+    from core.benchmarks.create_logger import create_logger_legacy
+    custom_logger.create_logger = create_logger_legacy
+
+started = time.perf_counter()
+for module in {modules!r}:
+    __import__(module)
+print(time.perf_counter() - started)
+"""
+
+
+def create_logger_legacy(logger_name=None):
+    # create_logger before the frame-only lookup: inspect.stack() reads the source lines of every frame
+    if logger_name is None:
+        logger_name = inspect.stack()[1][3]
+    new_logger = logging.getLogger(logger_name)
+    new_logger.setLevel(custom_logger.rootLevel)
+    return new_logger
+
+
+def nested(depth: int, func):
+    # calls func under `depth` extra frames, as when a client is built deep inside a test runner
+    return func() if depth == 0 else nested(depth - 1, func)
+
+
+def import_time(legacy: bool) -> float:
+    script = IMPORT_SCRIPT.format(legacy=legacy, modules=MODULES)
+    # the first lines of stdout are the logging configuration banner
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def main():
+    for depth in (5, 40):
+        report(f"create_logger() called {depth} frames deep", [
+            ("inspect.stack()", measure(lambda: nested(depth, create_logger_legacy), 20)),
+            ("sys._getframe, level set once", measure(lambda: nested(depth, create_logger), 2000)),
+        ], baseline="inspect.stack()")
+
+    report(f"importing {len(MODULES)} modules that call create_logger() (fresh interpreter)", [
+        ("inspect.stack()", min(import_time(True) for _ in range(3))),
+        ("sys._getframe, level set once", min(import_time(False) for _ in range(3))),
+    ], baseline="inspect.stack()")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Compares the compiled DTO constructors of @deserialized against per-item introspection."""
+import inspect
+
+from dataclasses import dataclass, is_dataclass
+from dataclasses import fields as dc_fields
+
+from core.benchmarks import measure, report
+from core.web.services.core.decorators.deserializer import _coerce
+
+
+@dataclass
+class DtoRow:
+    id: int
+    name: str
+    passed: int = 0
+
+
+class PlainRow:
+    def __init__(self, id, name, passed=0):
+        self.id = id
+        self.name = name
+        self.passed = passed
+
+
+def construct_per_item(d, cls):
+    # the introspection done for every element before constructors were compiled
+    if is_dataclass(cls):
+        field_names = {f.name for f in dc_fields(cls)}
+        return cls(**{k: v for k, v in d.items() if k in field_names})
+    sig = inspect.signature(cls)
+    param_names = {name for name, p in sig.parameters.items()
+                   if name != "self" and p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)}
+    return cls(**{k: v for k, v in d.items() if k in param_names})
+
+
+def main():
+    payload = [{"id": i, "name": f"row {i}", "passed": i % 3, "extra": True} for i in range(10_000)]
+    exact = [{"id": i, "name": f"row {i}"} for i in range(10_000)]
+
+    for cls in (DtoRow, PlainRow):
+        report(f"{cls.__name__} (10,000 rows)", [
+            ("per-item introspection", measure(lambda: [construct_per_item(d, cls) for d in payload], 5)),
+            ("compiled constructor", measure(lambda: _coerce(payload, list[cls], force_many=None, elem=cls), 5)),
+            ("compiled, exact keys", measure(lambda: _coerce(exact, list[cls], force_many=None, elem=cls), 5)),
+        ], baseline="per-item introspection")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Compares the JSON engines and the object-to-dict walker against the jsonpickle round trip."""
+import json
+import jsonpickle
+
+from core.benchmarks import measure, report
+from core.web.services.core import json_backends
+from core.web.services.core.json import JsonObject, JsonUtility
+
+
+class DtoRow(JsonObject):
+    name = ''
+    passed = 0
+    failed = 0
+    tags = []
+
+
+def build_payload(rows: int = 1_000) -> JsonObject:
+    return JsonObject(
+        index="harqis-elastic-logging",
+        took=12,
+        rows=[DtoRow(name=f"workflows.tasks.task_{i}", passed=i, failed=i % 7, pass_fail_percent=99.5,
+                     tags=["daily", "mac-mini"], data={"args": f'"{i}"', "machine": "worker-1"})
+              for i in range(rows)]
+    )
+
+
+def main():
+    payload = build_payload()
+    raw = JsonUtility.serialize(payload)
+
+    report("Object to dict (1,000 DTO rows)", [
+        ("jsonpickle encode + json.loads", measure(lambda: json.loads(jsonpickle.encode(payload, unpicklable=False)), 10)),
+        ("JsonUtility.to_primitive", measure(lambda: JsonUtility.to_primitive(payload), 10)),
+    ], baseline="jsonpickle encode + json.loads")
+
+    dumps_rows = [("jsonpickle.encode", measure(lambda: jsonpickle.encode(payload, unpicklable=False), 10))]
+    loads_rows = []
+    for name in json_backends.available_backends():
+        engine = json_backends.get_backend(name)
+        dumps_rows.append((f"to_primitive + {name}", measure(lambda: engine.dumps(JsonUtility.to_primitive(payload)), 10)))
+        loads_rows.append((f"{name} (dict)", measure(lambda: engine.loads(raw), 10)))
+
+    report("Serialize (1,000 DTO rows)", dumps_rows, baseline="jsonpickle.encode")
+    loads_rows.append(("json (JsonObject hook)", measure(lambda: JsonUtility.deserialize(raw), 10)))
+    report("Deserialize (1,000 DTO rows)", loads_rows, baseline="json (dict)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""Compares repeated small MultiProcessingClient batches on a new spawn pool per call with a persistent pool, and
+the time to the first result of execute_tasks with the streaming iter_tasks."""
+import time
+
+from core.benchmarks import measure, report
+from core.utilities.multiprocess import MultiProcessingClient
+
+BATCHES = 10
+
+
+def square(x: int) -> int:
+    return x * x
+
+
+def uneven(seconds: float) -> float:
+    time.sleep(seconds)
+    return seconds
+
+
+def batches_new_pool():
+    client = MultiProcessingClient(list(range(8)), worker_count=2)
+    for _ in range(BATCHES):
+        client.execute_tasks(square)
+
+
+def batches_persistent(client: MultiProcessingClient):
+    for _ in range(BATCHES):
+        client.execute_tasks(square)
+
+
+def first_result(client: MultiProcessingClient, stream: bool) -> float:
+    tasks = [0.01] + [0.3] * 3
+    started = time.perf_counter()
+    if stream:
+        for _ in client.iter_tasks(uneven, tasks, chunksize=1):
+            break
+    else:
+        client.execute_tasks(uneven, tasks=tasks, chunksize=1)
+    return time.perf_counter() - started
+
+
+def main():
+    with MultiProcessingClient(list(range(8)), worker_count=2, persistent=True) as client:
+        client.execute_tasks(square)
+        report(f"{BATCHES} batches of 8 tasks on 2 workers", [
+            ("new spawn pool per call", measure(batches_new_pool, 1, 3)),
+            ("persistent pool", measure(lambda: batches_persistent(client), 1, 3)),
+        ], baseline="new spawn pool per call")
+
+    with MultiProcessingClient([], worker_count=4, persistent=True) as client:
+        client.execute_tasks(square, tasks=range(4))
+        report("time to the first result, one fast task and three slow ones", [
+            ("execute_tasks", min(first_result(client, False) for _ in range(3))),
+            ("iter_tasks", min(first_result(client, True) for _ in range(3))),
+        ], baseline="execute_tasks")
+
+
+if __name__ == "__main__":
+    main()
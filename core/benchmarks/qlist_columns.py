@@ -0,0 +1,60 @@
+"""Compares aggregations over QList records with Python loops against the columnar QList.to_columns view, with
+plain lists and, when installed, NumPy arrays."""
+import random
+import statistics
+
+from core.apps.es_logging.models.document import DtoFunctionLogger
+from core.benchmarks import measure, report
+from core.utilities.data import columns
+from core.utilities.data.qlist import QList
+
+
+def function_records(size: int) -> QList:
+    rng = random.Random(7)
+    return QList(DtoFunctionLogger(name=f"fn_{i % 200}", passed=rng.randint(0, 500), failed=rng.randint(0, 50))
+                 for i in range(size))
+
+
+def loops(records: QList):
+    # what the analytics jobs do today: one pass of attribute access per aggregate
+    passed = sum(r.passed for r in records)
+    failed = sum(r.failed for r in records) / len(records)
+    p95 = statistics.quantiles((r.passed for r in records), n=100, method='inclusive')[94]
+    per_function = {}
+    for r in records:
+        totals = per_function.setdefault(r.name, {'passed': 0, 'failed': 0})
+        totals['passed'] += r.passed
+        totals['failed'] += r.failed
+    return passed, failed, p95, per_function
+
+
+def columnar(records: QList, use_numpy: bool):
+    table = records.to_columns(['name', 'passed', 'failed'], use_numpy=use_numpy)
+    return (table.sum('passed'), table.average('failed'), table.percentile('passed', 95),
+            table.group_by_aggregate('name', {'passed': 'sum', 'failed': 'sum'}))
+
+
+def main():
+    records = function_records(300_000)
+    expected = loops(records)
+    assert columnar(records, False) == expected
+
+    rows = [
+        ("python loops", measure(lambda: loops(records), 1, 3)),
+        ("to_columns, lists", measure(lambda: columnar(records, False), 1, 3)),
+    ]
+    if columns.numpy is not None:
+        assert columnar(records, True) == expected
+        rows.append(("to_columns, numpy", measure(lambda: columnar(records, True), 1, 3)))
+        table = records.to_columns(['name', 'passed', 'failed'], use_numpy=True)
+        rows.append(("aggregates only, numpy", measure(
+            lambda: (table.sum('passed'), table.average('failed'), table.percentile('passed', 95),
+                     table.group_by_aggregate('name', {'passed': 'sum', 'failed': 'sum'})), 5, 3)))
+    else:
+        print("NumPy is not installed: only the list-based columns are measured")
+    report(f"sum, average, p95 and per-function totals of {len(records):,} records", rows,
+           baseline="python loops")
+
+
+if __name__ == "__main__":
+    main()
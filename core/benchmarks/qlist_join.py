@@ -0,0 +1,51 @@
+"""Compares correlating two result sets with nested where calls, which is O(n*m), with the hash-based QList joins,
+lookups and set operators."""
+from core.benchmarks import measure, report
+from core.utilities.data.qlist import QList
+
+
+def result_sets(size: int):
+    docs = QList({"id": i, "function": f"fn_{i % (size // 4)}", "passed": i % 7 != 0} for i in range(size))
+    rows = QList({"function": f"fn_{i}", "owner": f"team_{i % 13}"} for i in range(0, size // 4, 2))
+    return docs, rows
+
+
+def nested(docs: QList, rows: QList) -> QList:
+    # the pattern used before: one scan of rows per document
+    return docs.select(lambda d: (d, rows.where(lambda r: r["function"] == d["function"]))) \
+        .select_many(lambda pair: [(pair[0]["id"], r["owner"]) for r in pair[1]])
+
+
+def joined(docs: QList, rows: QList) -> QList:
+    return docs.join(rows, lambda d: d["function"], lambda r: r["function"], lambda d, r: (d["id"], r["owner"]))
+
+
+def main():
+    docs, rows = result_sets(2_000)
+    assert nested(docs, rows) == joined(docs, rows)
+    report(f"join {len(docs):,} documents with {len(rows):,} rows", [
+        ("nested where", measure(lambda: nested(docs, rows), 1, 3)),
+        ("join", measure(lambda: joined(docs, rows), 20)),
+    ], baseline="nested where")
+
+    for size in (100_000, 1_000_000):
+        docs, rows = result_sets(size)
+        functions = docs.select(lambda d: d["function"])
+        owned = rows.select(lambda r: r["function"])
+        report(f"hash-based operators, {len(docs):,} documents and {len(rows):,} rows", [
+            ("join", measure(lambda: joined(docs, rows), 1, 3)),
+            ("left_join", measure(lambda: docs.left_join(rows, lambda d: d["function"], lambda r: r["function"]),
+                                  1, 3)),
+            ("group_join", measure(lambda: docs.group_join(rows, lambda d: d["function"], lambda r: r["function"]),
+                                   1, 3)),
+            ("to_lookup", measure(lambda: docs.to_lookup(lambda d: d["function"]), 1, 3)),
+            ("group_by", measure(lambda: docs.group_by(lambda d: d["passed"]), 1, 3)),
+            ("to_dict", measure(lambda: docs.to_dict(lambda d: d["id"]), 1, 3)),
+            ("union", measure(lambda: functions.union(owned), 1, 3)),
+            ("intersect", measure(lambda: functions.intersect(owned), 1, 3)),
+            ("except_", measure(lambda: functions.except_(owned), 1, 3)),
+        ])
+
+
+if __name__ == "__main__":
+    main()
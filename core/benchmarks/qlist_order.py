@@ -0,0 +1,47 @@
+"""Compares sorting a whole QList and slicing it with the heap-based top_k/bottom_k, and times multi-key ordering,
+on DtoFunctionLogger records."""
+import random
+
+from core.apps.es_logging.models.document import DtoFunctionLogger
+from core.benchmarks import measure, report
+from core.utilities.data.qlist import QList
+
+
+def function_records(size: int) -> QList:
+    rng = random.Random(7)
+    return QList(DtoFunctionLogger(name=f"workflows.module_{i % 40}.fn_{i}", passed=rng.randint(0, 500),
+                                   failed=rng.randint(0, 500)) for i in range(size))
+
+
+def sort_per_key(records: QList) -> list:
+    # a stable sort per key, the last key first: what order_by/then_by would do without tracking ties
+    items = list(records)
+    items.sort(key=lambda r: r.name)
+    items.sort(key=lambda r: r.passed)
+    items.sort(key=lambda r: r.failed, reverse=True)
+    return items
+
+
+def main():
+    for size in (10_000, 1_000_000):
+        records = function_records(size)
+        number = 20 if size <= 10_000 else 1
+        report(f"the 20 most failing of {size:,} functions", [
+            ("sorted + slice", measure(lambda: sorted(records, key=lambda r: r.failed, reverse=True)[:20],
+                                       number, 3)),
+            ("order_by + take", measure(lambda: records.order_by(lambda r: r.failed, descending=True).take(20),
+                                        number, 3)),
+            ("top_k", measure(lambda: records.top_k(20, key=lambda r: r.failed), number, 3)),
+        ], baseline="sorted + slice")
+
+        report(f"order {size:,} functions by failed desc, then passed, then name", [
+            ("sorted by tuple key", measure(lambda: sorted(records, key=lambda r: (-r.failed, r.passed, r.name)),
+                                            number, 3)),
+            ("one stable sort per key", measure(lambda: sort_per_key(records), number, 3)),
+            ("order_by + then_by", measure(lambda: records.order_by(lambda r: r.failed, descending=True)
+                                           .then_by(lambda r: r.passed).then_by(lambda r: r.name), number, 3)),
+        ], baseline="sorted by tuple key")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Compares serial QList.select with select_parallel on threads (I/O-bound selector) and processes (CPU-bound
+selector), and the effect of chunking on process dispatch. Processes only pay off with several CPUs."""
+import os
+import re
+import time
+
+from core.benchmarks import measure, report
+from core.utilities.data.qlist import QList
+
+LOG_LINE = re.compile(r"(?P<date>\d{4}-\d{2}-\d{2}) (?P<time>[\d:,]+) - (?P<pid>\d+) - (?P<thread>\w+) - "
+                      r"(?P<level>\w+) - (?P<name>[\w.]+) - (?P<message>.*)")
+
+
+def enrich(row: int) -> int:
+    # stands for an HTTP call: waits without holding the GIL
+    time.sleep(0.002)
+    return row
+
+
+def parse(line: str) -> dict:
+    # CPU-bound: regex parsing and some string work per line
+    fields = LOG_LINE.match(line).groupdict()
+    fields["words"] = len(fields["message"].split())
+    fields["checksum"] = sum(map(ord, fields["message"])) % 997
+    return fields
+
+
+def main():
+    print(f"CPUs: {os.cpu_count()}")
+    rows = QList(range(400))
+    report(f"I/O-bound selector over {len(rows)} elements (2 ms each)", [
+        ("select", measure(lambda: rows.select(enrich), 1, 1)),
+        ("select_parallel, threads", measure(lambda: rows.select_parallel(enrich), 1, 3)),
+        ("select_parallel, threads, unordered", measure(lambda: rows.select_parallel(enrich, ordered=False), 1, 3)),
+    ], baseline="select")
+
+    lines = QList(f"2026-10-18 00:49:25,{i % 1000:03d} - {1000 + i % 50} - MainThread - INFO - module_{i % 30} - "
+                  f"request {i} finished with status {200 + i % 5} after {i % 977} ms" for i in range(200_000))
+    report(f"CPU-bound selector over {len(lines):,} log lines (pool kept between calls)", [
+        ("select", measure(lambda: lines.select(parse), 1, 3)),
+        ("select_parallel, processes", measure(lambda: lines.select_parallel(parse, executor='process'), 1, 3)),
+        ("select_parallel, processes, chunks of 100", measure(
+            lambda: lines.select_parallel(parse, executor='process', chunk_size=100), 1, 3)),
+    ], baseline="select")
+
+
+if __name__ == "__main__":
+    main()
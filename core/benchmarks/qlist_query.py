@@ -0,0 +1,38 @@
+"""Compares eager QList chains, which build a list per operator, with the lazy QList.query() pipeline."""
+from core.benchmarks import measure, report
+from core.utilities.data.qlist import QList
+
+ROWS = QList({"id": i, "function": f"fn_{i % 500}", "passed": i % 7 != 0, "duration": (i * 37) % 1000}
+             for i in range(200_000))
+
+
+def main():
+    # only one element is needed: eager evaluates every intermediate list, lazy stops at the first match
+    report("where + select + first (match near the start)", [
+        ("eager", measure(lambda: ROWS.where(lambda r: not r["passed"]).select(lambda r: r["id"]).first(), 5)),
+        ("query()", measure(lambda: ROWS.query().where(lambda r: not r["passed"]).select(lambda r: r["id"]).first(),
+                            500)),
+    ], baseline="eager")
+
+    report("where + any", [
+        ("eager", measure(lambda: ROWS.where(lambda r: r["duration"] > 900).any(lambda r: r["id"] > 100), 5)),
+        ("query()", measure(lambda: ROWS.query().where(lambda r: r["duration"] > 900).any(lambda r: r["id"] > 100),
+                            500)),
+    ], baseline="eager")
+
+    report("where + select + take(20)", [
+        ("eager", measure(lambda: ROWS.where(lambda r: r["passed"]).select(lambda r: r["function"])[:20], 5)),
+        ("query()", measure(lambda: ROWS.query().where(lambda r: r["passed"]).select(lambda r: r["function"])
+                            .take(20).to_list(), 500)),
+    ], baseline="eager")
+
+    # every element is needed: the lazy pipeline saves the intermediate lists only
+    report("where + select + distinct, fully materialized", [
+        ("eager", measure(lambda: ROWS.where(lambda r: r["passed"]).select(lambda r: r["function"]).distinct(), 5)),
+        ("query()", measure(lambda: ROWS.query().where(lambda r: r["passed"]).select(lambda r: r["function"])
+                            .distinct().to_list(), 5)),
+    ], baseline="eager")
+
+
+if __name__ == "__main__":
+    main()
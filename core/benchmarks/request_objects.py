@@ -0,0 +1,62 @@
+"""Measures how many request/response objects per second the web service path creates, before and after
+class-level loggers and __slots__."""
+import logging
+import sys
+import tracemalloc
+
+from core.benchmarks import measure, report
+from core.utilities.logging import custom_logger
+from core.web.services.core.request_builder.rest import RequestBuilderRest
+from core.web.services.core.response import Response
+
+BODY = b'{"id": 1, "name": "row"}'
+
+
+def per_object_logger(name: str) -> logging.Logger:
+    # what every constructor did before: fetch the logger and set its level, which clears the logging caches
+    new_logger = logging.getLogger(name)
+    new_logger.setLevel(custom_logger.rootLevel)
+    return new_logger
+
+
+def build_before():
+    # three loggers per round trip (builder, request, response) plus the per-instance __dict__ of each object
+    per_object_logger("RequestBuilderRest")
+    builder = RequestBuilderRest()
+    per_object_logger("Request")
+    request = builder.get().set_base_uri("items").add_query_string("page", 1).build()
+    per_object_logger("Response")
+    return request, Response(dict, data=BODY)
+
+
+def build_after():
+    builder = RequestBuilderRest()
+    request = builder.get().set_base_uri("items").add_query_string("page", 1).build()
+    return request, Response(dict, data=BODY)
+
+
+def peak_memory(func, count: int = 10_000) -> int:
+    tracemalloc.start()
+    kept = [func() for _ in range(count)]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return peak
+
+
+def main():
+    before = measure(build_before, 2000)
+    after = measure(build_after, 2000)
+    report("builder + request + response", [
+        ("per-object loggers", before),
+        ("class loggers, __slots__", after),
+    ], baseline="per-object loggers")
+    print(f"\nround trips per second: {1 / before:,.0f} -> {1 / after:,.0f}")
+
+    response = Response(dict, data=BODY)
+    print(f"Response object size: {sys.getsizeof(response)} bytes, __dict__: {hasattr(response, '__dict__')}")
+    print(f"peak memory of 10,000 request/response pairs: {peak_memory(build_after) / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Compares streaming array deserialization against parsing the whole body, in time and peak memory."""
+import json
+import tracemalloc
+
+from core.benchmarks import measure, report
+from core.web.services.core.stream import iter_json_array
+
+
+def build_body(rows: int = 100_000) -> bytes:
+    items = [{"id": i, "name": f"row {i}", "tags": ["a", "b"], "score": i / 3} for i in range(rows)]
+    return json.dumps({"data": {"total": rows, "items": items}}).encode("utf-8")
+
+
+def chunks(body: bytes, size: int = 64 * 1024):
+    return (body[i:i + size] for i in range(0, len(body), size))
+
+
+def full_parse(body: bytes) -> int:
+    return sum(item["id"] for item in json.loads(b"".join(chunks(body)))["data"]["items"])
+
+
+def streamed(body: bytes) -> int:
+    return sum(item["id"] for item in iter_json_array(chunks(body), "data.items"))
+
+
+def peak_memory(func, body: bytes) -> int:
+    tracemalloc.start()
+    func(body)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    body = build_body()
+    report(f"Sum ids of 100,000 rows ({len(body) / 1e6:.1f} MB)", [
+        ("json.loads whole body", measure(lambda: full_parse(body), 1, 3)),
+        ("iter_json_array", measure(lambda: streamed(body), 1, 3)),
+    ], baseline="json.loads whole body")
+
+    print("\nPeak memory allocated while parsing")
+    for label, func in (("json.loads whole body", full_parse), ("iter_json_array", streamed)):
+        print(f"{label:<24}{peak_memory(func, body) / 1e6:10.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ from enum import Enum
 from dataclasses import dataclass, field
 
 # Importing configuration loader and custom logger services
+from core.config.cache import thaw
 from core.config.loader import ConfigLoaderService
 from core.utilities.logging.custom_logger import create_logger
 
@@ -67,7 +68,8 @@ class AppConfig(Generic[TCfg]):
         self.kwargs = kwargs
 
         try:
-            self.app_config = ConfigLoaderService(**kwargs).config[app.value]
+            # a mutable copy of the cached section, so the configuration instance may be changed
+            self.app_config = thaw(ConfigLoaderService(**kwargs).config[app.value])
             self._config = type_hook_config(**self.app_config)  # Instantiate configuration class with loaded settings
         except KeyError as e:
             self.log.error(f"Cannot find application key for {app}: {str(e)}")
@@ -1,7 +1,12 @@
-from typing import TypeVar, Type, Any, Optional, Generic, Dict
+import functools
+import importlib
+import threading
+
+from typing import TypeVar, Type, Any, Optional, Generic, Dict, Tuple
 from enum import Enum
 
 # Importing configuration loader and custom logger services
+from core.config.cache import thaw
 from core.config.loader import ConfigLoaderService
 from pathlib import Path
 from dataclasses import is_dataclass
@@ -23,6 +28,11 @@ unrestricted in type to allow flexibility in configuration structure.
 """
 
 
+@functools.lru_cache(maxsize=None)
+def _import_class(module: str, name: str) -> Type[Any]:
+    return getattr(importlib.import_module(module), name)
+
+
 class AppConfigManager:
     """
     Loads and retrieves application configuration sections.
@@ -30,12 +40,38 @@ class AppConfigManager:
     - `load(app_id, from_path=None)` loads config from service (or YAML path if provided),
       then keeps only sections whose inner dict has app_id==<app_id> OR application_name==<app_id>.
     - `get(loader_class, config_id)` returns a typed instance of the section (or raw dict).
+
+    Sections are indexed by app id once per loaded configuration, and typed instances are built on first
+    `get` and then shared per (section, loader class) until the configuration is reloaded or `invalidate()`
+    is called.
     """
 
     def __init__(self, service: ConfigLoaderService):
         self.service = service
         # Holds the filtered, current app's sections: {"ELASTIC_LOGGING": {...}, ...}
         self._current_app_configs: Dict[str, Dict[str, Any]] = service.config
+        self._lock = threading.Lock()
+        # the configuration the index was built from; a reload returns a new object
+        self._indexed_source: Any = None
+        self._index: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._instances: Dict[Tuple[str, Type[Any]], Any] = {}
+
+    def invalidate(self, config_id: Optional[str] = None) -> None:
+        """
+        Forgets the typed instances built by `get`, and the app id index unless a section is given.
+        Called by `load` whenever the configuration was reloaded.
+
+        Args:
+            config_id: Only forget the instances of this section.
+        """
+        with self._lock:
+            if config_id is None:
+                self._instances.clear()
+                self._indexed_source = None
+                self._index = {}
+            else:
+                for key in [key for key in self._instances if key[0] == config_id]:
+                    del self._instances[key]
 
     def _normalize_source(self, source: Any) -> Dict[str, Dict[str, Any]]:
         """
@@ -46,16 +82,16 @@ class AppConfigManager:
         # Keep only dict-like sections
         return {k: v for k, v in source.items() if isinstance(v, dict)}
 
-    def _filter_by_app_id(self, source: Dict[str, Dict[str, Any]], app_id: str) -> Dict[str, Dict[str, Any]]:
+    def _build_index(self, source: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Dict[str, Any]]]:
         """
-        Keep sections whose inner dict declares app ownership via 'app_id' or 'application_name'.
+        Group the sections by the app they declare, in one pass.
         """
-        filtered: Dict[str, Dict[str, Any]] = {}
+        index: Dict[str, Dict[str, Dict[str, Any]]] = {}
         for section_key, section_val in source.items():
             section_app = section_val.get("app_id") or section_val.get("application_name")
-            if section_app == app_id:
-                filtered[section_key] = section_val
-        return filtered
+            if section_app:
+                index.setdefault(section_app, {})[section_key] = section_val
+        return index
 
     def _infer_loader_class(self, raw: Dict[str, Any]) -> Optional[Type[Any]]:
         """
@@ -65,12 +101,10 @@ class AppConfigManager:
         """
         # Example 1: if the section has a "client" key, treat it as a WS client config
         if "client" in raw:
-            from core.web.services.core.config.webservice import AppConfigWSClient  # adjust import
-            return AppConfigWSClient
+            return _import_class("core.web.services.core.config.webservice", "AppConfigWSClient")
 
         if "browser" in raw:
-            from core.web.browser.core.config.web_driver import  AppConfigWebDriver  # adjust import
-            return AppConfigWebDriver
+            return _import_class("core.web.browser.core.config.web_driver", "AppConfigWebDriver")
 
         # No special type detected → return None, meaning "just give dict"
         return None
@@ -96,10 +130,18 @@ class AppConfigManager:
                     "either add it or pre-populate 'service.config' before calling load(...)."
                 )
 
-        source = self._normalize_source(self.service.config)
-        filtered = self._filter_by_app_id(source, app_id)
+        config = self.service.config
+        if config is not self._indexed_source:
+            # first load, or the configuration was reloaded: drop the instances built from the previous one
+            index = self._build_index(self._normalize_source(config))
+            self.invalidate()
+            with self._lock:
+                self._index = index
+                self._indexed_source = config
+        filtered = self._index.get(app_id, {})
 
         if not filtered:
+            source = self._normalize_source(config)
             # Helpful error that also lists available declared app ids
             declared = []
             for sec, val in source.items():
@@ -127,6 +169,9 @@ class AppConfigManager:
             * try to infer a config class from the raw dict (e.g. based on 'client' key)
             * if a class is inferred, construct it
             * otherwise, return the raw dict.
+
+        Typed instances are built from a mutable copy of the section on first use and shared by later calls
+        until the configuration is reloaded or `invalidate()` is called.
         """
         if config_id not in self._current_app_configs:
             available = ", ".join(self._current_app_configs.keys()) or "(none loaded)"
@@ -146,6 +191,15 @@ class AppConfigManager:
         if loader_class is dict:  # type: ignore[comparison-overlap]
             return raw  # type: ignore[return-value]
 
+        key = (config_id, loader_class)
+        instance = self._instances.get(key)
+        if instance is None:
+            instance = self._construct(config_id, loader_class, thaw(raw))
+            with self._lock:
+                instance = self._instances.setdefault(key, instance)
+        return instance
+
+    def _construct(self, config_id: str, loader_class: Type[TAppConfig], raw: Dict[str, Any]) -> TAppConfig:
         # 3) If it's a dataclass, instantiate via **kwargs
         if is_dataclass(loader_class):
             return loader_class(**raw)  # type: ignore[misc,return-value]
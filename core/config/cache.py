@@ -0,0 +1,211 @@
+"""
+Process-wide cache of parsed configuration files.
+
+A configuration file is parsed once per process and served as an immutable snapshot until the file changes.
+An entry is reused while the resolved path, modification time and size of the file are unchanged and the
+environment variables substituted into it keep their values; with `verify_hash` the content hash is compared too,
+which catches edits that keep the size within the timestamp resolution of the file system.
+
+For loaders that parse and substitute separately (ConfigFileYaml), the parsed template and its substitution plan
+are kept too, so a change of environment only re-applies the plan instead of parsing the file again.
+"""
+import hashlib
+import os
+import threading
+
+from pathlib import Path
+from typing import Any, Dict, Hashable, Optional
+
+from core.config.interpolation import SubstitutionPlan
+from core.utilities.contracts.file import IFileLoader
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"'{self.__class__.__name__}' is a read-only configuration snapshot; use thaw() for a copy")
+
+
+class FrozenDict(dict):
+    """
+    A read-only dict. Still an instance of dict, so it can be unpacked, serialized and type checked as one.
+    """
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({dict.__repr__(self)})"
+
+
+class FrozenList(list):
+    """
+    A read-only list. Still an instance of list, so it can be serialized and type checked as one.
+    """
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list.__repr__(self)})"
+
+
+def freeze(value: Any) -> Any:
+    """
+    Returns a read-only deep copy of parsed configuration data.
+
+    Args:
+        value: Dicts, lists and scalars, as loaded from a configuration file.
+
+    Returns:
+        The same data with every dict and list replaced by a FrozenDict or a FrozenList.
+    """
+    if isinstance(value, dict):
+        return value if type(value) is FrozenDict else FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return value if type(value) is FrozenList else FrozenList(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """
+    Returns a mutable deep copy of a configuration snapshot.
+
+    Args:
+        value: The snapshot, or any part of it.
+
+    Returns:
+        The same data with plain dicts and lists.
+    """
+    if isinstance(value, dict):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [thaw(v) for v in value]
+    return value
+
+
+class ConfigCacheEntry:
+    __slots__ = ("data", "mtime_ns", "size", "digest", "environment", "template", "plan")
+
+    def __init__(self, data: Any, mtime_ns: int, size: int, digest: str, environment: Dict[str, Optional[str]],
+                 template: Any = None, plan: Optional[SubstitutionPlan] = None):
+        self.data = data
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.digest = digest
+        # values of the environment variables substituted into the data
+        self.environment = environment
+        # the parsed data before substitution, and where its placeholders are
+        self.template = template
+        self.plan = plan
+
+
+class ConfigCache:
+    """
+    Thread-safe cache of parsed configuration files keyed by file loader settings and resolved path.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, ConfigCacheEntry] = {}
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self.resubstitutions = 0
+
+    @staticmethod
+    def _digest(path: Path) -> str:
+        with open(path, 'rb') as f:
+            return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _file_unchanged(entry: ConfigCacheEntry, stat: os.stat_result, path: Path, verify_hash: bool) -> bool:
+        if entry.mtime_ns != stat.st_mtime_ns or entry.size != stat.st_size:
+            return False
+        return not verify_hash or entry.digest == ConfigCache._digest(path)
+
+    @staticmethod
+    def _environment_unchanged(entry: ConfigCacheEntry) -> bool:
+        return all(os.environ.get(name) == value for name, value in entry.environment.items())
+
+    def load(self, loader: IFileLoader, verify_hash: bool = False) -> Any:
+        """
+        Returns the parsed content of the file of a loader, parsing it only if it changed since the last call.
+
+        Args:
+            loader: The file loader. Its cache_key identifies the entry and its env_used, if any, lists the
+                    environment variables substituted by the last load(). Loaders with parse() and substitute()
+                    have their template kept, so environment changes do not parse the file again.
+            verify_hash: Whether to also compare the content hash of the file on every call.
+
+        Returns:
+            A read-only snapshot of the content, shared by every caller until the file or environment changes.
+        """
+        key = loader.cache_key
+        path = Path(loader.full_path_to_file)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            # let the loader report the missing file
+            return loader.load()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._file_unchanged(entry, stat, path, verify_hash):
+                if self._environment_unchanged(entry):
+                    self.hits += 1
+                    return entry.data
+                if entry.plan is not None:
+                    self.resubstitutions += 1
+                    entry.data = freeze(loader.substitute(entry.template, entry.plan))
+                    entry.environment = dict(loader.env_used)
+                    return entry.data
+
+            if entry is None:
+                self.misses += 1
+            else:
+                self.reloads += 1
+
+            digest = self._digest(path)
+            template = plan = None
+            if hasattr(loader, 'parse') and hasattr(loader, 'substitute'):
+                template, plan = loader.parse()
+                template = freeze(template)
+                if plan:
+                    data = freeze(loader.substitute(template, plan))
+                    environment = dict(loader.env_used)
+                else:
+                    data, plan, environment = template, None, {}
+            else:
+                data = freeze(loader.load())
+                environment = dict(getattr(loader, 'env_used', None) or {})
+            self._entries[key] = ConfigCacheEntry(data, stat.st_mtime_ns, stat.st_size, digest, environment,
+                                                  template, plan)
+            return data
+
+    def clear(self):
+        """
+        Removes every entry, so the next load of each file parses it again.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the number of hits, first loads (misses), reloads of changed files, re-applied substitutions
+        after an environment change and cached files.
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "reloads": self.reloads,
+                    "resubstitutions": self.resubstitutions, "entries": len(self._entries)}
+
+
+config_cache = ConfigCache()
+"""The cache shared by every ConfigLoaderService of the process."""
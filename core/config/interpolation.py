@@ -0,0 +1,143 @@
+"""
+Compiled ${VAR} substitution for parsed configuration data.
+
+The parsed data is walked once to compile a SubstitutionPlan listing where placeholders occur. Applying the plan
+only visits those places and copies the containers on their path, leaving the parsed template untouched, so the
+same template can be re-applied cheaply whenever the environment changes.
+"""
+import os
+import re
+
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple, Union
+
+PLACEHOLDER = re.compile(r'\$\{([^}]+)\}')
+
+# a compiled string: literal text and variable names, e.g. ['http://', ('HOST',), ':8080']
+_Part = Union[str, Tuple[str]]
+
+
+class Substitution:
+    """
+    A string containing placeholders, at a path of keys and indexes in the parsed data.
+    """
+    __slots__ = ("path", "parts", "template")
+
+    def __init__(self, path: Tuple[Any, ...], template: str):
+        self.path = path
+        self.template = template
+        self.parts: List[_Part] = []
+        position = 0
+        for match in PLACEHOLDER.finditer(template):
+            if match.start() > position:
+                self.parts.append(template[position:match.start()])
+            self.parts.append((match.group(1),))
+            position = match.end()
+        if position < len(template):
+            self.parts.append(template[position:])
+
+    def render(self, environ: Mapping[str, str]) -> str:
+        """
+        Replaces every placeholder with the value of its variable; unknown variables are left as they are.
+
+        Args:
+            environ: The environment variables.
+
+        Returns:
+            The substituted string.
+        """
+        rendered = []
+        for part in self.parts:
+            if isinstance(part, tuple):
+                value = environ.get(part[0])
+                rendered.append("${" + part[0] + "}" if value is None else value)
+            else:
+                rendered.append(part)
+        return "".join(rendered)
+
+
+class SubstitutionPlan:
+    """
+    Where placeholders occur in parsed configuration data, in dicts, lists and embedded inside strings.
+    """
+    __slots__ = ("substitutions", "names")
+
+    def __init__(self, substitutions: List[Substitution]):
+        self.substitutions = substitutions
+        self.names: FrozenSet[str] = frozenset(part[0] for s in substitutions for part in s.parts
+                                               if isinstance(part, tuple))
+
+    @classmethod
+    def compile(cls, data: Any) -> "SubstitutionPlan":
+        """
+        Walks parsed data once and records every string containing a placeholder.
+
+        Args:
+            data: Dicts, lists and scalars, as parsed from a configuration file.
+
+        Returns:
+            The plan.
+        """
+        substitutions = []
+        stack: List[Tuple[Tuple[Any, ...], Any]] = [((), data)]
+        while stack:
+            path, item = stack.pop()
+            if isinstance(item, dict):
+                stack.extend((path + (key,), value) for key, value in item.items())
+            elif isinstance(item, list):
+                stack.extend((path + (index,), value) for index, value in enumerate(item))
+            elif isinstance(item, str) and "${" in item and PLACEHOLDER.search(item):
+                substitutions.append(Substitution(path, item))
+        return cls(substitutions)
+
+    def __bool__(self):
+        return bool(self.substitutions)
+
+    def environment(self, environ: Optional[Mapping[str, str]] = None) -> Dict[str, Optional[str]]:
+        """
+        Returns the current values of the variables used by the plan.
+
+        Args:
+            environ: The environment variables. Defaults to os.environ.
+        """
+        environ = os.environ if environ is None else environ
+        return {name: environ.get(name) for name in self.names}
+
+    def apply(self, data: Any, environ: Optional[Mapping[str, str]] = None) -> Any:
+        """
+        Returns the data with every placeholder substituted, without changing the data given.
+
+        Only the containers on the path of a placeholder are copied; the others are shared with the input.
+
+        Args:
+            data: The data the plan was compiled from.
+            environ: The environment variables. Defaults to os.environ.
+
+        Returns:
+            The substituted data.
+        """
+        if not self.substitutions:
+            return data
+        environ = os.environ if environ is None else environ
+        if not isinstance(data, (dict, list)):
+            return self.substitutions[0].render(environ)
+
+        # containers already copied, by the id of the original
+        copies: Dict[int, Any] = {}
+
+        def copy_of(container):
+            copied = copies.get(id(container))
+            if copied is None:
+                copied = copies[id(container)] = dict(container) if isinstance(container, dict) else list(container)
+                copies[id(copied)] = copied
+            return copied
+
+        root = copy_of(data)
+        for substitution in self.substitutions:
+            *parents, leaf = substitution.path
+            container = root
+            for key in parents:
+                child = copy_of(container[key])
+                container[key] = child
+                container = child
+            container[leaf] = substitution.render(environ)
+        return root
@@ -1,6 +1,7 @@
 from typing import TypeVar, Type, Generic
 from enum import Enum
 
+from core.config.cache import config_cache
 from core.config.types.json import ConfigFileJson
 from core.config.types.yaml import ConfigFileYaml
 
@@ -20,13 +21,20 @@ class ConfigLoaderService(Generic[TConfig]):
     """
     Class to load a configuration from a target file with support for dynamic path detection.
 
+    Parsed files are kept in the process-wide config_cache and served as read-only snapshots
+    (FrozenDict/FrozenList) until the file or a substituted environment variable changes;
+    use core.config.cache.thaw for a mutable copy.
+
     Attributes:
         _config (Type[IFileLoader]): The file loader to use for loading the configuration.
+        cache (bool): Whether to use the configuration cache.
+        verify_hash (bool): Whether the cache also compares the content hash of the file on every access.
 
     Methods:
         config: Loads the configuration using the specified loader.
     """
-    def __init__(self, source: ConfigSource = ConfigSource.YAML, **kwargs):
+    def __init__(self, source: ConfigSource = ConfigSource.YAML, cache: bool = True, verify_hash: bool = False,
+                 **kwargs):
         """
         Initializes the ConfigLoader.
 
@@ -34,8 +42,13 @@ class ConfigLoaderService(Generic[TConfig]):
             source (Type[IFileLoader]): The class of the file loader to use for loading the configuration.
             file_name (str): The name of the configuration file to load.
             base_path (str): The base path to start searching for the configuration file.
+            cache (bool): Whether to use the configuration cache. Without it every access parses the file
+                and returns mutable data.
+            verify_hash (bool): Whether the cache also compares the content hash of the file on every access.
         """
         self._config = source.value(**kwargs)
+        self.cache = cache
+        self.verify_hash = verify_hash
 
     @property
     def config(self) -> TConfig:
@@ -45,6 +58,8 @@ class ConfigLoaderService(Generic[TConfig]):
         Returns:
             The loaded configuration.
         """
+        if not self.cache:
+            return self._config.load()
 
-        return self._config.load()
+        return config_cache.load(self._config, verify_hash=self.verify_hash)
 
@@ -0,0 +1,94 @@
+import copy
+import os
+import pickle
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from core.config.cache import ConfigCache, FrozenDict, FrozenList, config_cache, freeze, thaw
+from core.config.loader import ConfigLoaderService, ConfigSource
+from core.config.types.yaml import ConfigFileYaml
+
+
+class UnitTestsConfigCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'cached.yaml')
+        self.write("APP:\n  url: ${HARQIS_TEST_CACHE_URL}\n  items: [1, 2]\n")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, content: str, mtime_ns: int = None):
+        with open(self.path, 'w') as f:
+            f.write(content)
+        if mtime_ns is not None:
+            os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_snapshot_is_shared_until_the_file_changes(self):
+        cache = ConfigCache()
+        loader = ConfigFileYaml(file_name='cached.yaml', base_path=self.directory.name)
+
+        first = cache.load(loader)
+        self.assertIs(cache.load(loader), first)
+        self.assertEqual(cache.stats, {"hits": 1, "misses": 1, "reloads": 0, "resubstitutions": 0, "entries": 1})
+
+        self.write("APP:\n  url: changed\n", mtime_ns=os.stat(self.path).st_mtime_ns + 10 ** 9)
+        self.assertEqual(cache.load(loader)["APP"]["url"], "changed")
+        self.assertEqual(cache.stats["reloads"], 1)
+
+    def test_verify_hash_catches_same_size_edits(self):
+        cache = ConfigCache()
+        loader = ConfigFileYaml(file_name='cached.yaml', base_path=self.directory.name)
+        self.write("APP:\n  url: aaaa\n", mtime_ns=10 ** 18)
+        cache.load(loader)
+
+        self.write("APP:\n  url: bbbb\n", mtime_ns=10 ** 18)
+        self.assertEqual(cache.load(loader)["APP"]["url"], "aaaa")
+        self.assertEqual(cache.load(loader, verify_hash=True)["APP"]["url"], "bbbb")
+
+    def test_environment_change_substitutes_again(self):
+        cache = ConfigCache()
+        loader = ConfigFileYaml(file_name='cached.yaml', base_path=self.directory.name)
+
+        with patch.dict(os.environ, {"HARQIS_TEST_CACHE_URL": "http://one"}):
+            self.assertEqual(cache.load(loader)["APP"]["url"], "http://one")
+        with patch.dict(os.environ, {"HARQIS_TEST_CACHE_URL": "http://two"}), \
+                patch.object(loader, "parse", side_effect=AssertionError("parsed again")):
+            self.assertEqual(cache.load(loader)["APP"]["url"], "http://two")
+        self.assertEqual(cache.stats["resubstitutions"], 1)
+        self.assertEqual(cache.stats["reloads"], 0)
+
+    def test_snapshots_are_read_only(self):
+        config = ConfigLoaderService(ConfigSource.YAML, file_name='cached.yaml', base_path=self.directory.name).config
+
+        self.assertIsInstance(config, dict)
+        self.assertIsInstance(config["APP"]["items"], list)
+        with self.assertRaises(TypeError):
+            config["APP"]["url"] = "x"
+        with self.assertRaises(TypeError):
+            config["APP"]["items"].append(3)
+
+        mutable = thaw(config)
+        mutable["APP"]["items"].append(3)
+        self.assertEqual(mutable["APP"]["items"], [1, 2, 3])
+        self.assertEqual(config["APP"]["items"], [1, 2])
+
+    def test_frozen_copies(self):
+        frozen = freeze({"a": [1, {"b": 2}]})
+        for copied in (copy.copy(frozen), copy.deepcopy(frozen), pickle.loads(pickle.dumps(frozen))):
+            self.assertIsInstance(copied, FrozenDict)
+            self.assertIsInstance(copied["a"], FrozenList)
+            self.assertEqual(copied, {"a": [1, {"b": 2}]})
+
+    def test_service_uses_the_shared_cache(self):
+        before = config_cache.stats["hits"]
+        ConfigLoaderService(ConfigSource.YAML, file_name='cached.yaml', base_path=self.directory.name).config
+        ConfigLoaderService(ConfigSource.YAML, file_name='cached.yaml', base_path=self.directory.name).config
+        self.assertEqual(config_cache.stats["hits"], before + 1)
+
+        uncached = ConfigLoaderService(ConfigSource.YAML, file_name='cached.yaml', base_path=self.directory.name,
+                                       cache=False).config
+        self.assertNotIsInstance(uncached, FrozenDict)
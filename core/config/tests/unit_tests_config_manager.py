@@ -2,6 +2,8 @@ import unittest
 from unittest.mock import MagicMock
 
 from core.config.app_config_manager import AppConfigManager
+from core.config.cache import freeze
+from core.web.services.core.config.webservice import AppConfigWSClient
 
 
 class TestAppConfigManager(unittest.TestCase):
@@ -53,6 +55,32 @@ class TestAppConfigManager(unittest.TestCase):
         with self.assertRaises(KeyError):
             self.manager.get(dict, 'nonexistent_id')
 
+    def test_typed_instances_are_memoized(self):
+        """Typed sections are built once per loaded configuration and rebuilt after a reload."""
+        self.mock_service.config = freeze({
+            'rest': {'app_id': 'app1', 'client': 'rest', 'parameters': {'base_url': 'http://a'}},
+        })
+        self.manager.load('app1')
+
+        first = self.manager.get('rest')
+        self.assertIsInstance(first, AppConfigWSClient)
+        self.assertIs(self.manager.get('rest'), first)
+        # built from a mutable copy of the cached section
+        first.parameters['timeout'] = 5
+
+        self.manager.invalidate('rest')
+        self.assertIsNot(self.manager.get('rest'), first)
+
+        second = self.manager.get('rest')
+        self.manager.load('app1')
+        self.assertIs(self.manager.get('rest'), second)
+
+        self.mock_service.config = freeze({
+            'rest': {'app_id': 'app1', 'client': 'rest', 'parameters': {'base_url': 'http://b'}},
+        })
+        self.manager.load('app1')
+        self.assertEqual(self.manager.get('rest').parameters['base_url'], 'http://b')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+
+from core.config.interpolation import SubstitutionPlan
+from core.config.types.yaml import ConfigFileYaml, FAST_LOADER
+
+
+class UnitTestsInterpolation(unittest.TestCase):
+
+    def test_whole_embedded_and_list_placeholders(self):
+        data = {"url": "${HOST}", "endpoint": "https://${HOST}:${PORT}/api", "hosts": ["${HOST}", "static"],
+                "nested": {"unknown": "${NOT_SET}", "port": 8080}}
+        plan = SubstitutionPlan.compile(data)
+
+        result = plan.apply(data, {"HOST": "example.com", "PORT": "443"})
+        self.assertEqual(result, {"url": "example.com", "endpoint": "https://example.com:443/api",
+                                  "hosts": ["example.com", "static"],
+                                  "nested": {"unknown": "${NOT_SET}", "port": 8080}})
+        self.assertEqual(plan.names, {"HOST", "PORT", "NOT_SET"})
+
+    def test_apply_leaves_the_template_unchanged(self):
+        data = {"a": {"url": "${HOST}"}, "b": {"untouched": [1, 2]}}
+        plan = SubstitutionPlan.compile(data)
+
+        first = plan.apply(data, {"HOST": "one"})
+        second = plan.apply(data, {"HOST": "two"})
+        self.assertEqual((first["a"]["url"], second["a"]["url"]), ("one", "two"))
+        self.assertEqual(data["a"]["url"], "${HOST}")
+        # containers without placeholders are shared, not copied
+        self.assertIs(first["b"], data["b"])
+
+    def test_no_placeholders(self):
+        data = {"a": 1}
+        plan = SubstitutionPlan.compile(data)
+        self.assertFalse(plan)
+        self.assertIs(plan.apply(data), data)
+
+    def test_fast_loader(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, 'fast.yaml'), 'w') as f:
+                f.write("APP:\n  hosts: ['${HARQIS_TEST_FAST_HOST}']\n")
+            os.environ["HARQIS_TEST_FAST_HOST"] = "example.com"
+            try:
+                loader = ConfigFileYaml(file_name='fast.yaml', base_path=directory, fast=True)
+                self.assertIs(loader.loader_type, FAST_LOADER)
+                self.assertEqual(loader.load(), {"APP": {"hosts": ["example.com"]}})
+                self.assertEqual(loader.env_used, {"HARQIS_TEST_FAST_HOST": "example.com"})
+            finally:
+                del os.environ["HARQIS_TEST_FAST_HOST"]
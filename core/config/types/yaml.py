@@ -1,36 +1,61 @@
 import yaml
-import os
+from core.config.interpolation import SubstitutionPlan
 from core.utilities.contracts.file import IFileLoader
 
+# libyaml's safe loader when PyYAML was built with it, else the pure-Python one
+FAST_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class ConfigFileYaml(IFileLoader):
     def __init__(self, **kwargs):
+        """
+        Args:
+            loader_type: The PyYAML loader class. Defaults to yaml.FullLoader.
+            fast: Parse with FAST_LOADER (CSafeLoader when libyaml is present) instead of loader_type. The safe
+                  loaders only build plain data: no Python-specific tags.
+            env_replace: Whether to replace ${VAR} placeholders with environment variables.
+        """
         super(ConfigFileYaml, self).__init__(**kwargs, file_extension='.yaml')
-        self.loader_type = kwargs.get('loader_type', yaml.FullLoader)
+        self.loader_type = FAST_LOADER if kwargs.get('fast', False) else kwargs.get('loader_type', yaml.FullLoader)
         self.env_replace = kwargs.get('env_replace', True)
+        # environment variables substituted by the last load, with their values
+        self.env_used = {}
+
+    @property
+    def cache_key(self):
+        return super().cache_key + (self.loader_type, self.env_replace)
+
+    def parse(self) -> tuple:
+        """
+        Parses the file without substituting environment variables.
+
+        Returns:
+            The parsed data and the SubstitutionPlan of its ${VAR} placeholders, or None if env_replace is off.
+        """
+        with open(self.full_path_to_file) as config_file:
+            data = yaml.load(config_file, Loader=self.loader_type)
+        return data, SubstitutionPlan.compile(data) if self.env_replace else None
+
+    def substitute(self, data, plan: SubstitutionPlan):
+        """
+        Applies a substitution plan to parsed data, leaving the data given unchanged.
+
+        Placeholders may be whole values or embedded in strings, in mappings and lists; unknown variables are
+        left as they are.
+
+        Returns:
+            The substituted data.
+        """
+        self.env_used = plan.environment()
+        return plan.apply(data)
 
     def load(self) -> any:
         data = {}
+        self.env_used = {}
         try:
-            with open(self.full_path_to_file) as config_file:
-                data = yaml.load(config_file, Loader=self.loader_type)
-
-                # Recursively update placeholders with environment variables
-                def replace_env_variables(config_item):
-                    if isinstance(config_item, dict):
-                        for key, value in config_item.items():
-                            config_item[key] = replace_env_variables(value)
-                    elif isinstance(config_item, str):
-                        # Replace placeholder with environment variable value if it exists
-                        if config_item.startswith('${') and config_item.endswith('}'):
-                            env_var = config_item[2:-1]  # Extract the name of the environment variable
-                            return os.getenv(env_var, config_item)  # Default to original string if not found
-                    return config_item
-
-                if self.env_replace:
-                    return replace_env_variables(data)
-                else:
-                    return data
+            data, plan = self.parse()
+            if plan:
+                return self.substitute(data, plan)
 
         except FileNotFoundError as e:
             self.log.error(f"YAML configuration not loaded due to {e}.")
@@ -1,6 +1,8 @@
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, Optional
+from typing import TypeVar, Generic, Dict, FrozenSet, Hashable, List, Optional, Tuple
 from pathlib import Path
 
 from core.utilities.logging.custom_logger import create_logger
@@ -9,6 +11,133 @@ from core.utilities.logging.custom_logger import create_logger
 TFile = TypeVar('TFile')
 
 
+class _Resolution:
+    __slots__ = ("path", "watched", "checked")
+
+    def __init__(self, path: Optional[Path], watched: List[Tuple[str, Optional[int]]], checked: float):
+        self.path = path
+        # (directory, mtime) of every directory whose content decided the result
+        self.watched = watched
+        self.checked = checked
+
+
+class FileResolver:
+    """
+    Memoized upward file search shared by every file loader of the process.
+
+    Results, found or not, are cached per base path and file name. A cached result is returned without any
+    system call for revalidate_after seconds; after that it is revalidated by comparing the modification times
+    of the directories searched, which change when a file is added to or removed from them, and searched again
+    only if one of them changed.
+
+    Directories registered with index() are listed once and never revalidated, so lookups in known resource
+    trees cost no system call at all; call invalidate() after changing them.
+    """
+
+    def __init__(self, revalidate_after: float = 1.0):
+        """
+        Initializes the resolver.
+
+        Args:
+            revalidate_after: Seconds during which a cached result is trusted without checking the directories.
+        """
+        self.revalidate_after = revalidate_after
+        self._lock = threading.Lock()
+        self._results: Dict[Tuple[str, str], _Resolution] = {}
+        self._index: Dict[str, FrozenSet[str]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+    def index(self, *directories: str | Path):
+        """
+        Lists directory trees once, so files in them are found without system calls.
+
+        Args:
+            *directories: The root directories of the trees, e.g. resource folders.
+        """
+        listings = {}
+        for directory in directories:
+            for root, dirs, files in os.walk(directory):
+                listings[str(Path(root))] = frozenset(dirs) | frozenset(files)
+        with self._lock:
+            self._index.update(listings)
+            self._results.clear()
+
+    def invalidate(self):
+        """
+        Forgets every cached result and indexed directory.
+        """
+        with self._lock:
+            self._results.clear()
+            self._index.clear()
+
+    @staticmethod
+    def _mtime(directory: str) -> Optional[int]:
+        try:
+            return os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+
+    def _search(self, base_path: Path, file_name: str) -> _Resolution:
+        watched = []
+        for parent in [base_path, *base_path.parents]:
+            potential_path = parent / file_name
+            directory = str(potential_path.parent)
+            listing = self._index.get(directory)
+            if listing is not None:
+                found = potential_path.name in listing
+            else:
+                watched.append((directory, self._mtime(directory)))
+                found = potential_path.exists()
+            if found:
+                return _Resolution(potential_path, watched, time.monotonic())
+        return _Resolution(None, watched, time.monotonic())
+
+    def find(self, base_path: Path, file_name: str) -> Optional[Path]:
+        """
+        Searches for a file in a directory and its parents.
+
+        Args:
+            base_path: The directory to start from.
+            file_name: The file name, or a path relative to each directory searched.
+
+        Returns:
+            The path to the file in the closest directory containing it, or None if not found.
+        """
+        key = (str(base_path), file_name)
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is not None:
+                now = time.monotonic()
+                if now - entry.checked < self.revalidate_after:
+                    self.hits += 1
+                    return entry.path
+                if all(self._mtime(directory) == mtime for directory, mtime in entry.watched):
+                    entry.checked = now
+                    self.hits += 1
+                    self.revalidations += 1
+                    return entry.path
+
+            self.misses += 1
+            entry = self._results[key] = self._search(base_path, file_name)
+            return entry.path
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the number of cached lookups (hits), of those revalidated, searches (misses),
+        cached results and indexed directories.
+        """
+        with self._lock:
+            return {"hits": self.hits, "revalidations": self.revalidations, "misses": self.misses,
+                    "entries": len(self._results), "indexed": len(self._index)}
+
+
+file_resolver = FileResolver()
+"""The resolver used by IFileLoader.find_file_from_base_path."""
+
+
 class IFileLoader(ABC, Generic[TFile]):
     """
     Abstract base class for a file loader.
@@ -60,18 +189,29 @@ class IFileLoader(ABC, Generic[TFile]):
         """
         ...
 
+    @property
+    def cache_key(self) -> Hashable:
+        """
+        Identifies the parsed content of the file, e.g. in the configuration cache.
+        Subclasses whose settings change the parsed content add them to the key.
+
+        Returns:
+            The loader class and the resolved path of the file.
+        """
+        return self.__class__, str(Path(self.full_path_to_file).resolve())
+
     def find_file_from_base_path(self) -> Optional[Path]:
         """
         Searches for the file in the directory tree starting from the base path.
 
         This method traverses the directory tree starting from the base path and moving up to the parent directories.
         It stops when it finds a file that matches the file name and returns its path.
+        Results are memoized by the process-wide file_resolver.
 
         Returns:
             The path to the file if found, otherwise None.
         """
-        for parent in [self.base_path, *self.base_path.parents]:
-            potential_path = parent / self.file_name
-            if potential_path.exists():
-                print(f"File {self.file_name} found in: {parent}")
-                return potential_path
+        path = file_resolver.find(self.base_path, self.file_name)
+        if path is not None:
+            self.log.debug(f"File {self.file_name} found in: {path.parent}")
+        return path
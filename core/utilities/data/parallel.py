@@ -0,0 +1,176 @@
+"""
+Parallel evaluation of QList selectors and conditions.
+
+The elements are split into chunks, so that one task carries many elements and the cost of dispatching a task (and,
+for processes, of pickling it) is paid once per chunk. Two executors are available:
+- 'thread': a thread pool, for I/O-bound functions (HTTP enrichment, file reads) that release the GIL.
+- 'process': MultiProcessingClient worker processes, for CPU-bound functions (regex parsing, OCR post-processing).
+  The function and the elements must be picklable: use module-level functions, not lambdas. One pool is shared by
+  the program: it is started on first use, kept for later calls and replaced when they ask for another number of
+  workers. Calls using it run one at a time.
+
+A failing element does not stop the others. Every failure is collected and raised at the end as one
+ExceptionGroup, each exception noting the index of its element.
+"""
+import atexit
+import math
+import os
+import threading
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from core.utilities.multiprocess import MultiProcessingClient, portable_exception
+
+EXECUTORS = ('thread', 'process')
+
+# chunks per worker when the chunk size is not given: enough to balance uneven chunks, few enough to amortize
+CHUNKS_PER_WORKER = 4
+
+# the persistent process pool, and the lock held while it is replaced or used
+_process_client: Optional[MultiProcessingClient] = None
+_process_lock = threading.Lock()
+
+# (index of the first element, the elements)
+_Chunk = Tuple[int, Sequence[Any]]
+# (index of the first element, (succeeded, result or exception) per element)
+_ChunkResult = Tuple[int, List[Tuple[bool, Any]]]
+
+
+def run_chunk(job: Tuple[Callable[[Any], Any], int, Sequence[Any]]) -> _ChunkResult:
+    """
+    Applies a function to a chunk of elements, catching the exception of each element.
+
+    Module-level so that worker processes can unpickle it. The exceptions are made portable, so that one which
+    cannot be sent back to the parent process does not lose the chunk.
+
+    Args:
+        job: The function, the index of the first element and the elements.
+
+    Returns:
+        The index of the first element and, per element, whether it succeeded with its result or exception.
+    """
+    func, start, items = job
+    outcomes = []
+    for item in items:
+        try:
+            outcomes.append((True, func(item)))
+        except Exception as e:
+            outcomes.append((False, portable_exception(e)))
+    return start, outcomes
+
+
+def process_client(workers: int) -> MultiProcessingClient:
+    """
+    Returns the persistent MultiProcessingClient, starting it on first use so that later calls do not pay the
+    start-up of the workers again. A client with another number of workers is closed and replaced.
+
+    Call it with _process_lock held, and keep the lock while using the client.
+    """
+    global _process_client
+    client = _process_client
+    if client is None or client.worker_count != workers:
+        if client is not None:
+            client.close()
+        client = _process_client = MultiProcessingClient([], worker_count=workers, persistent=True)
+    return client
+
+
+def close_process_client():
+    """
+    Closes the persistent process pool, if started.
+    """
+    global _process_client
+    with _process_lock:
+        if _process_client is not None:
+            _process_client.close()
+            _process_client = None
+
+
+atexit.register(close_process_client)
+
+
+def lost_element_error(error: BaseException) -> RuntimeError:
+    """
+    Returns the error of one element of a chunk lost as a whole, caused by the error of the chunk.
+    """
+    lost = RuntimeError(f"chunk lost: {error.__class__.__name__}: {error}")
+    lost.__cause__ = error
+    return lost
+
+
+def default_workers(executor: str) -> int:
+    cpu = os.cpu_count() or 1
+    # threads wait on I/O most of the time, so they can outnumber the CPUs
+    return min(32, cpu + 4) if executor == 'thread' else cpu
+
+
+def chunked(items: Sequence[Any], chunk_size: int) -> List[_Chunk]:
+    return [(start, items[start:start + chunk_size]) for start in range(0, len(items), chunk_size)]
+
+
+def map_parallel(func: Callable[[Any], Any], items: Sequence[Any], executor: str = 'thread',
+                 workers: Optional[int] = None, chunk_size: Optional[int] = None,
+                 ordered: bool = True) -> List[Tuple[int, Any]]:
+    """
+    Applies a function to every element in parallel.
+
+    Args:
+        func: The function. With the 'process' executor it must be picklable, e.g. a module-level function.
+        items: The elements.
+        executor: 'thread' for I/O-bound functions or 'process' for CPU-bound ones.
+        workers: The number of threads or processes. Defaults to the number of CPUs, plus 4 for threads (max 32).
+        chunk_size: The number of elements per task. Defaults to an even split in 4 chunks per worker.
+        ordered: Whether to return the results in the order of the elements, or in the order chunks complete.
+
+    Returns:
+        Pairs of (index of the element, result).
+
+    Raises:
+        ValueError: If the executor is unknown.
+        ExceptionGroup: If func raised for any element; holds every exception, with the index of its element
+                        in a note.
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor '{executor}'. Available: {', '.join(EXECUTORS)}")
+    items = list(items)
+    if not items:
+        return []
+
+    workers = workers or default_workers(executor)
+    chunk_size = chunk_size or max(1, math.ceil(len(items) / (workers * CHUNKS_PER_WORKER)))
+    jobs = [(func, start, chunk) for start, chunk in chunked(items, chunk_size)]
+
+    if executor == 'thread':
+        with ThreadPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            futures = [pool.submit(run_chunk, job) for job in jobs]
+            chunk_results = [f.result() for f in (futures if ordered else as_completed(futures))]
+    else:
+        # each job is already a chunk: send them one by one to the shared pool
+        chunk_results = []
+        with _process_lock:
+            for task in process_client(workers).iter_tasks(run_chunk, jobs, ordered=ordered, chunksize=1):
+                if task.ok:
+                    chunk_results.append(task.result)
+                    continue
+                # the whole chunk was lost, e.g. a result could not be pickled: every element of it failed
+                _, start, chunk = task.task
+                chunk_results.append((start, [(False, lost_element_error(task.error)) for _ in chunk]))
+        if ordered:
+            # lost chunks are reported after the others
+            chunk_results.sort(key=itemgetter(0))
+
+    results = []
+    errors = []
+    for start, outcomes in chunk_results:
+        for index, (succeeded, value) in enumerate(outcomes, start):
+            if succeeded:
+                results.append((index, value))
+            else:
+                value.add_note(f"raised for element {index}")
+                errors.append(value)
+
+    if errors:
+        raise ExceptionGroup(f"{len(errors)} of {len(items)} elements failed", errors)
+    return results
@@ -1,6 +1,17 @@
-from typing import Callable, TypeVar, Generic, MutableSequence, Iterable, Union, Dict, Any
+import heapq
+
+from itertools import chain, compress, count, dropwhile, islice, takewhile
+from operator import ne
+from typing import Callable, TypeVar, Generic, MutableSequence, Iterable, Iterator, Union, Dict, Any, Tuple, List, \
+    Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # imported on first use: columns loads NumPy and parallel loads multiprocessing and psutil
+    from core.utilities.data.columns import QColumns
 
 T = TypeVar("T", bound=Union[Dict, Iterable])
+U = TypeVar("U")
+K = TypeVar("K")
 
 
 class QList(list, Generic[T], MutableSequence[T], Iterable[T]):
@@ -33,6 +44,18 @@ class QList(list, Generic[T], MutableSequence[T], Iterable[T]):
         # Utilize the length method provided by the parent list class
         return super().__len__()
 
+    def query(self) -> "QQuery":
+        """
+        Starts a lazy query over the list.
+
+        Operators of the query are only recorded; they run as a single pipeline when a terminal operation such as
+        to_list, first or any is called, and stop as soon as the result is known.
+
+        Returns:
+            A QQuery over the elements of the list.
+        """
+        return QQuery(self)
+
     def any(self, condition: Callable[[T], bool] = lambda x: True) -> bool:
         """
         Checks if any element of the list satisfies the condition.
@@ -189,6 +212,51 @@ class QList(list, Generic[T], MutableSequence[T], Iterable[T]):
         """
         return QList(item for sublist in map(selector, self) for item in sublist)
 
+    def select_parallel(self, selector: Callable[[T], Any], executor: str = 'thread', workers: Optional[int] = None,
+                        chunk_size: Optional[int] = None, ordered: bool = True) -> "QList":
+        """
+        Projects each element of the list into a new form, running the selector in parallel over chunks of elements.
+
+        Args:
+            selector: A function that transforms each element. With the 'process' executor it must be picklable,
+                      e.g. a module-level function.
+            executor: 'thread' for I/O-bound selectors or 'process' for CPU-bound ones.
+            workers: The number of threads or processes. Defaults to one per CPU, plus 4 for threads.
+            chunk_size: The number of elements per task. Defaults to 4 chunks per worker.
+            ordered: Whether to keep the order of the list, or return results in the order chunks complete.
+
+        Returns:
+            A new QList containing the transformed elements.
+
+        Raises:
+            ExceptionGroup if the selector raised for any element, with every exception.
+        """
+        from core.utilities.data.parallel import map_parallel
+        return QList(result for _, result in map_parallel(selector, self, executor, workers, chunk_size, ordered))
+
+    def where_parallel(self, condition: Callable[[T], bool], executor: str = 'thread', workers: Optional[int] = None,
+                       chunk_size: Optional[int] = None, ordered: bool = True) -> "QList":
+        """
+        Filters the list based on a condition, evaluated in parallel over chunks of elements.
+
+        Args:
+            condition: A function that evaluates to True or False for each element. With the 'process' executor it
+                       must be picklable, e.g. a module-level function.
+            executor: 'thread' for I/O-bound conditions or 'process' for CPU-bound ones.
+            workers: The number of threads or processes. Defaults to one per CPU, plus 4 for threads.
+            chunk_size: The number of elements per task. Defaults to 4 chunks per worker.
+            ordered: Whether to keep the order of the list, or return elements in the order chunks complete.
+
+        Returns:
+            A new QList containing elements that satisfy the condition.
+
+        Raises:
+            ExceptionGroup if the condition raised for any element, with every exception.
+        """
+        from core.utilities.data.parallel import map_parallel
+        return QList(self[index] for index, passed in map_parallel(condition, self, executor, workers, chunk_size,
+                                                                   ordered) if passed)
+
     def distinct(self, key: Callable[[T], Any] = lambda x: x) -> "QList":
         """
         Returns a new QList containing distinct elements from the original list, uniquely identified by a key function.
@@ -232,3 +300,668 @@ class QList(list, Generic[T], MutableSequence[T], Iterable[T]):
             The maximum element of the list.
         """
         return max(self, key=key)
+
+    def to_lookup(self, key: Callable[[T], K], element: Callable[[T], Any] = lambda x: x) -> Dict[K, "QList"]:
+        """
+        Indexes the elements by key, keeping every element of a key.
+
+        Args:
+            key: A function that extracts the key of each element.
+            element: A function that transforms each element before it is stored. Defaults to the element itself.
+
+        Returns:
+            A dict of QLists, one per key, in order of first occurrence.
+        """
+        lookup: Dict[K, QList] = {}
+        for item in self:
+            k = key(item)
+            group = lookup.get(k)
+            if group is None:
+                group = lookup[k] = QList()
+            group.append(element(item))
+        return lookup
+
+    def to_dict(self, key: Callable[[T], K], element: Callable[[T], Any] = lambda x: x) -> Dict[K, Any]:
+        """
+        Indexes the elements by a unique key.
+
+        Args:
+            key: A function that extracts the key of each element.
+            element: A function that transforms each element before it is stored. Defaults to the element itself.
+
+        Returns:
+            A dict with one element per key.
+
+        Raises:
+            ValueError if two elements have the same key.
+        """
+        result: Dict[K, Any] = {}
+        for item in self:
+            k = key(item)
+            if k in result:
+                raise ValueError(f"Duplicate key found: {k!r}.")
+            result[k] = element(item)
+        return result
+
+    def group_by(self, key: Callable[[T], K], element: Callable[[T], Any] = lambda x: x) -> "QList[QGrouping]":
+        """
+        Groups the elements by key.
+
+        Args:
+            key: A function that extracts the key of each element.
+            element: A function that transforms each element before it is grouped. Defaults to the element itself.
+
+        Returns:
+            A new QList of QGroupings, in order of first occurrence of their key.
+        """
+        groups: Dict[K, QGrouping] = {}
+        for item in self:
+            k = key(item)
+            group = groups.get(k)
+            if group is None:
+                group = groups[k] = QGrouping(k)
+            group.append(element(item))
+        return QList(groups.values())
+
+    def join(self, other: Iterable[U], outer_key: Callable[[T], K], inner_key: Callable[[U], K],
+             result: Callable[[T, U], Any] = lambda outer, inner: (outer, inner)) -> "QList":
+        """
+        Correlates the elements with the elements of another iterable that have the same key (inner join).
+
+        The other iterable is indexed once by key, so the join takes linear time.
+
+        Args:
+            other: The elements to join with.
+            outer_key: A function that extracts the key of each element of this list.
+            inner_key: A function that extracts the key of each element of other.
+            result: A function that builds a result from two matching elements. Defaults to a tuple of both.
+
+        Returns:
+            A new QList with one result per matching pair, in the order of this list, then of other.
+        """
+        lookup = QList(other).to_lookup(inner_key)
+        return QList(result(outer, inner) for outer in self for inner in lookup.get(outer_key(outer), ()))
+
+    def group_join(self, other: Iterable[U], outer_key: Callable[[T], K], inner_key: Callable[[U], K],
+                   result: Callable[[T, "QList"], Any] = lambda outer, inners: (outer, inners)) -> "QList":
+        """
+        Correlates each element with the group of elements of another iterable that have the same key.
+
+        Args:
+            other: The elements to join with.
+            outer_key: A function that extracts the key of each element of this list.
+            inner_key: A function that extracts the key of each element of other.
+            result: A function that builds a result from an element and the QList of its matches, which is empty
+                    if there are none. Defaults to a tuple of both.
+
+        Returns:
+            A new QList with one result per element of this list.
+        """
+        lookup = QList(other).to_lookup(inner_key)
+        return QList(result(outer, lookup.get(outer_key(outer), QList())) for outer in self)
+
+    def left_join(self, other: Iterable[U], outer_key: Callable[[T], K], inner_key: Callable[[U], K],
+                  result: Callable[[T, U], Any] = lambda outer, inner: (outer, inner), default=None) -> "QList":
+        """
+        Correlates the elements with the elements of another iterable that have the same key, keeping the elements
+        without a match (left outer join).
+
+        Args:
+            other: The elements to join with.
+            outer_key: A function that extracts the key of each element of this list.
+            inner_key: A function that extracts the key of each element of other.
+            result: A function that builds a result from two matching elements. Defaults to a tuple of both.
+            default: The inner element passed to result for elements without a match.
+
+        Returns:
+            A new QList with one result per matching pair, and one per element without a match.
+        """
+        lookup = QList(other).to_lookup(inner_key)
+        return QList(result(outer, inner) for outer in self for inner in lookup.get(outer_key(outer), (default,)))
+
+    def union(self, other: Iterable[T], key: Callable[[T], Any] = lambda x: x) -> "QList":
+        """
+        Returns the distinct elements of this list and another iterable.
+
+        Args:
+            other: The elements to add.
+            key: A function that extracts a comparison key from each element. Defaults to the element itself.
+
+        Returns:
+            A new QList with the first element of each key, this list first.
+        """
+        return QList(_distinct(key)(chain(self, other)))
+
+    def intersect(self, other: Iterable[T], key: Callable[[T], Any] = lambda x: x) -> "QList":
+        """
+        Returns the distinct elements of this list whose key also occurs in another iterable.
+
+        Args:
+            other: The elements to intersect with.
+            key: A function that extracts a comparison key from each element. Defaults to the element itself.
+
+        Returns:
+            A new QList with the elements in both, in the order of this list.
+        """
+        keys = set(map(key, other))
+        return QList(_distinct(key)(item for item in self if key(item) in keys))
+
+    def except_(self, other: Iterable[T], key: Callable[[T], Any] = lambda x: x) -> "QList":
+        """
+        Returns the distinct elements of this list whose key does not occur in another iterable.
+
+        Args:
+            other: The elements to remove.
+            key: A function that extracts a comparison key from each element. Defaults to the element itself.
+
+        Returns:
+            A new QList with the elements only in this list, in its order.
+        """
+        keys = set(map(key, other))
+        return QList(_distinct(key)(item for item in self if key(item) not in keys))
+
+    def order_by(self, key: Callable[[T], Any] = lambda x: x, descending: bool = False) -> "OrderedQList":
+        """
+        Sorts the elements by a key. The sort is stable: elements with equal keys keep their order.
+
+        Args:
+            key: A function that returns the value to sort by.
+            descending: Whether to sort from the largest key to the smallest.
+
+        Returns:
+            A new OrderedQList, which then_by can sort further by secondary keys.
+        """
+        return OrderedQList.sorted_by(self, key, descending)
+
+    def take(self, count: int) -> "QList":
+        """
+        Returns the first elements of the list.
+
+        Args:
+            count: The number of elements to return.
+
+        Returns:
+            A new QList with at most count elements.
+        """
+        return QList(self[:max(count, 0)])
+
+    def skip(self, count: int) -> "QList":
+        """
+        Bypasses the first elements of the list.
+
+        Args:
+            count: The number of elements to skip.
+
+        Returns:
+            A new QList with the elements after the first count.
+        """
+        return QList(self[max(count, 0):])
+
+    def take_while(self, condition: Callable[[T], bool]) -> "QList":
+        """
+        Returns the elements up to the first one that does not satisfy the condition.
+
+        Args:
+            condition: A function that evaluates to True or False for each element.
+
+        Returns:
+            A new QList with the leading elements that satisfy the condition.
+        """
+        return QList(takewhile(condition, self))
+
+    def skip_while(self, condition: Callable[[T], bool]) -> "QList":
+        """
+        Bypasses the elements up to the first one that does not satisfy the condition.
+
+        Args:
+            condition: A function that evaluates to True or False for each element.
+
+        Returns:
+            A new QList starting at the first element that does not satisfy the condition.
+        """
+        return QList(dropwhile(condition, self))
+
+    def top_k(self, count: int, key: Callable[[T], Any] = lambda x: x) -> "QList":
+        """
+        Returns the elements with the largest keys, without sorting the whole list.
+
+        Uses a heap of count elements, so it takes O(n log count) time instead of O(n log n) for a sort and slice.
+
+        Args:
+            count: The number of elements to return.
+            key: A function that returns the value to compare.
+
+        Returns:
+            A new QList with at most count elements, from the largest key down; ties keep the order of the list.
+        """
+        return QList(heapq.nlargest(count, self, key=key))
+
+    def bottom_k(self, count: int, key: Callable[[T], Any] = lambda x: x) -> "QList":
+        """
+        Returns the elements with the smallest keys, without sorting the whole list.
+
+        Args:
+            count: The number of elements to return.
+            key: A function that returns the value to compare.
+
+        Returns:
+            A new QList with at most count elements, from the smallest key up; ties keep the order of the list.
+        """
+        return QList(heapq.nsmallest(count, self, key=key))
+
+    def to_columns(self, fields: Iterable[str], use_numpy: Optional[bool] = None) -> "QColumns":
+        """
+        Extracts fields of the elements into columns for vectorized aggregation.
+
+        Args:
+            fields: The keys of dictionary elements, or the attribute names of objects, e.g. ['passed', 'failed'].
+            use_numpy: Whether to store the columns as NumPy arrays. Defaults to True when NumPy is installed;
+                       plain lists are used otherwise.
+
+        Returns:
+            A QColumns with sum, average, percentile, histogram and group_by_aggregate over the columns.
+        """
+        from core.utilities.data.columns import QColumns
+        return QColumns.from_records(self, fields, use_numpy)
+
+
+class QGrouping(QList):
+    """
+    The elements of a QList that share a key, as returned by QList.group_by.
+    """
+
+    def __init__(self, key: Any, *args):
+        super().__init__(*args)
+        self.key = key
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(key={self.key!r}, {list.__repr__(self)})"
+
+
+_Run = Tuple[int, int]
+
+
+def _sort_runs(items: list, runs: List[_Run], key: Callable[[T], Any], descending: bool) -> list:
+    # stable-sorts each (start, end) slice of items in place
+    if runs == [(0, len(items))]:
+        items.sort(key=key, reverse=descending)
+        return items
+    for start, end in runs:
+        items[start:end] = sorted(items[start:end], key=key, reverse=descending)
+    return items
+
+
+def _tie_runs(items: list, runs: List[_Run], key: Callable[[T], Any]) -> List[_Run]:
+    # the slices of sorted runs whose elements have equal keys
+    ties = []
+    for start, end in runs:
+        values = list(map(key, items[start:end]))
+        edges = [0, *compress(count(1), map(ne, values, islice(values, 1, None))), len(values)]
+        ties.extend((start + a, start + b) for a, b in zip(edges, edges[1:]) if b - a > 1)
+    return ties
+
+
+class OrderedQList(QList):
+    """
+    A QList sorted by one or more keys, as returned by QList.order_by.
+
+    It remembers the last key and the slices it sorted, so then_by only sorts the runs of elements whose keys are
+    equal so far.
+    """
+
+    def __init__(self, items: Iterable[T] = (), runs: List[_Run] = (), key: Callable[[T], Any] = None):
+        """
+        Args:
+            items: The sorted elements.
+            runs: The (start, end) slices that were sorted by key.
+            key: The last key the elements were sorted by.
+        """
+        super().__init__(items)
+        self._runs = list(runs)
+        self._key = key
+
+    @classmethod
+    def sorted_by(cls, items: Iterable[T], key: Callable[[T], Any], descending: bool = False) -> "OrderedQList":
+        """
+        Returns the elements sorted by a key, ties keeping their order.
+
+        Args:
+            items: The elements to sort.
+            key: A function that returns the value to sort by.
+            descending: Whether to sort from the largest key to the smallest.
+
+        Returns:
+            A new OrderedQList.
+        """
+        items = list(items)
+        runs = [(0, len(items))]
+        return cls(_sort_runs(items, runs, key, descending), runs, key)
+
+    def then_by(self, key: Callable[[T], Any] = lambda x: x, descending: bool = False) -> "OrderedQList":
+        """
+        Sorts the elements that have equal keys so far by another key.
+
+        Args:
+            key: A function that returns the value to sort by.
+            descending: Whether to sort from the largest key to the smallest.
+
+        Returns:
+            A new OrderedQList.
+        """
+        ties = _tie_runs(self, self._runs, self._key) if self._key is not None else []
+        return OrderedQList(_sort_runs(list(self), ties, key, descending), ties, key)
+
+
+_Stage = Callable[[Iterator], Iterator]
+
+
+def _distinct(key: Callable[[T], Any]) -> _Stage:
+    def stage(items: Iterator) -> Iterator:
+        seen = set()
+        for item in items:
+            comparator = key(item)
+            if comparator not in seen:
+                seen.add(comparator)
+                yield item
+    return stage
+
+
+class QQuery(Generic[T], Iterable[T]):
+    """
+    A deferred LINQ query over an iterable, created with QList.query().
+
+    Operators return a new QQuery that records one more stage, leaving the source and the query they are called on
+    unchanged. Terminal operations chain the stages into a single iterator (filter, map and islice where possible)
+    and consume only as many source elements as the result needs, without building intermediate lists. The query
+    can be run again; each terminal operation iterates the source from the start.
+    """
+    __slots__ = ("_source", "_stages")
+
+    def __init__(self, source: Iterable[T], stages: Tuple[_Stage, ...] = ()):
+        self._source = source
+        self._stages = stages
+
+    def __iter__(self) -> Iterator[T]:
+        items = iter(self._source)
+        for stage in self._stages:
+            items = stage(items)
+        return items
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(<{len(self._stages)} stages>)"
+
+    def _then(self, stage: _Stage) -> "QQuery":
+        return QQuery(self._source, self._stages + (stage,))
+
+    # deferred operators
+
+    def where(self, condition: Callable[[T], bool]) -> "QQuery":
+        """
+        Filters the elements based on a condition.
+
+        Args:
+            condition: A function that evaluates to True or False for each element.
+
+        Returns:
+            A new QQuery yielding the elements that satisfy the condition.
+        """
+        return self._then(lambda items: filter(condition, items))
+
+    def select(self, selector: Callable[[T], Any]) -> "QQuery":
+        """
+        Projects each element into a new form.
+
+        Args:
+            selector: A function that transforms each element.
+
+        Returns:
+            A new QQuery yielding the transformed elements.
+        """
+        return self._then(lambda items: map(selector, items))
+
+    def select_many(self, selector: Callable[[T], Iterable[Any]]) -> "QQuery":
+        """
+        Projects each element into a new iterable and flattens the result.
+
+        Args:
+            selector: A function that transforms each element into an iterable.
+
+        Returns:
+            A new QQuery yielding the elements of every iterable in turn.
+        """
+        return self._then(lambda items: chain.from_iterable(map(selector, items)))
+
+    def distinct(self, key: Callable[[T], Any] = lambda x: x) -> "QQuery":
+        """
+        Keeps the first element of each key, in order.
+
+        Args:
+            key: A function that extracts a comparison key from each element. Defaults to the element itself.
+
+        Returns:
+            A new QQuery yielding the distinct elements.
+        """
+        return self._then(_distinct(key))
+
+    def take(self, count: int) -> "QQuery":
+        """
+        Keeps the first elements; the source is not read past them.
+
+        Args:
+            count: The number of elements to keep.
+
+        Returns:
+            A new QQuery yielding at most count elements.
+        """
+        return self._then(lambda items: islice(items, max(count, 0)))
+
+    def skip(self, count: int) -> "QQuery":
+        """
+        Bypasses the first elements.
+
+        Args:
+            count: The number of elements to skip.
+
+        Returns:
+            A new QQuery yielding the elements after the first count.
+        """
+        return self._then(lambda items: islice(items, max(count, 0), None))
+
+    def take_while(self, condition: Callable[[T], bool]) -> "QQuery":
+        """
+        Keeps the elements up to the first one that does not satisfy the condition; the source is not read further.
+
+        Args:
+            condition: A function that evaluates to True or False for each element.
+
+        Returns:
+            A new QQuery yielding the leading elements that satisfy the condition.
+        """
+        return self._then(lambda items: takewhile(condition, items))
+
+    def skip_while(self, condition: Callable[[T], bool]) -> "QQuery":
+        """
+        Bypasses the elements up to the first one that does not satisfy the condition.
+
+        Args:
+            condition: A function that evaluates to True or False for each element.
+
+        Returns:
+            A new QQuery yielding the elements from the first one that does not satisfy the condition.
+        """
+        return self._then(lambda items: dropwhile(condition, items))
+
+    # terminal operations
+
+    def to_list(self) -> QList:
+        """
+        Runs the query.
+
+        Returns:
+            A new QList containing the results.
+        """
+        return QList(self)
+
+    def any(self, condition: Callable[[T], bool] = lambda x: True) -> bool:
+        """
+        Checks if any result satisfies the condition, stopping at the first one that does.
+
+        Args:
+            condition: A function that evaluates to True or False for each element.
+
+        Returns:
+            True if any result satisfies the condition, False otherwise.
+        """
+        return any(map(condition, self))
+
+    def all(self, condition: Callable[[T], bool]) -> bool:
+        """
+        Checks if all results satisfy the condition, stopping at the first one that does not.
+
+        Args:
+            condition: A function that evaluates to True or False for each element.
+
+        Returns:
+            True if all results satisfy the condition, False otherwise.
+        """
+        return all(map(condition, self))
+
+    def count(self, condition: Callable[[T], bool] = None) -> int:
+        """
+        Counts the results, without keeping them.
+
+        Args:
+            condition: An optional function that evaluates to True or False for each element.
+
+        Returns:
+            The number of results that satisfy the condition.
+        """
+        items = self if condition is None else filter(condition, self)
+        return sum(1 for _ in items)
+
+    def first(self, condition: Callable[[T], bool] = lambda x: True) -> T:
+        """
+        Returns the first result that satisfies the condition.
+
+        Args:
+            condition: A function that evaluates to True or False for each element.
+
+        Returns:
+            The first result that satisfies the condition.
+
+        Raises:
+            StopIteration if no result satisfies the condition.
+        """
+        return next(filter(condition, self))
+
+    def first_or_default(self, condition: Callable[[T], bool] = lambda x: True, default=None) -> T:
+        """
+        Returns the first result that satisfies the condition or a default value.
+
+        Args:
+            condition: A function that evaluates to True or False for each element.
+            default: The default value to return if no result satisfies the condition.
+
+        Returns:
+            The first result that satisfies the condition or the default value.
+        """
+        return next(filter(condition, self), default)
+
+    def last(self, condition: Callable[[T], bool] = lambda x: True) -> T:
+        """
+        Returns the last result that satisfies the condition.
+
+        Args:
+            condition: A function that evaluates to True or False for each element.
+
+        Returns:
+            The last result that satisfies the condition.
+
+        Raises:
+            StopIteration if no result satisfies the condition.
+        """
+        missing = object()
+        result = self.last_or_default(condition, default=missing)
+        if result is missing:
+            raise StopIteration
+        return result
+
+    def last_or_default(self, condition: Callable[[T], bool] = lambda x: True, default=None) -> T:
+        """
+        Returns the last result that satisfies the condition or a default value.
+
+        Args:
+            condition: A function that evaluates to True or False for each element.
+            default: The default value to return if no result satisfies the condition.
+
+        Returns:
+            The last result that satisfies the condition or the default value.
+        """
+        result = default
+        for result in filter(condition, self):
+            pass
+        return result
+
+    def single(self, condition: Callable[[T], bool] = lambda x: True) -> T:
+        """
+        Returns the single result that satisfies the condition, stopping at the second match.
+
+        Args:
+            condition: A function that evaluates to True or False for each element.
+
+        Returns:
+            The single result that satisfies the condition.
+
+        Raises:
+            ValueError if no result or more than one result satisfies the condition.
+        """
+        found = list(islice(filter(condition, self), 2))
+        if len(found) == 1:
+            return found[0]
+        elif len(found) > 1:
+            raise ValueError("Multiple items found for condition.")
+        else:
+            raise ValueError("No item found for condition.")
+
+    def single_or_default(self, condition: Callable[[T], bool] = lambda x: True, default=None) -> T:
+        """
+        Returns the single result that satisfies the condition or a default value, stopping at the second match.
+
+        Args:
+            condition: A function that evaluates to True or False for each element.
+            default: The default value to return if no result satisfies the condition.
+
+        Returns:
+            The single result that satisfies the condition or the default value.
+
+        Raises:
+            ValueError if more than one result satisfies the condition.
+        """
+        found = list(islice(filter(condition, self), 2))
+        if len(found) > 1:
+            raise ValueError("Multiple items found for condition.")
+        return found[0] if found else default
+
+    def min(self, key: Callable[[T], Any] = lambda x: x) -> T:
+        """
+        Returns the minimum result based on a key function.
+
+        Args:
+            key: A function that returns a value used for comparison.
+
+        Returns:
+            The minimum result.
+        """
+        return min(self, key=key)
+
+    def max(self, key: Callable[[T], Any] = lambda x: x) -> T:
+        """
+        Returns the maximum result based on a key function.
+
+        Args:
+            key: A function that returns a value used for comparison.
+
+        Returns:
+            The maximum result.
+        """
+        return max(self, key=key)
@@ -0,0 +1,108 @@
+import unittest
+
+from core.utilities.data import columns
+from core.utilities.data.columns import QColumns
+from core.utilities.data.qlist import QList
+
+
+class Result:
+    def __init__(self, name, passed, failed):
+        self.name = name
+        self.passed = passed
+        self.failed = failed
+
+
+class UnitTestsColumns(unittest.TestCase):
+    use_numpy = False
+
+    def setUp(self):
+        """Set up test results as dictionaries and as objects."""
+        self.records = QList([
+            {'name': 'login', 'passed': 10, 'failed': 0, 'ok': True},
+            {'name': 'search', 'passed': 4, 'failed': 6, 'ok': False},
+            {'name': 'login', 'passed': 8, 'failed': 2, 'ok': True},
+            {'name': 'upload', 'passed': 1, 'failed': 9, 'ok': False},
+            {'name': 'search', 'passed': 7, 'failed': 3, 'ok': True},
+        ])
+        self.columns = self.records.to_columns(['name', 'passed', 'failed', 'ok'], use_numpy=self.use_numpy)
+
+    def test_to_columns(self):
+        """Test extracting fields of dictionaries and objects."""
+        self.assertIsInstance(self.columns, QColumns)
+        self.assertEqual(len(self.columns), 5)
+        self.assertEqual(list(self.columns['passed']), [10, 4, 8, 1, 7])
+        objects = QList(Result(r['name'], r['passed'], r['failed']) for r in self.records)
+        self.assertEqual(list(objects.to_columns(['failed'], use_numpy=self.use_numpy)['failed']), [0, 6, 2, 9, 3])
+        self.assertEqual(len(QList().to_columns(['passed'], use_numpy=self.use_numpy)), 0)
+
+    def test_sum_and_average(self):
+        """Test the sum and mean of a column."""
+        self.assertEqual(self.columns.sum('passed'), 30)
+        self.assertEqual(self.columns.sum('ok'), 3)
+        self.assertAlmostEqual(self.columns.average('failed'), 4.0)
+        with self.assertRaises(ValueError):
+            QList().to_columns(['passed'], use_numpy=self.use_numpy).average('passed')
+
+    def test_percentile(self):
+        """Test percentiles interpolated between the closest values."""
+        self.assertEqual(self.columns.percentile('passed', 50), 7.0)
+        self.assertEqual(self.columns.percentile('passed', [0, 25, 100]), [1.0, 4.0, 10.0])
+        self.assertAlmostEqual(self.columns.percentile('passed', 90), 9.2)
+        with self.assertRaises(ValueError):
+            self.columns.percentile('passed', 101)
+
+    def test_histogram(self):
+        """Test counting values in equal-width bins."""
+        counts, edges = self.columns.histogram('failed', bins=3)
+        self.assertEqual(counts, [2, 1, 2])
+        self.assertEqual(edges, [0.0, 3.0, 6.0, 9.0])
+        counts, edges = self.columns.histogram('passed', bins=2, value_range=(0, 5))
+        self.assertEqual(counts, [1, 1])
+
+    def test_group_by_aggregate(self):
+        """Test aggregating columns per group, in order of first occurrence."""
+        result = self.columns.group_by_aggregate('name', {'passed': 'sum', 'failed': 'average', 'ok': 'count'})
+        self.assertEqual(list(result), ['login', 'search', 'upload'])
+        self.assertEqual(result['login'], {'passed': 18, 'failed': 1.0, 'ok': 2})
+        self.assertEqual(result['search']['passed'], 11)
+        minimum = self.columns.group_by_aggregate('name', {'failed': 'min', 'passed': 'max'})
+        self.assertEqual(minimum['search'], {'failed': 3, 'passed': 7})
+        with self.assertRaises(ValueError):
+            self.columns.group_by_aggregate('name', {'passed': 'median'})
+
+    def test_group_by_none_and_mixed_keys(self):
+        """Test grouping by a column with None and mixed-type keys, which cannot be sorted."""
+        records = QList([
+            {'status': 200, 'passed': 1},
+            {'status': None, 'passed': 2},
+            {'status': '200', 'passed': 3},
+            {'status': 200, 'passed': 4},
+            {'status': None, 'passed': 5},
+        ])
+        table = records.to_columns(['status', 'passed'], use_numpy=self.use_numpy)
+        result = table.group_by_aggregate('status', {'passed': 'sum'})
+        self.assertEqual(list(result), [200, None, '200'])
+        self.assertEqual(result[200], {'passed': 5})
+        self.assertEqual(result[None], {'passed': 7})
+        self.assertEqual(result['200'], {'passed': 3})
+        self.assertEqual(list(table['status']), [200, None, '200', 200, None])
+
+
+@unittest.skipUnless(columns.numpy, "NumPy is not installed")
+class UnitTestsColumnsNumpy(UnitTestsColumns):
+    use_numpy = True
+
+    def test_numpy_arrays(self):
+        """Test that the columns are NumPy arrays and results plain Python values."""
+        self.assertIsInstance(self.columns['passed'], columns.numpy.ndarray)
+        self.assertIs(type(self.columns.sum('passed')), int)
+
+
+class UnitTestsColumnsFallback(unittest.TestCase):
+    def test_requires_numpy(self):
+        """Test that NumPy columns cannot be requested without NumPy."""
+        if columns.numpy is not None:
+            self.skipTest("NumPy is installed")
+        with self.assertRaises(ImportError):
+            QList([{'passed': 1}]).to_columns(['passed'], use_numpy=True)
+        self.assertFalse(QList([{'passed': 1}]).to_columns(['passed']).use_numpy)
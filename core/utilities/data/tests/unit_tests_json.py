@@ -1,4 +1,9 @@
 import unittest
+import datetime
+import json
+import jsonpickle
+from dataclasses import dataclass
+from core.web.services.core import json_backends
 from core.web.services.core.json import JsonObject, JsonUtility, keys_exists
 import os
 
@@ -55,6 +60,62 @@ class TestJsonUtil(unittest.TestCase):
         self.assertEqual(obj.age, 30)
 
 
+@dataclass
+class Row:
+    name: str
+    tags: tuple
+
+
+class TestJsonPrimitives(unittest.TestCase):
+    """Tests for the object-to-dict walker and the pluggable JSON backends."""
+
+    def setUp(self):
+        self.obj = JsonObject(name="café", rows=[Row("a", (1, 2)), Row("b", ())],
+                              nested=JsonObject(values={1, 2}, when=datetime.datetime(2020, 1, 1)),
+                              keyed={1: "x"}, empty=None)
+        self.backend = json_backends.backend
+
+    def tearDown(self):
+        json_backends.backend = self.backend
+
+    def test_to_primitive_matches_jsonpickle(self):
+        """Test that to_primitive() gives the same data as the jsonpickle string round trip."""
+        expected = json.loads(jsonpickle.encode(self.obj, unpicklable=False))
+        self.assertEqual(JsonUtility.to_primitive(self.obj), expected)
+        self.assertEqual(self.obj.get_dict(), expected)
+
+    def test_to_primitive_circular_reference(self):
+        """Test that circular references fall back to jsonpickle instead of recursing forever."""
+        obj = JsonObject(name="loop")
+        obj.me = obj
+        self.assertEqual(JsonUtility.to_primitive(obj)["name"], "loop")
+
+    def test_backends_round_trip(self):
+        """Test that every installed backend serializes and deserializes with type hooks."""
+        for name in json_backends.available_backends():
+            json_backends.backend = json_backends.get_backend(name)
+            raw = JsonUtility.serialize(self.obj)
+            obj = JsonUtility.deserialize(raw)
+            self.assertEqual(obj.rows[0].tags, [1, 2], name)
+            self.assertEqual(JsonUtility.deserialize(raw, type_hook=dict)["name"], "café", name)
+            with self.assertRaises(Exception):
+                JsonUtility.deserialize("{invalid")
+
+    def test_get_backend(self):
+        """Test backend selection by name."""
+        self.assertEqual(json_backends.get_backend("json").name, "json")
+        self.assertIn(json_backends.get_backend("auto").name, json_backends.available_backends())
+        with self.assertRaises(ValueError):
+            json_backends.get_backend("yaml")
+
+    def test_apply_object_hook(self):
+        """Test that hooks are applied innermost first, like json.loads(object_hook=...)."""
+        raw = '{"a": {"b": [{"c": 1}]}}'
+        expected = json.loads(raw, object_hook=JsonObject)
+        actual = json_backends.apply_object_hook(json.loads(raw), JsonObject)
+        self.assertEqual(actual.a.b[0].c, expected.a.b[0].c)
+
+
 class TestKeysExists(unittest.TestCase):
     """Tests for the keys_exists() function."""
 
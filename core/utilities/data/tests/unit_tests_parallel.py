@@ -0,0 +1,127 @@
+import threading
+import time
+import unittest
+
+from core.utilities.data import parallel
+from core.utilities.data.parallel import map_parallel
+from core.utilities.data.qlist import QList
+
+
+def square(x):
+    return x * x
+
+
+def is_even(x):
+    return x % 2 == 0
+
+
+def fail_on_multiples_of_five(x):
+    if x % 5 == 0:
+        raise ValueError(f"bad element {x}")
+    return x
+
+
+class ElementError(Exception):
+    def __init__(self, element, reason):
+        super().__init__(f"element {element}: {reason}")
+
+
+def fail_without_unpickling(x):
+    # pickles, but cannot be rebuilt in the parent: __init__ takes two arguments and gets one
+    if x % 5 == 0:
+        raise ElementError(x, "broken")
+    return x
+
+
+def unpicklable_result_on_ten(x):
+    return threading.Lock() if x == 10 else x
+
+
+class UnitTestsParallel(unittest.TestCase):
+    def setUp(self):
+        """Set up a QList instance for testing."""
+        self.list = QList(range(1, 41))
+
+    def test_select_parallel_threads(self):
+        """Test that threads return the results of select in the order of the list."""
+        self.assertEqual(self.list.select_parallel(square, workers=4, chunk_size=3), self.list.select(square))
+
+    def test_where_parallel_threads(self):
+        """Test that threads return the elements of where in the order of the list."""
+        self.assertEqual(self.list.where_parallel(is_even, workers=4), self.list.where(is_even))
+
+    def test_unordered(self):
+        """Test that unordered results are complete, in the order chunks complete."""
+        def slow_first_chunk(x):
+            if x == 1:
+                time.sleep(0.2)
+            return x
+
+        result = self.list.select_parallel(slow_first_chunk, workers=4, chunk_size=10, ordered=False)
+        self.assertCountEqual(result, self.list)
+        self.assertEqual(result[-1], 10)
+
+    def test_runs_concurrently(self):
+        """Test that chunks run on several threads."""
+        threads = set()
+
+        def record_thread(x):
+            threads.add(threading.get_ident())
+            time.sleep(0.01)
+            return x
+
+        self.list.select_parallel(record_thread, workers=4, chunk_size=5)
+        self.assertGreater(len(threads), 1)
+
+    def test_errors_are_aggregated(self):
+        """Test that every failing element is reported in one ExceptionGroup."""
+        with self.assertRaises(ExceptionGroup) as context:
+            self.list.select_parallel(fail_on_multiples_of_five, workers=3, chunk_size=4)
+        errors = context.exception.exceptions
+        self.assertEqual(len(errors), 8)
+        self.assertTrue(all(isinstance(e, ValueError) for e in errors))
+        self.assertIn("raised for element 4", errors[0].__notes__)
+
+    def test_empty_and_unknown_executor(self):
+        """Test an empty list and an unknown executor."""
+        self.assertEqual(QList().select_parallel(square), [])
+        with self.assertRaises(ValueError):
+            map_parallel(square, [1], executor='fiber')
+
+    def test_select_parallel_processes(self):
+        """Test that worker processes return the results of select and where in the order of the list."""
+        self.assertEqual(self.list.select_parallel(square, executor='process', workers=2), self.list.select(square))
+        self.assertEqual(self.list.where_parallel(is_even, executor='process', workers=2), self.list.where(is_even))
+        with self.assertRaises(ExceptionGroup):
+            self.list.select_parallel(fail_on_multiples_of_five, executor='process', workers=2)
+
+    def test_process_errors_that_cannot_be_sent_back(self):
+        """Test that element errors which cannot be unpickled and lost chunks are reported per element."""
+        with self.assertRaises(ExceptionGroup) as context:
+            self.list.select_parallel(fail_without_unpickling, executor='process', workers=2)
+        errors = context.exception.exceptions
+        self.assertEqual(len(errors), 8)
+        self.assertEqual(str(errors[0]), "ElementError: element 5: broken")
+
+        with self.assertRaises(ExceptionGroup) as context:
+            self.list.select_parallel(unpicklable_result_on_ten, executor='process', workers=2, chunk_size=4)
+        errors = context.exception.exceptions
+        self.assertEqual(len(errors), 4)
+        self.assertEqual([e.__notes__ for e in errors], [[f"raised for element {i}"] for i in range(8, 12)])
+
+    def test_one_shared_process_pool(self):
+        """Test that calls with other numbers of workers replace the shared pool, also from several threads."""
+        self.list.select_parallel(square, executor='process', workers=2)
+        first = parallel._process_client
+        self.list.select_parallel(square, executor='process', workers=3)
+        self.assertIsNot(parallel._process_client, first)
+        self.assertIsNone(first._pool)
+
+        results = []
+        threads = [threading.Thread(target=lambda w=w: results.append(
+            self.list.select_parallel(square, executor='process', workers=w))) for w in (2, 3, 2, 3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [self.list.select(square)] * 4)
@@ -1,5 +1,5 @@
 import unittest
-from core.utilities.data.qlist import QList
+from core.utilities.data.qlist import QList, QQuery, QGrouping, OrderedQList
 
 
 class UnitTestsList(unittest.TestCase):
@@ -161,3 +161,204 @@ class TestQListDictionaries(unittest.TestCase):
         youngest = self.data.min(key=lambda x: x['age'])
         oldest = self.data.max(key=lambda x: x['age'])
         self.assertEqual(youngest['age'], 23)
+
+
+class UnitTestsQQuery(unittest.TestCase):
+    def setUp(self):
+        """Set up a QList instance and a record of the elements a query reads."""
+        self.list = QList([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+        self.visited = []
+
+    def visit(self, item):
+        self.visited.append(item)
+        return item
+
+    def test_matches_eager(self):
+        """Test that a lazy chain returns the same results as the eager one."""
+        eager = self.list.where(lambda x: x % 2 == 0).select(lambda x: x * 10).distinct(lambda x: x % 40)
+        lazy = self.list.query().where(lambda x: x % 2 == 0).select(lambda x: x * 10).distinct(lambda x: x % 40)
+        self.assertIsInstance(lazy, QQuery)
+        self.assertEqual(lazy.to_list(), eager)
+        self.assertIsInstance(lazy.to_list(), QList)
+        self.assertEqual(self.list.query().select_many(lambda x: [x, -x]).take(4).to_list(), [1, -1, 2, -2])
+
+    def test_deferred(self):
+        """Test that operators do not read the source until a terminal operation."""
+        query = self.list.query().select(self.visit).where(lambda x: x > 2)
+        self.assertEqual(self.visited, [])
+        self.assertEqual(query.count(), 8)
+        self.assertEqual(len(self.visited), 10)
+
+    def test_first_short_circuits(self):
+        """Test that first and first_or_default stop at the first match."""
+        query = self.list.query().select(self.visit).where(lambda x: x > 2)
+        self.assertEqual(query.first(), 3)
+        self.assertEqual(self.visited, [1, 2, 3])
+        with self.assertRaises(StopIteration):
+            self.list.query().where(lambda x: x > 10).first()
+        self.assertEqual(self.list.query().first_or_default(lambda x: x > 10, default=0), 0)
+
+    def test_any_all_short_circuit(self):
+        """Test that any and all stop as soon as the result is known."""
+        self.assertTrue(self.list.query().select(self.visit).any(lambda x: x == 2))
+        self.assertEqual(self.visited, [1, 2])
+        self.visited.clear()
+        self.assertFalse(self.list.query().select(self.visit).all(lambda x: x < 3))
+        self.assertEqual(self.visited, [1, 2, 3])
+
+    def test_take_and_skip(self):
+        """Test that take stops reading the source and skip bypasses elements."""
+        self.assertEqual(self.list.query().select(self.visit).take(3).to_list(), [1, 2, 3])
+        self.assertEqual(self.visited, [1, 2, 3])
+        self.assertEqual(self.list.query().skip(8).to_list(), [9, 10])
+        self.assertEqual(self.list.query().take(0).to_list(), [])
+
+    def test_single(self):
+        """Test that single stops at the second match."""
+        self.assertEqual(self.list.query().single(lambda x: x == 4), 4)
+        with self.assertRaises(ValueError):
+            self.list.query().select(self.visit).single(lambda x: x > 1)
+        self.assertEqual(self.visited, [1, 2, 3])
+        self.assertIsNone(self.list.query().single_or_default(lambda x: x > 10))
+
+    def test_last_min_max(self):
+        """Test the terminal operations that read every result."""
+        query = self.list.query().where(lambda x: x % 3 == 0)
+        self.assertEqual(query.last(), 9)
+        self.assertEqual(query.last_or_default(lambda x: x > 10, default=-1), -1)
+        self.assertEqual(query.min(), 3)
+        self.assertEqual(query.max(lambda x: -x), 3)
+
+    def test_rerunnable(self):
+        """Test that a query can be run again and that operators leave the original query unchanged."""
+        base = self.list.query().where(lambda x: x > 5)
+        narrowed = base.where(lambda x: x < 8)
+        self.assertEqual(narrowed.to_list(), [6, 7])
+        self.assertEqual(base.to_list(), [6, 7, 8, 9, 10])
+        self.assertEqual(list(base), [6, 7, 8, 9, 10])
+
+
+class UnitTestsQListIndexes(unittest.TestCase):
+    def setUp(self):
+        """Set up two result sets to correlate: log documents and API rows."""
+        self.docs = QList([
+            {'id': 1, 'function': 'login', 'passed': True},
+            {'id': 2, 'function': 'search', 'passed': False},
+            {'id': 3, 'function': 'login', 'passed': False},
+            {'id': 4, 'function': 'logout', 'passed': True},
+        ])
+        self.rows = QList([
+            {'function': 'login', 'owner': 'auth'},
+            {'function': 'search', 'owner': 'catalog'},
+            {'function': 'search', 'owner': 'ranking'},
+        ])
+
+    def test_to_lookup(self):
+        """Test indexing elements by a key that is not unique."""
+        lookup = self.docs.to_lookup(lambda x: x['function'], lambda x: x['id'])
+        self.assertEqual(lookup, {'login': [1, 3], 'search': [2], 'logout': [4]})
+        self.assertIsInstance(lookup['login'], QList)
+
+    def test_to_dict(self):
+        """Test indexing elements by a unique key."""
+        by_id = self.docs.to_dict(lambda x: x['id'])
+        self.assertEqual(by_id[3]['function'], 'login')
+        with self.assertRaises(ValueError):
+            self.docs.to_dict(lambda x: x['function'])
+
+    def test_group_by(self):
+        """Test grouping elements by key, in order of first occurrence."""
+        groups = self.docs.group_by(lambda x: x['passed'], element=lambda x: x['id'])
+        self.assertIsInstance(groups[0], QGrouping)
+        self.assertEqual([(g.key, list(g)) for g in groups], [(True, [1, 4]), (False, [2, 3])])
+
+    def test_join(self):
+        """Test the inner join of two result sets."""
+        joined = self.docs.join(self.rows, lambda d: d['function'], lambda r: r['function'],
+                                lambda d, r: (d['id'], r['owner']))
+        self.assertEqual(joined, [(1, 'auth'), (2, 'catalog'), (2, 'ranking'), (3, 'auth')])
+
+    def test_group_join(self):
+        """Test correlating each element with the group of its matches."""
+        joined = self.docs.group_join(self.rows, lambda d: d['function'], lambda r: r['function'],
+                                      lambda d, rows: (d['id'], len(rows)))
+        self.assertEqual(joined, [(1, 1), (2, 2), (3, 1), (4, 0)])
+
+    def test_left_join(self):
+        """Test the left outer join, keeping elements without a match."""
+        joined = self.docs.left_join(self.rows, lambda d: d['function'], lambda r: r['function'],
+                                     lambda d, r: (d['id'], r['owner'] if r else None))
+        self.assertEqual(joined, [(1, 'auth'), (2, 'catalog'), (2, 'ranking'), (3, 'auth'), (4, None)])
+
+    def test_set_operators(self):
+        """Test union, intersect and except_ with and without a key."""
+        numbers = QList([1, 2, 2, 3, 4])
+        self.assertEqual(numbers.union([4, 5, 1, 6]), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(numbers.intersect([4, 2, 9]), [2, 4])
+        self.assertEqual(numbers.except_([1, 3]), [2, 4])
+
+        functions = self.docs.select(lambda x: x['function'])
+        called = self.rows.select(lambda x: x['function'])
+        self.assertEqual(self.docs.intersect(self.rows, key=lambda x: x['function']).select(lambda x: x['id']),
+                         [1, 2])
+        self.assertEqual(functions.except_(called), ['logout'])
+        self.assertEqual(self.docs.union(self.rows, key=lambda x: x['function']).select(lambda x: x['function']),
+                         ['login', 'search', 'logout'])
+
+
+class UnitTestsQListOrdering(unittest.TestCase):
+    def setUp(self):
+        """Set up function statistics to order."""
+        self.stats = QList([
+            {'name': 'login', 'failed': 3, 'passed': 10},
+            {'name': 'search', 'failed': 7, 'passed': 2},
+            {'name': 'logout', 'failed': 3, 'passed': 5},
+            {'name': 'upload', 'failed': 0, 'passed': 9},
+            {'name': 'export', 'failed': 7, 'passed': 2},
+        ])
+
+    def names(self, items):
+        return [x['name'] for x in items]
+
+    def test_order_by(self):
+        """Test a stable sort by one key, ascending and descending."""
+        ordered = self.stats.order_by(lambda x: x['failed'])
+        self.assertIsInstance(ordered, OrderedQList)
+        self.assertEqual(self.names(ordered), ['upload', 'login', 'logout', 'search', 'export'])
+        self.assertEqual(self.names(self.stats.order_by(lambda x: x['failed'], descending=True)),
+                         ['search', 'export', 'login', 'logout', 'upload'])
+
+    def test_then_by(self):
+        """Test secondary keys with their own direction, ties keeping the original order."""
+        ordered = self.stats.order_by(lambda x: x['failed'], descending=True).then_by(lambda x: x['passed'])
+        self.assertEqual(self.names(ordered), ['search', 'export', 'logout', 'login', 'upload'])
+        ordered = self.stats.order_by(lambda x: x['failed']).then_by(lambda x: x['passed'], descending=True) \
+            .then_by(lambda x: x['name'])
+        self.assertEqual(self.names(ordered), ['upload', 'login', 'logout', 'export', 'search'])
+
+    def test_take_and_skip(self):
+        """Test paging through the list."""
+        self.assertEqual(self.names(self.stats.take(2)), ['login', 'search'])
+        self.assertEqual(self.names(self.stats.skip(3)), ['upload', 'export'])
+        self.assertEqual(self.stats.take(-1), [])
+        self.assertEqual(len(self.stats.skip(10)), 0)
+
+    def test_take_while_and_skip_while(self):
+        """Test taking and skipping the leading elements that satisfy a condition, eager and lazy."""
+        numbers = QList([1, 2, 5, 1, 7])
+        self.assertEqual(numbers.take_while(lambda x: x < 3), [1, 2])
+        self.assertEqual(numbers.skip_while(lambda x: x < 3), [5, 1, 7])
+        visited = []
+        query = numbers.query().select(lambda x: visited.append(x) or x).take_while(lambda x: x < 3)
+        self.assertEqual(query.to_list(), [1, 2])
+        self.assertEqual(visited, [1, 2, 5])
+        self.assertEqual(numbers.query().skip_while(lambda x: x < 3).to_list(), [5, 1, 7])
+
+    def test_top_k_and_bottom_k(self):
+        """Test that the heap-based selections match a full sort and slice."""
+        slowest = self.stats.top_k(3, key=lambda x: x['failed'])
+        self.assertEqual(self.names(slowest), ['search', 'export', 'login'])
+        self.assertEqual(slowest, self.stats.order_by(lambda x: x['failed'], descending=True).take(3))
+        self.assertEqual(self.names(self.stats.bottom_k(2, key=lambda x: x['passed'])), ['search', 'export'])
+        self.assertEqual(QList([4, 1, 3]).top_k(5), [4, 3, 1])
+        self.assertEqual(QList([4, 1, 3]).bottom_k(0), [])
@@ -1,16 +1,24 @@
 import os
-import inspect
+import sys
 import logging
 import logging.config
 import yaml
 
+from core.utilities.logging.queue_logging import configure_log_queue
+
 file_name = "logging.yaml"
 
+# loggers whose level was already set by create_logger
+_leveled_loggers = set()
+
 
 def create_logger(logger_name=None):
     """
     Create a custom logger with the specified name or the name of the calling function.
 
+    The level is only set the first time a logger is returned, since Logger.setLevel clears the level cache of
+    every logger of the process.
+
     Args:
         logger_name: Optional; the name of the logger. If not provided, the name of the calling function is used.
 
@@ -18,13 +26,46 @@ def create_logger(logger_name=None):
         A logger object with the specified name.
     """
     if logger_name is None:
-        logger_name = inspect.stack()[1][3]
+        logger_name = sys._getframe(1).f_code.co_name
     new_logger = logging.getLogger(logger_name)
-    new_logger.setLevel(rootLevel)
+    if new_logger not in _leveled_loggers:
+        new_logger.setLevel(rootLevel)
+        _leveled_loggers.add(new_logger)
 
     return new_logger
 
 
+class ClassLogger:
+    """
+    A `log` attribute returning one logger per class, named after the class, created on first use and shared by
+    every instance, so frequently built objects do not create a logger each.
+
+    Assigning a logger to the attribute of an instance overrides it for that instance only; classes with
+    __slots__ need a '_logger' slot for it.
+
+    Example:
+        class Request:
+            __slots__ = ('_logger', ...)
+            log = ClassLogger()
+    """
+
+    def __init__(self):
+        self._loggers = {}
+
+    def __get__(self, instance, owner):
+        if instance is not None:
+            logger = getattr(instance, '_logger', None)
+            if logger is not None:
+                return logger
+        logger = self._loggers.get(owner)
+        if logger is None:
+            logger = self._loggers[owner] = create_logger(owner.__name__)
+        return logger
+
+    def __set__(self, instance, value):
+        instance._logger = value
+
+
 def load_logging_configuration():
     """
     Load logging configuration from a YAML file and configure the logging module.
@@ -39,6 +80,8 @@ def load_logging_configuration():
         with open(config_file_location) as config_file:
             config_dict = yaml.load(config_file, Loader=yaml.FullLoader)
             logging.config.dictConfig(config_dict)
+            # moves the configured handlers behind a bounded queue if `queue.enabled` is set
+            configure_log_queue(config_dict)
     except FileNotFoundError:
         raise FileNotFoundError(f"Logging configuration file not found: {config_file_location}")
 
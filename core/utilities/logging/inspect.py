@@ -17,9 +17,7 @@ def log_current_function(logger: Logger = None) -> str:
     Uses the inspect module to retrieve the current execution frame and its caller.
     Then extracts the function name from the caller frame and logs it.
     """
-    current_frame = inspect.currentframe()
-    caller_frame = inspect.getouterframes(current_frame)
-    function_name = caller_frame[1].function
+    function_name = inspect.currentframe().f_back.f_code.co_name
     message = f"The current function name is: {function_name}"
 
     if logger:
@@ -0,0 +1,317 @@
+"""
+Non-blocking logging through a bounded queue, enabled by the `queue` section of logging.yaml.
+
+The handlers configured in logging.yaml are moved behind one bounded queue: loggers only enqueue records, and a
+listener thread passes them to the original handlers. When the queue is full the policy decides:
+- 'drop_oldest' (default): the oldest queued record is discarded.
+- 'drop_new': the new record is discarded.
+- 'block': the logging thread waits up to block_timeout seconds, then discards the new record.
+
+BatchingFileHandler is a RotatingFileHandler that flushes once per batch instead of once per record; the listener
+flushes every handler whenever the queue runs empty, so records are written promptly when the process is idle.
+"""
+import atexit
+import logging
+import os
+import queue
+import threading
+
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+POLICIES = ('drop_oldest', 'drop_new', 'block')
+
+
+class BatchingFileHandler(RotatingFileHandler):
+    """
+    A rotating file handler that writes records through the file buffer and flushes every `capacity` records,
+    or when flush() is called, instead of after every record.
+    """
+
+    def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding=None, delay=False, errors=None,
+                 capacity: int = 256):
+        super().__init__(filename, mode=mode, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding,
+                         delay=delay, errors=errors)
+        self.capacity = capacity
+        self._pending = 0
+
+    def emit(self, record):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            self._pending += 1
+            if self._pending >= self.capacity:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self._pending = 0
+        super().flush()
+
+
+class LogQueueHandler(QueueHandler):
+    """
+    Enqueues the records of one logger for the handlers it had before the queue was installed.
+    """
+
+    def __init__(self, log_queue: "LogQueue", targets: Sequence[logging.Handler]):
+        super().__init__(log_queue.queue)
+        self.log_queue = log_queue
+        self.targets = tuple(targets)
+
+    def prepare(self, record):
+        record = super().prepare(record)
+        record.queue_targets = self.targets
+        return record
+
+    def enqueue(self, record):
+        self.log_queue.put(record)
+
+
+class LogQueueListener(QueueListener):
+    """
+    Passes queued records to the handlers they were enqueued for, and flushes them when the queue runs empty.
+    """
+
+    def __init__(self, q: queue.Queue, flush_interval: float = 1.0):
+        super().__init__(q, respect_handler_level=True)
+        self.flush_interval = flush_interval
+        self._targets: Dict[int, logging.Handler] = {}
+
+    def handle(self, record):
+        for handler in record.__dict__.pop('queue_targets', ()):
+            self._targets[id(handler)] = handler
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def flush(self):
+        for handler in list(self._targets.values()):
+            try:
+                handler.flush()
+            except Exception:
+                pass
+
+    def _monitor(self):
+        q = self.queue
+        while True:
+            try:
+                record = q.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self.flush()
+                continue
+            if record is self._sentinel:
+                self.flush()
+                break
+            self.handle(record)
+            if q.empty():
+                # end of a burst: write the batch
+                self.flush()
+
+    def enqueue_sentinel(self):
+        # a full queue must not make stop() fail; the listener is draining it
+        self.queue.put(self._sentinel)
+
+
+class LogQueue:
+    """
+    A bounded queue of log records with an overflow policy, drained by a listener thread.
+    """
+
+    def __init__(self, max_size: int = 10_000, policy: str = 'drop_oldest', block_timeout: float = 0.5,
+                 flush_interval: float = 1.0):
+        """
+        Initializes the queue and starts its listener.
+
+        Args:
+            max_size: Maximum number of records waiting for the listener.
+            policy: What to do when the queue is full: 'drop_oldest', 'drop_new' or 'block'.
+            block_timeout: Longest wait of a logging thread with the 'block' policy.
+            flush_interval: Seconds between two flushes of the handlers while no record arrives.
+
+        Raises:
+            ValueError: If the policy is unknown.
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown log queue policy '{policy}'. Available: {', '.join(POLICIES)}")
+
+        self.max_size = max_size
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.flush_interval = flush_interval
+        self.installed: List[logging.Logger] = []
+        self._handlers: Dict[str, List[logging.Handler]] = {}
+        self.stopped = False
+        self._start()
+
+    def _start(self):
+        self.queue: queue.Queue = queue.Queue(self.max_size)
+        self.listener = LogQueueListener(self.queue, self.flush_interval)
+        self._lock = threading.Lock()
+        self.enqueued = 0
+        self.dropped = 0
+        self.max_depth = 0
+        for logger in self.installed:
+            for handler in logger.handlers:
+                if isinstance(handler, LogQueueHandler):
+                    handler.queue = self.queue
+        self.listener.start()
+
+    def put(self, record: logging.LogRecord) -> bool:
+        """
+        Enqueues a record following the overflow policy.
+
+        Returns:
+            False if the record was dropped.
+        """
+        q = self.queue
+        try:
+            if self.policy == 'block':
+                q.put(record, timeout=self.block_timeout)
+            else:
+                q.put_nowait(record)
+        except queue.Full:
+            if self.policy != 'drop_oldest':
+                self._count(dropped=1)
+                return False
+            while True:
+                try:
+                    q.get_nowait()
+                    self._count(dropped=1)
+                except queue.Empty:
+                    pass
+                try:
+                    q.put_nowait(record)
+                    break
+                except queue.Full:
+                    continue
+        self._count(depth=q.qsize())
+        return True
+
+    def _count(self, dropped: int = 0, depth: int = 0):
+        with self._lock:
+            if dropped:
+                self.dropped += dropped
+            else:
+                self.enqueued += 1
+                if depth > self.max_depth:
+                    self.max_depth = depth
+
+    def install(self, loggers: Iterable[logging.Logger]):
+        """
+        Moves the handlers of loggers behind the queue.
+
+        Args:
+            loggers: The loggers, e.g. the root logger and the loggers configured in logging.yaml.
+        """
+        for logger in loggers:
+            targets = [h for h in logger.handlers if not isinstance(h, LogQueueHandler)]
+            if not targets:
+                continue
+            self._handlers[logger.name] = targets
+            for handler in targets:
+                logger.removeHandler(handler)
+            logger.addHandler(LogQueueHandler(self, targets))
+            self.installed.append(logger)
+
+    def stop(self, timeout: float = 5.0):
+        """
+        Writes the queued records, stops the listener and gives the loggers their handlers back.
+
+        Args:
+            timeout: Seconds to wait for the listener to drain the queue.
+        """
+        self.stopped = True
+        thread = self.listener._thread
+        if thread is not None:
+            self.listener.enqueue_sentinel()
+            thread.join(timeout)
+            self.listener._thread = None
+
+        for logger in self.installed:
+            for handler in [h for h in logger.handlers if isinstance(h, LogQueueHandler)]:
+                logger.removeHandler(handler)
+            for handler in self._handlers.get(logger.name, ()):
+                logger.addHandler(handler)
+        self.installed = []
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the number of enqueued and dropped records, the current and highest queue depth and the policy.
+        """
+        with self._lock:
+            return {"enqueued": self.enqueued, "dropped": self.dropped, "depth": self.queue.qsize(),
+                    "max_depth": self.max_depth, "max_size": self.max_size, "policy": self.policy}
+
+
+log_queue: Optional[LogQueue] = None
+"""The queue installed from logging.yaml, if enabled."""
+
+
+def configure_log_queue(config: Mapping[str, Any]) -> Optional[LogQueue]:
+    """
+    Installs the queue described by the `queue` section of a logging configuration, if enabled.
+
+    Example logging.yaml section:
+        queue:
+          enabled: true
+          max_size: 10000
+          policy: drop_oldest     # drop_oldest, drop_new or block
+          block_timeout: 0.5
+          flush_interval: 1.0
+
+    Args:
+        config: The logging configuration dictionary, as passed to logging.config.dictConfig.
+
+    Returns:
+        The installed queue, or None if the section is missing or disabled.
+    """
+    global log_queue
+
+    if log_queue is not None:
+        log_queue.stop()
+        log_queue = None
+
+    settings = config.get('queue') or {}
+    if not settings.get('enabled', False):
+        return None
+
+    log_queue = LogQueue(max_size=settings.get('max_size', 10_000),
+                         policy=settings.get('policy', 'drop_oldest'),
+                         block_timeout=settings.get('block_timeout', 0.5),
+                         flush_interval=settings.get('flush_interval', 1.0))
+    names = [''] + list((config.get('loggers') or {}).keys())
+    log_queue.install(logging.getLogger(name) if name else logging.getLogger() for name in names)
+    return log_queue
+
+
+def _restart_after_fork():
+    # a forked child inherits the queue but not the listener thread; queues stopped earlier stay stopped
+    if log_queue is not None and not log_queue.stopped:
+        log_queue._start()
+
+
+def _stop_at_exit():
+    if log_queue is not None:
+        log_queue.stop()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_after_fork)
+atexit.register(_stop_at_exit)
+
+
+def get_log_queue_stats() -> Optional[Dict[str, Any]]:
+    """
+    Returns the metrics of the installed log queue: enqueued and dropped records, current and highest depth.
+
+    Returns:
+        The metrics, or None if the queue is not enabled.
+    """
+    return log_queue.stats if log_queue is not None else None
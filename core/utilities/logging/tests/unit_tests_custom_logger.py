@@ -22,6 +22,18 @@ class TestLogger(unittest.TestCase):
         mock_get_logger.assert_called_with('my_custom_logger')
         self.assertEqual(logger.name, 'my_custom_logger')
 
+    def test_custom_logger_sets_level_once(self):
+        logger = create_logger('level_set_once')
+        logger.setLevel(logging.ERROR)
+        self.assertIs(create_logger('level_set_once'), logger)
+        self.assertEqual(logger.level, logging.ERROR)
+
+    def test_custom_logger_name_from_nested_caller(self):
+        def helper():
+            return create_logger()
+
+        self.assertEqual(helper().name, 'helper')
+
     def test_find_logging_config_in_cwd(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             config_path = os.path.join(tmpdir, file_name)
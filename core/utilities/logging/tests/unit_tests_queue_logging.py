@@ -0,0 +1,155 @@
+import logging
+import os
+import tempfile
+import threading
+import unittest
+
+from core.utilities.logging.queue_logging import BatchingFileHandler, LogQueue, LogQueueHandler, configure_log_queue
+
+
+class ListHandler(logging.Handler):
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.messages = []
+        self.flushes = 0
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+    def flush(self):
+        self.flushes += 1
+
+
+class TestQueueLogging(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger(f"queue-test-{self.id()}")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.DEBUG)
+        self.target = ListHandler()
+        self.logger.addHandler(self.target)
+
+    def tearDown(self):
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+
+    def test_records_reach_the_original_handlers(self):
+        log_queue = LogQueue(max_size=100)
+        log_queue.install([self.logger])
+        self.assertIsInstance(self.logger.handlers[0], LogQueueHandler)
+
+        for i in range(10):
+            self.logger.info("message %d", i)
+        log_queue.stop()
+
+        self.assertEqual(self.target.messages, [f"message {i}" for i in range(10)])
+        self.assertGreaterEqual(self.target.flushes, 1)
+        self.assertEqual(log_queue.stats["enqueued"], 10)
+        self.assertEqual(log_queue.stats["dropped"], 0)
+        # the handlers are given back
+        self.assertEqual(self.logger.handlers, [self.target])
+
+    def test_handler_level_is_respected(self):
+        self.target.setLevel(logging.WARNING)
+        log_queue = LogQueue(max_size=100)
+        log_queue.install([self.logger])
+        self.logger.info("info")
+        self.logger.warning("warning")
+        log_queue.stop()
+        self.assertEqual(self.target.messages, ["warning"])
+
+    def _fill_while_blocked(self, policy, count, max_size=3):
+        # hold the target handler so the listener cannot drain the queue
+        log_queue = LogQueue(max_size=max_size, policy=policy, block_timeout=0.01)
+        log_queue.install([self.logger])
+        self.target.acquire()
+        try:
+            self.logger.info("first")
+            while log_queue.stats["depth"]:
+                pass
+            for i in range(count):
+                self.logger.info("message %d", i)
+        finally:
+            self.target.release()
+        log_queue.stop()
+        return log_queue
+
+    def test_drop_new(self):
+        log_queue = self._fill_while_blocked('drop_new', 5)
+        self.assertEqual(self.target.messages, ["first", "message 0", "message 1", "message 2"])
+        self.assertEqual(log_queue.stats["dropped"], 2)
+        self.assertEqual(log_queue.stats["max_depth"], 3)
+
+    def test_drop_oldest(self):
+        log_queue = self._fill_while_blocked('drop_oldest', 5)
+        self.assertEqual(self.target.messages, ["first", "message 2", "message 3", "message 4"])
+        self.assertEqual(log_queue.stats["dropped"], 2)
+
+    def test_block_drops_after_timeout(self):
+        log_queue = self._fill_while_blocked('block', 4)
+        self.assertEqual(log_queue.stats["dropped"], 1)
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            LogQueue(policy='spill')
+
+    def test_configure_from_yaml_section(self):
+        self.assertIsNone(configure_log_queue({"queue": {"enabled": False}}))
+        log_queue = configure_log_queue({"queue": {"enabled": True, "max_size": 50},
+                                         "loggers": {self.logger.name: {}}})
+        try:
+            self.assertIsInstance(self.logger.handlers[0], LogQueueHandler)
+            self.assertEqual(log_queue.max_size, 50)
+        finally:
+            configure_log_queue({})
+        self.assertEqual(self.logger.handlers, [self.target])
+
+    @unittest.skipUnless(hasattr(os, 'fork'), "requires os.fork")
+    def test_stopped_queues_do_not_restart_after_fork(self):
+        for _ in range(3):
+            configure_log_queue({"queue": {"enabled": True}, "loggers": {self.logger.name: {}}})
+        configure_log_queue({})
+        # only the listener of the current queue is restarted in a forked child
+        self.assertEqual(self.threads_in_forked_child(), 1)
+
+        configure_log_queue({"queue": {"enabled": True}, "loggers": {self.logger.name: {}}})
+        try:
+            self.assertEqual(self.threads_in_forked_child(), 2)
+        finally:
+            configure_log_queue({})
+
+    @staticmethod
+    def threads_in_forked_child() -> int:
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read)
+            os.write(write, str(threading.active_count()).encode())
+            os._exit(0)
+        os.close(write)
+        with os.fdopen(read) as pipe:
+            count = int(pipe.read())
+        os.waitpid(pid, 0)
+        return count
+
+
+class TestBatchingFileHandler(unittest.TestCase):
+    def test_flushes_per_batch(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "batch.log")
+            handler = BatchingFileHandler(path, capacity=3)
+            record = logging.LogRecord("batch", logging.INFO, __file__, 1, "line", None, None)
+
+            handler.emit(record)
+            handler.emit(record)
+            self.assertEqual(os.path.getsize(path), 0)
+            handler.emit(record)
+            with open(path) as f:
+                self.assertEqual(f.read().splitlines(), ["line"] * 3)
+            handler.emit(record)
+            handler.close()
+            with open(path) as f:
+                self.assertEqual(len(f.read().splitlines()), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,19 +1,109 @@
 import multiprocessing as mp
+import pickle
 import psutil
 from queue import Empty
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
 
 from core.utilities.logging.custom_logger import create_logger
 
 
+class TaskResult:
+    """
+    The outcome of one task run by MultiProcessingClient.iter_tasks.
+    """
+    __slots__ = ("index", "task", "result", "error")
+
+    def __init__(self, index: int, task: Any, result: Any = None, error: Optional[BaseException] = None):
+        self.index = index
+        self.task = task
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self):
+        outcome = f"error={self.error!r}" if self.error is not None else f"result={self.result!r}"
+        return f"{self.__class__.__name__}(index={self.index}, {outcome})"
+
+
+def run_task(job: Tuple[int, Callable[[Any], Any], Any]) -> Tuple[int, bool, Any]:
+    """
+    Runs one task in a worker, returning its exception instead of raising it so the other tasks go on.
+
+    Args:
+        job: The index of the task, the function and the task.
+
+    Returns:
+        The index, whether the task succeeded, and its result or exception.
+    """
+    index, func, task = job
+    try:
+        return index, True, func(task)
+    except Exception as e:
+        return index, False, portable_exception(e)
+
+
+def portable_exception(error: BaseException) -> BaseException:
+    """
+    Returns an exception that can be sent from a worker to the parent process.
+
+    An exception that cannot be pickled, or that is pickled but cannot be rebuilt (e.g. its __init__ takes
+    arguments it does not pass to Exception.__init__), would kill the result handler of the pool in the parent.
+
+    Args:
+        error: The exception raised by a task.
+
+    Returns:
+        The exception itself, or a RuntimeError with its type name and message.
+    """
+    try:
+        pickle.loads(pickle.dumps(error))
+    except Exception:
+        return RuntimeError(f"{error.__class__.__name__}: {error}")
+    return error
+
+
+def run_tasks(jobs: List[Tuple[int, Callable[[Any], Any], Any]]) -> List[Tuple[int, bool, Any]]:
+    """
+    Runs a chunk of tasks in a worker with run_task.
+    """
+    return [run_task(job) for job in jobs]
+
+
+def auto_chunksize(task_count: int, worker_count: int) -> int:
+    """
+    Returns the chunk size Pool.map would pick: about 4 chunks per worker.
+    """
+    chunksize, extra = divmod(task_count, worker_count * 4)
+    return max(1, chunksize + bool(extra))
+
+
 class MultiProcessingClient:
     """
     Multiprocessing helper that runs a function over a list of tasks in parallel.
 
     Defaults to Pool.map_async over self.tasks (no mp.Queue/Lock created).
     If you truly need queue-based consumption, pass use_legacy_queue=True.
+
+    By default every execute_tasks call starts a pool and tears it down. With persistent=True the pool is started
+    on first use and reused by every execute_tasks and iter_tasks call until close(), so repeated small batches
+    do not pay the start-up of the worker processes each time.
     """
 
-    def __init__(self, tasks: list, worker_count=None, *, use_legacy_queue: bool = False):
+    def __init__(self, tasks: list, worker_count=None, *, use_legacy_queue: bool = False, persistent: bool = False,
+                 max_tasks_per_child: Optional[int] = None, start_method: str = "spawn"):
+        """
+        Args:
+            tasks: The default tasks of execute_tasks and iter_tasks.
+            worker_count: The number of worker processes. Defaults to the number of CPUs.
+            use_legacy_queue: Whether to create the mp.Queue/Lock used by worker_wrapper.
+            persistent: Whether to keep the pool between calls, until close().
+            max_tasks_per_child: The number of tasks after which a worker process is replaced, to release memory
+                                 leaked by long-running tasks. Defaults to never.
+            start_method: The multiprocessing start method of the workers.
+        """
         self.log = create_logger(self.__class__.__name__)
         cpu = psutil.cpu_count() or 1
         self.worker_count = int(worker_count) if worker_count else cpu
@@ -22,6 +112,11 @@ class MultiProcessingClient:
         self.output_list: list = []
         self.func = None
 
+        self.persistent = bool(persistent)
+        self.max_tasks_per_child = max_tasks_per_child
+        self.start_method = start_method
+        self._pool = None
+
         # Legacy fields: ONLY create if explicitly requested
         self.queue = None
         self.lock = None
@@ -30,6 +125,12 @@ class MultiProcessingClient:
         if self._use_legacy_queue:
             self._init_legacy_queue()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def _init_legacy_queue(self):
         # Create legacy primitives only when needed
         self.queue = mp.Queue()
@@ -37,11 +138,7 @@ class MultiProcessingClient:
         for task in self.tasks:
             self.queue.put(task)
 
-    def close(self):
-        """
-        Explicitly release legacy multiprocessing primitives (if created).
-        Safe to call multiple times.
-        """
+    def _close_legacy_queue(self):
         if self.queue is not None:
             try:
                 self.queue.close()
@@ -52,52 +149,170 @@ class MultiProcessingClient:
 
         self.lock = None
 
-    def execute_tasks(self, func, timeout_secs: int | None = None):
+    def close(self):
+        """
+        Explicitly release legacy multiprocessing primitives (if created) and the persistent pool (if started).
+        Safe to call multiple times.
+        """
+        self._close_legacy_queue()
+
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            pool.close()
+            pool.join()
+
+    def _acquire_pool(self) -> Tuple[Any, bool]:
+        # returns the pool to use, and whether the caller owns it and must release it
+        if self.persistent:
+            if self._pool is None:
+                self._pool = self._create_pool()
+            return self._pool, False
+        return self._create_pool(), True
+
+    def _create_pool(self):
+        ctx = mp.get_context(self.start_method)
+        return ctx.Pool(processes=self.worker_count, maxtasksperchild=self.max_tasks_per_child)
+
+    def _release_pool(self, pool, owned: bool, failed: bool):
+        if not owned:
+            if failed and pool is self._pool:
+                # workers may be stuck on a timed out task: replace the pool on next use
+                self._pool = None
+                pool.terminate()
+                pool.join()
+            return
+
+        if failed:
+            pool.terminate()
+        else:
+            pool.close()
+        pool.join()
+
+        # Extra safety: reap any leftover children quickly
+        try:
+            for p in mp.active_children():
+                p.join(timeout=0.1)
+        except Exception:
+            pass
+
+    def execute_tasks(self, func, timeout_secs: int | None = None, *, tasks: Optional[Iterable[Any]] = None,
+                      chunksize: Optional[int] = None, return_exceptions: bool = False):
         """
         Executes tasks in parallel using Pool.map_async over self.tasks.
 
         Args:
             func: Top-level callable (must be picklable). Signature: func(task) -> result
             timeout_secs: Optional hard timeout for the whole batch.
+            tasks: Tasks to run instead of self.tasks, e.g. the next batch on a persistent pool.
+            chunksize: Number of tasks sent to a worker at once. Defaults to about 4 chunks per worker.
+            return_exceptions: Whether a failing task puts its exception in the results instead of failing the batch.
 
         Returns:
-            list: results in the same order as self.tasks
+            list: results in the same order as the tasks
         """
         if not callable(func):
             raise TypeError("func must be callable")
 
+        tasks = self.tasks if tasks is None else list(tasks)
+        chunksize = chunksize or auto_chunksize(len(tasks), self.worker_count)
         self.func = func
         self.output_list = []
 
-        ctx = mp.get_context("spawn")
-        pool = ctx.Pool(processes=self.worker_count)
-
+        pool, owned = self._acquire_pool()
+        # only a timeout leaves workers busy; after a task exception every other task has completed
+        timed_out = False
         try:
-            async_result = pool.map_async(func, self.tasks)
+            if return_exceptions:
+                jobs = [(index, func, task) for index, task in enumerate(tasks)]
+                async_result = pool.map_async(run_task, jobs, chunksize)
+            else:
+                async_result = pool.map_async(func, tasks, chunksize)
             results = async_result.get(timeout=timeout_secs) if timeout_secs else async_result.get()
 
+            if return_exceptions:
+                results = [value for _, _, value in results]
             self.output_list.extend(results)
-
-            pool.close()
-            pool.join()
             return self.output_list
 
+        except mp.TimeoutError:
+            timed_out = True
+            self.log.exception("Multiprocessing execution timed out; terminating pool")
+            raise
+
         except Exception:
-            self.log.exception("Multiprocessing execution failed; terminating pool")
-            pool.terminate()
-            pool.join()
+            self.log.exception("Multiprocessing execution failed")
             raise
 
         finally:
+            self._release_pool(pool, owned, failed=timed_out)
             # If legacy queue was created, ensure it can't keep pytest alive
-            self.close()
+            self._close_legacy_queue()
 
-            # Extra safety: reap any leftover children quickly
-            try:
-                for p in mp.active_children():
-                    p.join(timeout=0.1)
-            except Exception:
-                pass
+    def iter_tasks(self, func, tasks: Optional[Iterable[Any]] = None, *, ordered: bool = False,
+                   chunksize: Optional[int] = None, task_timeout: Optional[float] = None) -> Iterator[TaskResult]:
+        """
+        Runs tasks in parallel and yields the outcome of each task as soon as it is available.
+
+        A failing task is reported in its TaskResult and does not stop the others.
+
+        Args:
+            func: Top-level callable (must be picklable). Signature: func(task) -> result
+            tasks: Tasks to run instead of self.tasks.
+            ordered: Whether to yield in the order of the tasks (Pool.imap) or as they complete (Pool.imap_unordered).
+            chunksize: Number of tasks sent to a worker at once. Defaults to about 4 chunks per worker; use 1 for
+                       long tasks so that each result is yielded as soon as it is ready.
+            task_timeout: Longest wait in seconds for the next chunk of results; with chunksize=1, for the next task.
+                          When it expires the pool is terminated and every task without a result is reported with a
+                          TimeoutError.
+
+        Yields:
+            A TaskResult per task.
+        """
+        if not callable(func):
+            raise TypeError("func must be callable")
+
+        tasks = self.tasks if tasks is None else list(tasks)
+        if not tasks:
+            return
+        chunksize = chunksize or auto_chunksize(len(tasks), self.worker_count)
+        jobs = [(index, func, task) for index, task in enumerate(tasks)]
+        pending = set(range(len(tasks)))
+
+        # chunks are sent as single items, so that the results come back through an iterator with a timeout
+        chunks = [jobs[start:start + chunksize] for start in range(0, len(jobs), chunksize)]
+
+        pool, owned = self._acquire_pool()
+        results = (pool.imap if ordered else pool.imap_unordered)(run_tasks, chunks)
+        # an error that lost the results of a whole chunk, e.g. an unpicklable result
+        chunk_error: Optional[BaseException] = None
+        try:
+            while True:
+                try:
+                    outcomes = results.next(task_timeout)
+                except StopIteration:
+                    break
+                except mp.TimeoutError:
+                    chunk_error = TimeoutError(f"No task completed within {task_timeout} seconds")
+                    break
+                except Exception as e:
+                    self.log.exception("A chunk of tasks failed")
+                    chunk_error = e
+                    continue
+
+                for index, succeeded, value in outcomes:
+                    pending.discard(index)
+                    yield TaskResult(index, tasks[index], result=value) if succeeded \
+                        else TaskResult(index, tasks[index], error=value)
+
+            for index in sorted(pending):
+                yield TaskResult(index, tasks[index], error=chunk_error or RuntimeError("Task result was lost"))
+            pending.clear()
+
+        finally:
+            # a timeout may have left workers stuck; when the caller stops early, the tasks left finish on a
+            # persistent pool, and an own pool is terminated
+            timed_out = isinstance(chunk_error, TimeoutError)
+            self._release_pool(pool, owned, failed=timed_out or (owned and bool(pending)))
 
     def worker_wrapper(self, func, args):
         """
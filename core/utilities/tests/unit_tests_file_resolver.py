@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest.mock import patch
+
+from core.utilities.contracts.file import FileResolver
+
+
+class UnitTestsFileResolver(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.directory.name)
+        self.base = self.root / 'a' / 'b'
+        self.base.mkdir(parents=True)
+        (self.root / 'config.yaml').write_text('x: 1')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_found_in_parent_and_memoized(self):
+        resolver = FileResolver(revalidate_after=60)
+        self.assertEqual(resolver.find(self.base, 'config.yaml'), self.root / 'config.yaml')
+
+        with patch('os.stat', side_effect=AssertionError('no syscalls')), \
+                patch.object(Path, 'exists', side_effect=AssertionError('no syscalls')):
+            self.assertEqual(resolver.find(self.base, 'config.yaml'), self.root / 'config.yaml')
+        self.assertEqual(resolver.stats["hits"], 1)
+
+    def test_negative_result_is_cached(self):
+        resolver = FileResolver(revalidate_after=60)
+        self.assertIsNone(resolver.find(self.base, 'missing.yaml'))
+        with patch.object(Path, 'exists', side_effect=AssertionError('no syscalls')):
+            self.assertIsNone(resolver.find(self.base, 'missing.yaml'))
+
+    def test_directory_change_invalidates(self):
+        resolver = FileResolver(revalidate_after=0)
+        self.assertEqual(resolver.find(self.base, 'config.yaml'), self.root / 'config.yaml')
+        self.assertEqual(resolver.find(self.base, 'config.yaml'), self.root / 'config.yaml')
+        self.assertEqual(resolver.stats["revalidations"], 1)
+
+        # a closer file shadows the one found before
+        closer = self.root / 'a' / 'config.yaml'
+        closer.write_text('x: 2')
+        os.utime(closer.parent, ns=(1, 1))
+        self.assertEqual(resolver.find(self.base, 'config.yaml'), closer)
+
+        self.assertIsNone(resolver.find(self.base, 'later.yaml'))
+        (self.base / 'later.yaml').write_text('')
+        os.utime(self.base, ns=(2, 2))
+        self.assertEqual(resolver.find(self.base, 'later.yaml'), self.base / 'later.yaml')
+
+    def test_index_needs_no_syscalls(self):
+        resolver = FileResolver(revalidate_after=0)
+        resolver.index(self.root)
+        with patch('os.stat', side_effect=AssertionError('no syscalls')), \
+                patch.object(Path, 'exists', side_effect=AssertionError('no syscalls')):
+            self.assertEqual(resolver.find(self.base, 'config.yaml'), self.root / 'config.yaml')
+            self.assertEqual(resolver.find(self.base, 'config.yaml'), self.root / 'config.yaml')
@@ -1,11 +1,40 @@
+import os
+import time
 import unittest
-from core.utilities.multiprocess import MultiProcessingClient
+from core.utilities.multiprocess import MultiProcessingClient, auto_chunksize
 
 
 def sample_task(x):
     return x * x
 
 
+def failing_task(x):
+    if x % 3 == 0:
+        raise ValueError(f"bad task {x}")
+    return x
+
+
+class TaskError(Exception):
+    def __init__(self, task, reason):
+        super().__init__(f"task {task}: {reason}")
+        self.task = task
+        self.reason = reason
+
+
+def unpicklable_failure(x):
+    # pickles, but cannot be rebuilt in the parent: __init__ takes two arguments and gets one
+    raise TaskError(x, "broken")
+
+
+def slow_task(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def worker_pid(_):
+    return os.getpid()
+
+
 class TestMultiProcessingClient(unittest.TestCase):
     def test_execute_tasks(self):
         tasks = [1, 2, 3, 4, 5, 6, 7, 8]
@@ -13,4 +42,67 @@ class TestMultiProcessingClient(unittest.TestCase):
         client.execute_tasks(sample_task, )
         results = client.get_tasks_output()
         expected_results = [1, 4, 9, 16, 25, 36, 49, 64]
-        self.assertCountEqual(results, expected_results)
\ No newline at end of file
+        self.assertCountEqual(results, expected_results)
+
+    def test_persistent_pool_is_reused(self):
+        with MultiProcessingClient([1, 2, 3], worker_count=2, persistent=True) as client:
+            self.assertEqual(client.execute_tasks(sample_task), [1, 4, 9])
+            pool = client._pool
+            self.assertEqual(client.execute_tasks(sample_task, tasks=[4, 5]), [16, 25])
+            self.assertEqual(sorted(r.result for r in client.iter_tasks(sample_task, [6, 7])), [36, 49])
+            self.assertIs(client._pool, pool)
+        self.assertIsNone(client._pool)
+
+    def test_iter_tasks_reports_failures_per_task(self):
+        with MultiProcessingClient(list(range(1, 10)), worker_count=2, persistent=True) as client:
+            results = sorted(client.iter_tasks(failing_task, chunksize=2), key=lambda r: r.index)
+            self.assertEqual([r.result for r in results if r.ok], [1, 2, 4, 5, 7, 8])
+            errors = [r for r in results if not r.ok]
+            self.assertEqual([r.task for r in errors], [3, 6, 9])
+            self.assertIsInstance(errors[0].error, ValueError)
+
+            ordered = list(client.iter_tasks(sample_task, [3, 1, 2], ordered=True))
+            self.assertEqual([r.result for r in ordered], [9, 1, 4])
+
+            with_errors = client.execute_tasks(failing_task, tasks=[2, 3], return_exceptions=True)
+            self.assertEqual(with_errors[0], 2)
+            self.assertIsInstance(with_errors[1], ValueError)
+
+    def test_exceptions_that_cannot_be_rebuilt(self):
+        with MultiProcessingClient([1, 2], worker_count=2, persistent=True) as client:
+            results = sorted(client.iter_tasks(unpicklable_failure, task_timeout=30), key=lambda r: r.index)
+            self.assertEqual([type(r.error) for r in results], [RuntimeError, RuntimeError])
+            self.assertEqual(str(results[0].error), "TaskError: task 1: broken")
+
+            errors = client.execute_tasks(unpicklable_failure, return_exceptions=True, timeout_secs=30)
+            self.assertEqual(str(errors[1]), "TaskError: task 2: broken")
+
+    def test_task_exception_keeps_persistent_pool(self):
+        with MultiProcessingClient([1, 2, 3], worker_count=2, persistent=True) as client:
+            client.execute_tasks(sample_task)
+            pool = client._pool
+            with self.assertRaises(ValueError):
+                client.execute_tasks(failing_task)
+            self.assertIs(client._pool, pool)
+            self.assertEqual(client.execute_tasks(sample_task, tasks=[4]), [16])
+
+    def test_task_timeout(self):
+        with MultiProcessingClient([], worker_count=2, persistent=True) as client:
+            # start the workers before timing the tasks
+            client.execute_tasks(sample_task, tasks=[1, 2])
+            results = sorted(client.iter_tasks(slow_task, [0, 30], chunksize=1, task_timeout=2),
+                             key=lambda r: r.index)
+            self.assertTrue(results[0].ok)
+            self.assertIsInstance(results[1].error, TimeoutError)
+            # the pool with the stuck worker is replaced
+            self.assertIsNone(client._pool)
+            self.assertEqual(client.execute_tasks(sample_task, tasks=[3]), [9])
+
+    def test_max_tasks_per_child(self):
+        with MultiProcessingClient([0] * 4, worker_count=1, persistent=True, max_tasks_per_child=1) as client:
+            self.assertEqual(len(set(client.execute_tasks(worker_pid, chunksize=1))), 4)
+
+    def test_auto_chunksize(self):
+        self.assertEqual(auto_chunksize(0, 4), 1)
+        self.assertEqual(auto_chunksize(100, 4), 7)
+        self.assertEqual(auto_chunksize(10_000, 8), 313)
@@ -0,0 +1,193 @@
+import asyncio
+import functools
+
+from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar, Type, Dict, Iterable, AsyncIterator, Union
+
+from core.utilities.logging.custom_logger import ClassLogger
+
+from core.web.services.core.contracts.client import IAsyncWebClient
+from core.web.services.core.contracts.request import IWebServiceRequest
+from core.web.services.core.clients.base import BaseWebClient
+from core.web.services.core.response import IResponse
+
+
+TResponseData = TypeVar('TResponseData')
+
+
+class AsyncBaseWebClient(IAsyncWebClient, ABC):
+    """
+    A base class for an asyncio web client that implements the IAsyncWebClient interface.
+
+    Requests are sent through the synchronous client defined by `client_class` on a bounded pool of worker
+    threads, so the event loop is never blocked on sockets while sessions, response processing and the
+    `Response` deserialization contract stay exactly the same as the synchronous clients. The worker threads share
+    the synchronous client and its session, so read the outcome of a request from the response it returned, e.g.
+    get_errors(response), rather than from the last response of the client.
+    """
+
+    client_class: Type[BaseWebClient] = None
+    log = ClassLogger()
+
+    def __init__(self, base_url: str, *, max_concurrency: int = 10, **kwargs):
+        """
+        Initializes the AsyncBaseWebClient with the given configuration.
+
+        Args:
+            base_url: The base URL for the web service.
+            max_concurrency: The maximum number of requests in flight at any time. Defaults to 10.
+            **kwargs: Additional keyword arguments passed to the synchronous client, e.g. from
+                      AppConfigWSClient.parameters.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        if 'logger' in kwargs:
+            self.log = kwargs['logger']
+
+        self.client = self.client_class(base_url, **kwargs)
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency,
+                                            thread_name_prefix=self.__class__.__name__)
+
+        self.kwargs = kwargs
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def set_request_timeout(self, timeout: int) -> None:
+        """
+        Sets the timeout for the requests.
+
+        Args:
+            timeout: The timeout in seconds.
+        """
+        self.client.set_request_timeout(timeout)
+
+    def set_session_cookies(self, cookies: Dict[str, str]) -> None:
+        """
+        Sets the cookies for the session if a session is being used.
+
+        Args:
+            cookies: A dictionary of cookies to be added to the session.
+        """
+        self.client.set_session_cookies(cookies)
+
+    def set_cookie_handler(self, cookies: Dict[str, str]) -> None:
+        """
+        Sets the cookie handler for the requests.
+
+        Args:
+            cookies: A dictionary of cookies to be sent with the requests.
+        """
+        self.client.set_cookie_handler(cookies)
+
+    def set_proxies(self, proxies: Dict[str, str]) -> None:
+        """
+        Sets proxies for the requests.
+
+        Args:
+            proxies: A dictionary of proxies to be sent with the requests.
+        """
+        self.client.set_proxies(proxies)
+
+    async def execute_request(self, r: IWebServiceRequest, response_hook: Type[TResponseData] = dict, **kwargs) \
+            -> IResponse[TResponseData]:
+        """
+        Executes a web service request without blocking the event loop and returns the response.
+
+        Args:
+            r: The web service request to be executed, e.g. from RequestBuilder.build().
+            response_hook: The type to deserialize the response data into.
+            **kwargs: Additional keyword arguments to be passed to the request method.
+
+        Return:
+            An instance of IResponse containing the response data.
+        """
+        loop = asyncio.get_running_loop()
+        send = functools.partial(self.client.execute_request, r, response_hook, **kwargs)
+
+        return await loop.run_in_executor(self._executor, send)
+
+    async def execute_many(self, requests: Iterable[IWebServiceRequest], response_hook: Type[TResponseData] = dict,
+                           max_concurrency: int = None, *, return_exceptions: bool = False, **kwargs) \
+            -> AsyncIterator[Union[IResponse[TResponseData], BaseException]]:
+        """
+        Executes web service requests concurrently and yields each response as soon as it completes.
+
+        Requests are pulled from `requests` lazily, so at most `max_concurrency` of them are in flight
+        (and in memory) at any time. Responses are yielded in completion order, not submission order.
+
+        Args:
+            requests: The web service requests to be executed.
+            response_hook: The type to deserialize the response data into.
+            max_concurrency: The maximum number of requests in flight. Defaults to the client's
+                             max_concurrency, which is also the upper bound: the client has no more worker threads.
+            return_exceptions: If True, a failed request yields its exception instead of stopping the stream.
+            **kwargs: Additional keyword arguments to be passed to the request method.
+
+        Return:
+            An async iterator of IResponse instances.
+
+        Raises:
+            ValueError: If max_concurrency is below 1 or above the client's max_concurrency.
+        """
+        limit = self.max_concurrency if max_concurrency is None else max_concurrency
+        if limit < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if limit > self.max_concurrency:
+            raise ValueError(f"max_concurrency cannot exceed the client's max_concurrency of {self.max_concurrency}")
+
+        pending_requests = iter(requests)
+        in_flight = set()
+
+        def _fill():
+            while len(in_flight) < limit:
+                try:
+                    request = next(pending_requests)
+                except StopIteration:
+                    return
+                in_flight.add(asyncio.ensure_future(self.execute_request(request, response_hook, **kwargs)))
+
+        _fill()
+        try:
+            while in_flight:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                in_flight.difference_update(done)
+
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        yield task.result()
+                    elif return_exceptions:
+                        yield error
+                    else:
+                        raise error
+
+                _fill()
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    def get_errors(self, response: IResponse = None):
+        """
+        Returns the errors of a response processed by the underlying client.
+
+        Args:
+            response: The response to read the errors of. Pass it when requests run concurrently: the default, the
+                      last response processed, may belong to another request in flight.
+        """
+        return self.client.get_errors(response)
+
+    async def close(self):
+        """
+        Shuts down the worker threads and closes the session of the underlying client.
+        Safe to call multiple times.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self.client.session is not None:
+            self.client.session.close()
@@ -0,0 +1,10 @@
+from core.web.services.core.clients.async_base import AsyncBaseWebClient
+from core.web.services.core.clients.graphql import GraphQLClient
+
+
+class AsyncGraphQLClient(AsyncBaseWebClient):
+    """
+    An asyncio GraphQL web client that implements the IAsyncWebClient interface.
+    Requests and responses are processed by a GraphQLClient, so response data is read from the 'data' key.
+    """
+    client_class = GraphQLClient
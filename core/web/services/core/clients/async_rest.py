@@ -0,0 +1,10 @@
+from core.web.services.core.clients.async_base import AsyncBaseWebClient
+from core.web.services.core.clients.rest import RestClient
+
+
+class AsyncRestClient(AsyncBaseWebClient):
+    """
+    An asyncio REST web client that implements the IAsyncWebClient interface.
+    Requests and responses are processed by a RestClient.
+    """
+    client_class = RestClient
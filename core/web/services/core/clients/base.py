@@ -1,34 +1,32 @@
 import requests, time
 import urllib.parse as url_helper
-import socket
 
 from abc import ABC
-from typing import TypeVar, Type, Dict
+from http import HTTPStatus
+from typing import TypeVar, Type, Dict, Optional
 
-from core.utilities.logging.custom_logger import create_logger
+from core.utilities.logging.custom_logger import ClassLogger
 
+from core.web.services.core.clients.cache import CacheSettings, HttpCache, cookie_header, get_cache
+from core.web.services.core.clients.rate_limit import RateLimiter, RateLimitSettings, get_rate_limiter
+from core.web.services.core.clients.retry import RetryPolicy
+from core.web.services.core.clients.pool import PoolSettings, ConnectionStats, PooledTransport, \
+    create_pooled_session, default_transport
 from core.web.services.core.contracts.client import IWebClient
 from core.web.services.core.contracts.request import IWebServiceRequest
 from core.web.services.core.response import IResponse, Response
+from core.web.services.core.stream import iter_response_chunks
 
 
 TResponseData = TypeVar('TResponseData')
 
 
-def _force_ipv4():
-    import urllib3.util.connection as urllib3_conn
-
-    def ipv4_only():
-        return socket.AF_INET
-
-    urllib3_conn.allowed_gai_family = ipv4_only
-
-
 class BaseWebClient(IWebClient, ABC):
     """
     A base class for a web client that implements the IWebClient interface.
     This class provides common functionality for sending HTTP requests and processing responses.
     """
+    log = ClassLogger()
 
     def __init__(self, base_url: str, *, response_encoding: str = "ascii", verify: bool = True,
                  use_session: bool = False, timeout: int = 5, **kwargs):
@@ -39,14 +37,37 @@ class BaseWebClient(IWebClient, ABC):
             base_url: The base URL for the web service.
             response_encoding: The encoding to use for the response data. Defaults to 'ascii'.
             verify: Whether to verify SSL certificates. Defaults to True.
-            use_session: Whether to use a session for making requests. Defaults to False.
+            use_session: Whether to use a dedicated session for making requests, e.g. to keep cookies.
+                         Defaults to False, which uses the process-wide pooled session of the host.
             timeout: The timeout in seconds for the requests. Defaults to 5.
+            **kwargs: Pool settings (pool_connections, pool_maxsize, pool_block, keep_alive, idle_timeout),
+                      'decode_bytes' to parse response bytes without decoding them to a string first,
+                      'stream' to read response bodies lazily by default (see Response.iter_data) with
+                      'stream_chunk_size' bytes at a time, 'cache' to enable the HTTP cache (True, a mapping of
+                      CacheSettings or an HttpCache), 'rate_limit' (a mapping of RateLimitSettings or a
+                      RateLimiter), 'retry' (a mapping of RetryPolicy or a RetryPolicy), an optional 'transport'
+                      (PooledTransport) and 'logger'.
         """
-        self.log = kwargs.get('logger', create_logger(self.__class__.__name__))
-
-        self.session = requests.Session() if use_session else None
+        if 'logger' in kwargs:
+            self.log = kwargs['logger']
+
+        self.pool_settings = PoolSettings.from_parameters(kwargs)
+        self.transport: PooledTransport = kwargs.get('transport', default_transport)
+        self._session_stats = ConnectionStats()
+        cache = kwargs.get('cache')
+        self.cache: Optional[HttpCache] = cache if isinstance(cache, HttpCache) \
+            else get_cache(CacheSettings.from_parameters(kwargs))
+        self.session = create_pooled_session(self.pool_settings, self._session_stats) if use_session else None
+        rate_limit = kwargs.get('rate_limit')
+        self.rate_limiter: Optional[RateLimiter] = rate_limit if isinstance(rate_limit, RateLimiter) \
+            else get_rate_limiter(RateLimitSettings.from_parameters(kwargs))
+        retry = kwargs.get('retry')
+        self.retry_policy: RetryPolicy = retry if isinstance(retry, RetryPolicy) else RetryPolicy.from_parameters(kwargs)
         self.base_url = base_url.rstrip('/')
         self.response_encoding = response_encoding
+        self.decode_bytes = bool(kwargs.get('decode_bytes', False))
+        self.stream = bool(kwargs.get('stream', False))
+        self.stream_chunk_size = int(kwargs.get('stream_chunk_size') or 64 * 1024)
         self.verify = verify
         self.timeout = timeout
         self.cookies = {}
@@ -92,6 +113,28 @@ class BaseWebClient(IWebClient, ABC):
         """
         self.proxies = proxies
 
+    @property
+    def connection_stats(self) -> Dict[str, int]:
+        """
+        Returns the reused vs new connection counters for this client's host.
+
+        Returns:
+            A dictionary with 'new', 'reused' and 'total' connection checkouts.
+        """
+        if self.session is not None:
+            return self._session_stats.snapshot()
+        return self.transport.stats(url_helper.urlsplit(self.base_url).netloc)
+
+    @property
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        Returns the counters of the HTTP cache used by this client, shared with clients configured alike.
+
+        Returns:
+            A dictionary with 'hits', 'misses', 'revalidations', 'stores' and 'evictions', empty if caching is off.
+        """
+        return self.cache.stats.snapshot() if self.cache is not None else {}
+
     def execute_request(self, r: IWebServiceRequest, response_hook: Type[TResponseData] = dict, rate_limit_delay = 0,
                         **kwargs) \
             -> IResponse[TResponseData]:
@@ -101,57 +144,107 @@ class BaseWebClient(IWebClient, ABC):
         Args:
             r: The web service request to be executed.
             response_hook: The type to deserialize the response data into.
-            rate_limit_delay: Optional delay in seconds to respect rate limiting.
-            **kwargs: Additional keyword arguments to be passed to the request method.
+            rate_limit_delay: Optional fixed delay in seconds before sending; prefer the 'rate_limit' parameter,
+                              which only waits as long as the quota requires.
+            **kwargs: Additional keyword arguments to be passed to the request method,
+                      e.g. stream=True to read the body lazily.
 
         Return:
             An instance of IResponse containing the response data.
         """
-        session = self.session or requests
+        if rate_limit_delay:
+            time.sleep(rate_limit_delay)
+
+        kwargs.setdefault('stream', self.stream)
         raw_url = self.__get_raw_url__(r.get_full_url(), strip_right=r.get_url_strip_right())
+        session = self.session or self.transport.session_for(raw_url, self.pool_settings)
+        method = r.get_request_method().value
+        headers = r.get_headers()
+
+        cache = self.cache
+        if cache is not None and not kwargs['stream'] and cache.is_cacheable(method, headers):
+            cookies = cookie_header(raw_url, headers, session.cookies, self.cookies)
+            key = cache.key(method, raw_url, r.get_query_strings(), headers, r.get_authorization(), cookies)
+            entry, fresh = cache.lookup(key, headers)
+            if fresh:
+                cache.stats.increment('hits')
+                response = entry.to_response(raw_url)
+                self.response = response
+                return self.get_response(response, response_hook)
+
+            conditional = {**(headers or {}), **entry.validators} if entry is not None else headers
+            response = self.__send__(session, r, raw_url, conditional, **kwargs)
+
+            if entry is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+                response = cache.refresh(key, entry, response).to_response(raw_url)
+            else:
+                cache.stats.increment('misses')
+                cache.store(key, headers, response)
+        else:
+            response = self.__send__(session, r, raw_url, headers, **kwargs)
+
+        # keep the result on a local so concurrent callers (see AsyncBaseWebClient) never read each other's response
+        self.response = response
+        return self.get_response(response, response_hook)
+
+    def __send__(self, session: requests.Session, r: IWebServiceRequest, raw_url: str, headers: Dict[str, str],
+                 **kwargs) -> requests.Response:
+        """
+        Sends the request over the given session, waiting for the rate limiter and retrying per the retry policy.
+
+        Args:
+            session: The session to send the request with.
+            r: The web service request to be executed.
+            raw_url: The full URL of the request.
+            headers: The request headers to send.
+            **kwargs: Additional keyword arguments to be passed to the request method.
 
-        try:
-            self.response = session.request(
-                r.get_request_method().value,
-                raw_url,
-                cookies=self.cookies,
-                verify=self.verify,
-                timeout=self.timeout,
-                params=r.get_query_strings(),
-                headers=r.get_headers(),
-                auth=r.get_authorization(),
-                proxies=self.proxies,
-                **r.get_body(),
-                **kwargs
-            )
-
-        except requests.exceptions.ConnectionError as e:
-
-            # IPv6 may be broken — retry using IPv4
-            self.log.warning("Connection failed, retrying with IPv4: %s", e)
+        Return:
+            The HTTP response.
+        """
+        method = r.get_request_method().value
+        limiter_key = RateLimiter.key_for(raw_url)
+        attempt = 0
 
-            try:
-                _force_ipv4()
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(limiter_key)
 
-                self.response = session.request(
-                    r.get_request_method().value,
+            try:
+                response = session.request(
+                    method,
                     raw_url,
                     cookies=self.cookies,
                     verify=self.verify,
                     timeout=self.timeout,
                     params=r.get_query_strings(),
-                    headers=r.get_headers(),
+                    headers=headers,
                     auth=r.get_authorization(),
                     proxies=self.proxies,
                     **r.get_body(),
                     **kwargs
                 )
-
-            except Exception as e2:
-                self.log.error("Error sending %s request: %s", r.get_request_method().value, e2)
-                raise e2
-
-        return self.get_response(self.response, response_hook)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                delay = self.retry_policy.next_delay(attempt, method, error=e)
+                if delay is None:
+                    self.log.error("Error sending %s request: %s", method, e)
+                    raise
+                self.log.warning("Request failed, retrying in %.2fs: %s", delay, e)
+            else:
+                delay = self.retry_policy.next_delay(attempt, method, response=response)
+                if delay is None:
+                    return response
+
+                self.log.warning("%s %s returned %s, retrying in %.2fs", method, raw_url, response.status_code, delay)
+                if self.rate_limiter is not None and response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+                    # hold back every caller of this host, not only this request
+                    self.rate_limiter.block(limiter_key, delay)
+                    delay = 0
+                if response.raw is not None:
+                    response.close()
+
+            attempt += 1
+            time.sleep(delay)
 
     def get_response(self, response: requests.Response, response_hook: Type[TResponseData]) -> IResponse[TResponseData]:
         """
@@ -164,17 +257,36 @@ class BaseWebClient(IWebClient, ABC):
         Return:
             An instance of IResponse containing the processed response data.
         """
-        self.response = Response(response_hook, data=None, response_encoding=self.response_encoding)
-        self.response.set_status_code(response.status_code)
-        self.response.set_headers(response.headers)
-        self.response.set_raw_data(response.content)
+        processed = Response(response_hook, data=None, response_encoding=self.response_encoding,
+                             decode_bytes=self.decode_bytes)
+        processed.set_status_code(response.status_code)
+        processed.set_headers(response.headers)
+        self.set_response_body(processed, response)
 
-        return self.response
+        self.response = processed
+        return processed
 
-    def get_errors(self) -> Type[TResponseData]:
+    def set_response_body(self, processed: Response, response: requests.Response) -> None:
+        """
+        Moves the body of the HTTP response to the processed response, keeping a streamed body unread.
+
+        Args:
+            processed: The response to fill.
+            response: The HTTP response received from the request.
+        """
+        # requests leaves _content unset until the body of a stream=True response is read
+        if response.raw is not None and response._content is False:
+            processed.set_stream(iter_response_chunks(response, self.stream_chunk_size))
+        else:
+            processed.set_raw_data(response.content)
+
+    def get_errors(self, response: IResponse = None) -> Type[TResponseData]:
         """
         Processes the HTTP response and returns an IResponse instance.
 
+        Args:
+            response: The response to read the errors of. Defaults to the last response processed.
+
         Return:
             An instance of IResponse containing the processed response data.
         """
@@ -0,0 +1,545 @@
+"""Opt-in HTTP response cache for the web service clients, with in-memory and sqlite backends."""
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import requests
+
+from requests.cookies import RequestsCookieJar, get_cookie_header, merge_cookies
+from requests.structures import CaseInsensitiveDict
+
+# statuses that may be stored without explicit freshness information (RFC 9111, section 4.2.2)
+CACHEABLE_STATUS_CODES = frozenset({200, 203, 204, 300, 301, 404, 405, 410, 414, 501})
+
+
+@dataclass(frozen=True)
+class CacheSettings:
+    """
+    HTTP cache settings, read from the 'cache' entry of AppConfigWSClient.parameters.
+
+    Attributes:
+        enabled: Whether responses are cached at all.
+        backend: 'memory' for a per-process LRU, or 'sqlite' for an on-disk cache shared between processes.
+        path: The sqlite database file. Defaults to a file in the temporary directory.
+        max_entries: Maximum number of stored responses.
+        max_bytes: Maximum total size of the stored response bodies.
+        default_ttl: Seconds a response without freshness headers is considered fresh; with 0 such responses
+                     are only stored when they carry an ETag or Last-Modified validator.
+        methods: The HTTP methods whose responses are cached.
+    """
+    enabled: bool = False
+    backend: str = 'memory'
+    path: Optional[str] = None
+    max_entries: int = 1024
+    max_bytes: int = 64 * 1024 * 1024
+    default_ttl: float = 0.0
+    methods: Tuple[str, ...] = ('GET',)
+
+    @classmethod
+    def from_parameters(cls, parameters: Dict[str, Any]) -> "CacheSettings":
+        """
+        Builds the settings from a parameters mapping, where 'cache' is either a boolean or a mapping of settings.
+
+        Args:
+            parameters: Client parameters, e.g. AppConfigWSClient.parameters.
+
+        Returns:
+            The cache settings.
+        """
+        cache = parameters.get('cache')
+        if not cache:
+            return cls()
+        if not isinstance(cache, Mapping):
+            return cls(enabled=True)
+
+        names = {f.name for f in fields(cls)}
+        values = {k: v for k, v in cache.items() if k in names and v is not None}
+        values.setdefault('enabled', True)
+        if 'methods' in values:
+            values['methods'] = tuple(m.upper() for m in values['methods'])
+        return cls(**values)
+
+
+class CacheStats:
+    """
+    Thread-safe counters of cache lookups.
+    A 'hit' is served without a request, a 'revalidation' is served after a 304 Not Modified,
+    and a 'miss' goes to the network.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def increment(self, counter: str, amount: int = 1):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "revalidations": self.revalidations,
+                    "stores": self.stores, "evictions": self.evictions}
+
+
+class CacheEntry:
+    """
+    A stored response with the data needed to check its freshness and revalidate it.
+    """
+    __slots__ = ("status_code", "headers", "content", "vary", "stored_at", "expires_at")
+
+    def __init__(self, status_code: int, headers: Dict[str, str], content: bytes, vary: Dict[str, Optional[str]],
+                 stored_at: float, expires_at: float):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.vary = vary
+        self.stored_at = stored_at
+        self.expires_at = expires_at
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """
+        Returns the conditional request headers that revalidate this entry.
+        """
+        headers = CaseInsensitiveDict(self.headers)
+        conditional = {}
+        if headers.get('ETag'):
+            conditional['If-None-Match'] = headers['ETag']
+        if headers.get('Last-Modified'):
+            conditional['If-Modified-Since'] = headers['Last-Modified']
+        return conditional
+
+    def to_response(self, url: str) -> requests.Response:
+        """
+        Rebuilds a requests.Response from the entry.
+
+        Args:
+            url: The URL of the request the entry answers.
+
+        Returns:
+            The response.
+        """
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.content
+        response.url = url
+        return response
+
+
+class MemoryCacheBackend:
+    """
+    A thread-safe least-recently-used cache evicting by number of entries and total body size.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, stats: Optional[CacheStats] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = stats or CacheStats()
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry):
+        if entry.size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+
+            evicted = 0
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, oldest = self._entries.popitem(last=False)
+                self._bytes -= oldest.size
+                evicted += 1
+
+        if evicted:
+            self.stats.increment('evictions', evicted)
+
+    def delete(self, key: str):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry.size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SqliteCacheBackend:
+    """
+    An on-disk least-recently-used cache in a sqlite database, usable by several processes at once.
+    """
+
+    def __init__(self, path: str, max_entries: int, max_bytes: int, stats: Optional[CacheStats] = None):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = stats or CacheStats()
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, status_code INTEGER, headers TEXT, content BLOB, vary TEXT,"
+            " stored_at REAL, expires_at REAL, size INTEGER, last_access REAL)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)")
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status_code, headers, content, vary, stored_at, expires_at FROM responses WHERE key = ?",
+                (key,)).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key))
+
+        status_code, headers, content, vary, stored_at, expires_at = row
+        return CacheEntry(status_code, json.loads(headers), bytes(content), json.loads(vary), stored_at, expires_at)
+
+    def set(self, key: str, entry: CacheEntry):
+        if entry.size > self.max_bytes:
+            return
+
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, entry.status_code, json.dumps(entry.headers), entry.content, json.dumps(entry.vary),
+                 entry.stored_at, entry.expires_at, entry.size, time.time()))
+            evicted = self._evict()
+
+        if evicted:
+            self.stats.increment('evictions', evicted)
+
+    def _evict(self) -> int:
+        count, total = self._connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return 0
+
+        evicted = 0
+        rows = self._connection.execute("SELECT key, size FROM responses ORDER BY last_access").fetchall()
+        doomed = []
+        for key, size in rows:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            count -= 1
+            total -= size
+            evicted += 1
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        return evicted
+
+    def delete(self, key: str):
+        with self._lock:
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+def cookie_header(url: str, headers: Optional[Mapping[str, str]] = None, *jars: Any) -> Optional[str]:
+    """
+    Returns the Cookie header a request would send: the one given in its headers, or the one built from the cookie
+    jars matching its URL.
+
+    Args:
+        url: The URL of the request.
+        headers: The request headers.
+        *jars: The cookie jars or dictionaries the request is sent with, e.g. the session cookies.
+
+    Returns:
+        The Cookie header, or None if no cookie would be sent.
+    """
+    explicit = CaseInsensitiveDict(headers or {}).get('Cookie')
+    if explicit:
+        return explicit
+    jars = [jar for jar in jars if jar]
+    if not jars:
+        return None
+
+    merged = RequestsCookieJar()
+    for jar in jars:
+        merged = merge_cookies(merged, jar)
+    prepared = requests.PreparedRequest()
+    prepared.prepare_url(url, None)
+    prepared.prepare_headers(None)
+    return get_cookie_header(merged, prepared)
+
+
+def _parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    directives = {}
+    for part in (value or '').split(','):
+        name, _, argument = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+
+def _parse_http_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class HttpCache:
+    """
+    Applies HTTP caching rules (Cache-Control, Expires, ETag and Last-Modified) on top of a cache backend.
+
+    Entries are keyed on the method, the URL with its sorted query strings and the credentials and cookies of the
+    request, and are matched against the request headers listed in the Vary header of the stored response. The cache
+    is shared by every client configured alike, so responses marked Cache-Control: private are never stored.
+    """
+
+    def __init__(self, settings: CacheSettings, backend=None):
+        self.settings = settings
+        self.stats = CacheStats()
+        self.backend = backend or self._create_backend(settings, self.stats)
+
+    @staticmethod
+    def _create_backend(settings: CacheSettings, stats: CacheStats):
+        if settings.backend == 'memory':
+            return MemoryCacheBackend(settings.max_entries, settings.max_bytes, stats)
+        if settings.backend == 'sqlite':
+            path = settings.path or os.path.join(tempfile.gettempdir(), 'harqis-http-cache.sqlite')
+            return SqliteCacheBackend(path, settings.max_entries, settings.max_bytes, stats)
+        raise ValueError(f"Unknown cache backend '{settings.backend}'. Available: memory, sqlite")
+
+    def is_cacheable(self, method: str, headers: Mapping[str, str]) -> bool:
+        """
+        Checks whether a request may be answered from or stored in the cache.
+
+        Args:
+            method: The HTTP method.
+            headers: The request headers.
+
+        Returns:
+            True if the cache applies to the request.
+        """
+        if method.upper() not in self.settings.methods:
+            return False
+        return 'no-store' not in _parse_cache_control(CaseInsensitiveDict(headers).get('Cache-Control'))
+
+    @staticmethod
+    def key(method: str, url: str, params: Any = None, headers: Optional[Mapping[str, str]] = None,
+            auth: Any = None, cookies: Optional[str] = None) -> str:
+        """
+        Builds the cache key of a request.
+
+        Args:
+            method: The HTTP method.
+            url: The URL without query strings.
+            params: The query strings of the request.
+            headers: The request headers; only credentials are part of the key.
+            auth: The authentication of the request, if any.
+            cookies: The Cookie header sent with the request, if any; see cookie_header.
+
+        Returns:
+            The cache key.
+        """
+        prepared = requests.PreparedRequest()
+        prepared.prepare_url(url, sorted(params.items()) if isinstance(params, Mapping) else params)
+        credentials = (CaseInsensitiveDict(headers or {}).get('Authorization'), auth, cookies or None)
+        if credentials == (None, None, None):
+            return f"{method.upper()} {prepared.url}"
+        # never keep credentials or cookies in the cache itself, only their digest
+        digest = hashlib.sha256(repr(credentials).encode('utf-8')).hexdigest()[:16]
+        return f"{method.upper()} {prepared.url} {digest}"
+
+    def lookup(self, key: str, headers: Mapping[str, str]) -> Tuple[Optional[CacheEntry], bool]:
+        """
+        Finds the stored response of a request.
+
+        Args:
+            key: The cache key of the request.
+            headers: The request headers, matched against the Vary header of the stored response.
+
+        Returns:
+            The entry or None, and whether it can be used without revalidation.
+        """
+        entry = self.backend.get(key)
+        if entry is None:
+            return None, False
+
+        request_headers = CaseInsensitiveDict(headers)
+        if any(request_headers.get(name) != value for name, value in entry.vary.items()):
+            return None, False
+
+        no_cache = 'no-cache' in _parse_cache_control(request_headers.get('Cache-Control'))
+        return entry, entry.is_fresh(time.time()) and not no_cache
+
+    def _expiry(self, headers: Mapping[str, str], now: float) -> Optional[float]:
+        directives = _parse_cache_control(headers.get('Cache-Control'))
+        if 'no-store' in directives or 'private' in directives:
+            return None
+        if 'no-cache' in directives:
+            return now
+
+        try:
+            age = max(0.0, float(headers.get('Age') or 0))
+        except ValueError:
+            # a malformed Age header is ignored rather than failing the request
+            age = 0.0
+        max_age = directives.get('max-age')
+        if max_age is not None:
+            try:
+                return now + int(max_age) - age
+            except ValueError:
+                return now
+
+        expires = headers.get('Expires')
+        if expires is not None:
+            expires_at = _parse_http_date(expires)
+            # an invalid date such as "0" means already expired
+            if expires_at is None:
+                return now
+            date = _parse_http_date(headers.get('Date')) or now
+            return now + (expires_at - date)
+
+        return now + self.settings.default_ttl
+
+    def store(self, key: str, request_headers: Mapping[str, str], response: requests.Response) -> Optional[CacheEntry]:
+        """
+        Stores a response if its status and headers allow it.
+
+        Args:
+            key: The cache key of the request.
+            request_headers: The request headers, to record the values of the headers named in Vary.
+            response: The response received from the network.
+
+        Returns:
+            The stored entry, or None if the response is not cacheable.
+        """
+        if response.status_code not in CACHEABLE_STATUS_CODES:
+            return None
+
+        headers = response.headers
+        vary = [name.strip() for name in (headers.get('Vary') or '').split(',') if name.strip()]
+        if '*' in vary:
+            return None
+
+        now = time.time()
+        expires_at = self._expiry(headers, now)
+        if expires_at is None:
+            return None
+
+        entry = CacheEntry(response.status_code, dict(headers), response.content,
+                           {name: CaseInsensitiveDict(request_headers).get(name) for name in vary}, now, expires_at)
+        if expires_at <= now and not entry.validators:
+            return None
+
+        self.backend.set(key, entry)
+        self.stats.increment('stores')
+        return entry
+
+    def refresh(self, key: str, entry: CacheEntry, not_modified: requests.Response) -> CacheEntry:
+        """
+        Updates a stored response with the headers of a 304 Not Modified answer to its revalidation. The entry is
+        removed instead when the new headers forbid storing it, e.g. Cache-Control: no-store.
+
+        Args:
+            key: The cache key of the request.
+            entry: The stored entry that was revalidated.
+            not_modified: The 304 response.
+
+        Returns:
+            The refreshed entry.
+        """
+        headers = CaseInsensitiveDict(entry.headers)
+        headers.update({k: v for k, v in not_modified.headers.items() if k.lower() != 'content-length'})
+
+        now = time.time()
+        expires_at = self._expiry(headers, now)
+        entry = CacheEntry(entry.status_code, dict(headers), entry.content, entry.vary, now,
+                           now if expires_at is None else expires_at)
+        if expires_at is None:
+            self.backend.delete(key)
+        else:
+            self.backend.set(key, entry)
+        self.stats.increment('revalidations')
+        return entry
+
+    def clear(self):
+        """
+        Removes every stored response.
+        """
+        self.backend.clear()
+
+
+_caches: Dict[CacheSettings, HttpCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(settings: CacheSettings) -> Optional[HttpCache]:
+    """
+    Returns the process-wide cache for the given settings, so clients configured alike share their responses.
+
+    Args:
+        settings: The cache settings.
+
+    Returns:
+        The cache, or None if caching is disabled.
+    """
+    if not settings.enabled:
+        return None
+
+    with _caches_lock:
+        cache = _caches.get(settings)
+        if cache is None:
+            cache = _caches[settings] = HttpCache(settings)
+        return cache
+
+
+def clear_caches():
+    """
+    Removes every stored response from the process-wide caches.
+    """
+    with _caches_lock:
+        caches = list(_caches.values())
+    for cache in caches:
+        cache.clear()
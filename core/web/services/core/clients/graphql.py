@@ -26,15 +26,27 @@ class GraphQLClient(BaseWebClient):
         Return:
             An instance of IResponse containing the processed response data.
         """
-        self.response = Response(response_hook, data=None, response_encoding=self.response_encoding, data_key='data')
-        self.response.set_status_code(response.status_code)
-        self.response.set_headers(response.headers)
-        self.response.set_raw_data(response.content)
+        processed = Response(response_hook, data=None, response_encoding=self.response_encoding, data_key='data',
+                             decode_bytes=self.decode_bytes)
+        processed.set_status_code(response.status_code)
+        processed.set_headers(response.headers)
+        self.set_response_body(processed, response)
 
-        return self.response
+        self.response = processed
+        return processed
 
-    def get_errors(self) -> Response[TErrors]:
-        error_response = Response(dict, data=None, response_encoding=self.response_encoding, data_key='errors')
-        error_response.set_raw_data(self.response.raw_data)
+    def get_errors(self, response: IResponse = None) -> Response[TErrors]:
+        """
+        Returns the 'errors' entry of a GraphQL response.
+
+        Args:
+            response: The response to read the errors of. Defaults to the last response processed by this client.
+
+        Return:
+            A Response whose data is the list of errors.
+        """
+        error_response = Response(dict, data=None, response_encoding=self.response_encoding, data_key='errors',
+                                  decode_bytes=self.decode_bytes)
+        error_response.set_raw_data((response or self.response).raw_data)
 
         return error_response
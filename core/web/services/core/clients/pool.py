@@ -0,0 +1,236 @@
+"""Process-wide pooled HTTP transport shared by the web service clients."""
+import threading
+import time
+
+import requests
+
+from dataclasses import dataclass, fields
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """
+    Connection pool settings, read from AppConfigWSClient.parameters.
+
+    Attributes:
+        pool_connections: Number of per-host connection pools to cache.
+        pool_maxsize: Maximum number of connections kept alive per host.
+        pool_block: Whether to wait for a free connection instead of opening an extra one.
+        keep_alive: Whether to keep connections open for reuse between requests.
+        idle_timeout: Seconds after which an unused host session is closed and evicted.
+    """
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    keep_alive: bool = True
+    idle_timeout: float = 300.0
+
+    @classmethod
+    def from_parameters(cls, parameters: Dict[str, Any]) -> "PoolSettings":
+        """
+        Builds the settings from a parameters mapping, ignoring unknown or null values.
+
+        Args:
+            parameters: Client parameters, e.g. AppConfigWSClient.parameters.
+
+        Returns:
+            The pool settings.
+        """
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in parameters.items() if k in names and v is not None})
+
+
+class ConnectionStats:
+    """
+    Thread-safe counters of connections checked out from a pool.
+    A checkout is 'reused' when the connection still holds an open socket, and 'new' otherwise.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.new = 0
+        self.reused = 0
+
+    def record(self, reused: bool):
+        with self._lock:
+            if reused:
+                self.reused += 1
+            else:
+                self.new += 1
+
+    def merge(self, other: "ConnectionStats"):
+        with self._lock:
+            self.new += other.new
+            self.reused += other.reused
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {"new": self.new, "reused": self.reused, "total": self.new + self.reused}
+
+
+class _CountingPoolMixin:
+    stats: ConnectionStats = None
+
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout=timeout)
+        # dropped or brand-new connections have no socket yet and will pay a fresh handshake
+        self.stats.record(reused=conn.sock is not None)
+        return conn
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter whose connection pools report reused vs new connections to a ConnectionStats.
+    """
+
+    def __init__(self, settings: PoolSettings, stats: ConnectionStats):
+        self.stats = stats
+        super().__init__(pool_connections=settings.pool_connections,
+                         pool_maxsize=settings.pool_maxsize,
+                         pool_block=settings.pool_block)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: type(f"Counting{base.__name__}", (_CountingPoolMixin, base), {"stats": self.stats})
+            for scheme, base in (("http", HTTPConnectionPool), ("https", HTTPSConnectionPool))
+        }
+
+
+def create_pooled_session(settings: PoolSettings, stats: ConnectionStats) -> requests.Session:
+    """
+    Creates a requests.Session with pooled adapters mounted for http and https.
+
+    Args:
+        settings: The pool settings.
+        stats: The counters the session's connection pools report to.
+
+    Returns:
+        The configured session.
+    """
+    session = requests.Session()
+    adapter = PooledHTTPAdapter(settings, stats)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not settings.keep_alive:
+        session.headers["Connection"] = "close"
+
+    return session
+
+
+class _PoolEntry:
+    __slots__ = ("session", "stats", "last_used")
+
+    def __init__(self, session: requests.Session, stats: ConnectionStats):
+        self.session = session
+        self.stats = stats
+        self.last_used = time.monotonic()
+
+
+class PooledTransport:
+    """
+    A registry of pooled sessions keyed by scheme, host and pool settings, shared by every client in the process.
+
+    Shared sessions never store cookies from responses, so clients talking to the same host cannot leak
+    cookies into each other; per-request cookies are still sent.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, str, PoolSettings], _PoolEntry] = {}
+        self._evicted: Dict[str, ConnectionStats] = {}
+        self._last_sweep = time.monotonic()
+
+    @staticmethod
+    def _host_key(url: str) -> Tuple[str, str]:
+        parts = urlsplit(url)
+        return parts.scheme.lower(), parts.netloc.lower()
+
+    def session_for(self, url: str, settings: PoolSettings) -> requests.Session:
+        """
+        Returns the shared session for the host of the given URL, creating it on first use.
+
+        Args:
+            url: The URL about to be requested.
+            settings: The pool settings of the calling client.
+
+        Returns:
+            The shared pooled session.
+        """
+        key = (*self._host_key(url), settings)
+
+        with self._lock:
+            now = time.monotonic()
+            entry = self._entries.get(key)
+            if entry is None:
+                stats = ConnectionStats()
+                session = create_pooled_session(settings, stats)
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                entry = self._entries[key] = _PoolEntry(session, stats)
+            entry.last_used = now
+
+            if now - self._last_sweep >= 1.0:
+                # sessions handed out since the previous sweep may still be in use by their caller
+                self._evict_idle(now, in_use_since=self._last_sweep)
+
+        return entry.session
+
+    def _evict_idle(self, now: float, in_use_since: Optional[float] = None):
+        self._last_sweep = now
+        for key, entry in list(self._entries.items()):
+            if in_use_since is not None and entry.last_used >= in_use_since:
+                continue
+            if now - entry.last_used > key[2].idle_timeout:
+                self._evicted.setdefault(key[1], ConnectionStats()).merge(entry.stats)
+                del self._entries[key]
+                entry.session.close()
+
+    def evict_idle(self):
+        """
+        Closes and removes every session that has been idle longer than its idle_timeout.
+
+        Unlike the sweep done by session_for, this also closes sessions handed out recently: call it when no
+        request is in flight, e.g. between batches.
+        """
+        with self._lock:
+            self._evict_idle(time.monotonic())
+
+    def stats(self, host: Optional[str] = None) -> Dict[str, int]:
+        """
+        Returns the connection counters, including those of evicted sessions.
+
+        Args:
+            host: Optional host (netloc) to filter by, e.g. 'api.example.com' or 'localhost:8080'.
+
+        Returns:
+            A dictionary with 'new', 'reused' and 'total' connection checkouts.
+        """
+        totals = ConnectionStats()
+        with self._lock:
+            for (_, netloc, _), entry in self._entries.items():
+                if host is None or netloc == host.lower():
+                    totals.merge(entry.stats)
+            for netloc, stats in self._evicted.items():
+                if host is None or netloc == host.lower():
+                    totals.merge(stats)
+
+        return totals.snapshot()
+
+    def close(self):
+        """
+        Closes every pooled session. Counters are kept.
+        """
+        with self._lock:
+            for key, entry in self._entries.items():
+                self._evicted.setdefault(key[1], ConnectionStats()).merge(entry.stats)
+                entry.session.close()
+            self._entries.clear()
+
+
+default_transport = PooledTransport()
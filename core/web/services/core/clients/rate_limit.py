@@ -0,0 +1,202 @@
+"""Per-host token-bucket rate limiting shared by the web service clients of a process, or of several processes."""
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+
+@dataclass(frozen=True)
+class RateLimitSettings:
+    """
+    Rate limit settings, read from the 'rate_limit' entry of AppConfigWSClient.parameters.
+
+    Attributes:
+        rate: Number of requests allowed per period and host; 0 disables rate limiting.
+        per: The period in seconds.
+        burst: Number of requests that may be sent at once after an idle period. Defaults to the rate.
+        backend: 'memory' to share the buckets between the threads of a process, or 'sqlite' to share them
+                 between processes through a database file.
+        path: The sqlite database file. Defaults to a file in the temporary directory.
+    """
+    rate: float = 0
+    per: float = 1.0
+    burst: Optional[float] = None
+    backend: str = 'memory'
+    path: Optional[str] = None
+
+    @classmethod
+    def from_parameters(cls, parameters: Dict[str, Any]) -> "RateLimitSettings":
+        """
+        Builds the settings from the 'rate_limit' mapping of a parameters mapping.
+
+        Args:
+            parameters: Client parameters, e.g. AppConfigWSClient.parameters.
+
+        Returns:
+            The rate limit settings.
+        """
+        rate_limit = parameters.get('rate_limit')
+        if not isinstance(rate_limit, Mapping):
+            return cls()
+
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in rate_limit.items() if k in names and v is not None})
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    @property
+    def capacity(self) -> float:
+        return float(self.burst if self.burst is not None else max(self.rate, 1))
+
+    @property
+    def tokens_per_second(self) -> float:
+        return self.rate / self.per
+
+
+class RateLimiter:
+    """
+    A token bucket per key (usually a host) shared by every thread of the process.
+
+    A caller takes a token and, when the bucket is empty, reserves the next one and sleeps until it is due,
+    so waiting callers are served in order at exactly the configured rate.
+    """
+
+    def __init__(self, settings: RateLimitSettings):
+        self.settings = settings
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, list] = {}
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        return urlsplit(url).netloc.lower()
+
+    def reserve(self, key: str) -> float:
+        """
+        Takes a token from the bucket of a key without waiting.
+
+        Args:
+            key: The bucket key, e.g. a host.
+
+        Returns:
+            The number of seconds to wait before the request may be sent.
+        """
+        settings = self.settings
+        now = time.monotonic()
+        with self._lock:
+            # [tokens, last refill]
+            bucket = self._buckets.setdefault(key, [settings.capacity, now])
+            bucket[0] = min(settings.capacity, bucket[0] + (now - bucket[1]) * settings.tokens_per_second)
+            bucket[1] = now
+            bucket[0] -= 1
+            tokens = bucket[0]
+
+        return 0.0 if tokens >= 0 else -tokens / settings.tokens_per_second
+
+    def acquire(self, key: str) -> float:
+        """
+        Waits until a request may be sent for a key.
+
+        Args:
+            key: The bucket key, e.g. a host.
+
+        Returns:
+            The number of seconds waited.
+        """
+        delay = self.reserve(key)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def block(self, key: str, seconds: float):
+        """
+        Empties the bucket of a key so no request is sent for the given time, e.g. after a 429 with Retry-After.
+
+        Args:
+            key: The bucket key, e.g. a host.
+            seconds: The time to hold requests back.
+        """
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.setdefault(key, [self.settings.capacity, now])
+            bucket[0] = min(bucket[0], -seconds * self.settings.tokens_per_second)
+            bucket[1] = now
+
+
+class SqliteRateLimiter(RateLimiter):
+    """
+    A token bucket per key stored in a sqlite database, shared by every process using the same file.
+    """
+
+    def __init__(self, settings: RateLimitSettings):
+        super().__init__(settings)
+        path = settings.path or os.path.join(tempfile.gettempdir(), 'harqis-rate-limit.sqlite')
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._connection.execute("CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL, updated REAL)")
+
+    def _update(self, key: str, take: float, floor: Optional[float] = None) -> float:
+        settings = self.settings
+        with self._lock:
+            # BEGIN IMMEDIATE holds the database write lock, serializing the processes sharing the bucket
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = self._connection.execute("SELECT tokens, updated FROM buckets WHERE key = ?", (key,)).fetchone()
+                tokens = settings.capacity if row is None else \
+                    min(settings.capacity, row[0] + max(0.0, now - row[1]) * settings.tokens_per_second)
+                tokens -= take
+                if floor is not None:
+                    tokens = min(tokens, floor)
+                self._connection.execute("INSERT OR REPLACE INTO buckets VALUES (?, ?, ?)", (key, tokens, now))
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+        return tokens
+
+    def reserve(self, key: str) -> float:
+        tokens = self._update(key, 1)
+        return 0.0 if tokens >= 0 else -tokens / self.settings.tokens_per_second
+
+    def block(self, key: str, seconds: float):
+        self._update(key, 0, floor=-seconds * self.settings.tokens_per_second)
+
+
+_limiters: Dict[RateLimitSettings, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(settings: RateLimitSettings) -> Optional[RateLimiter]:
+    """
+    Returns the process-wide rate limiter for the given settings, so clients configured alike share their buckets.
+
+    Args:
+        settings: The rate limit settings.
+
+    Returns:
+        The rate limiter, or None if rate limiting is disabled.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    if not settings.enabled:
+        return None
+
+    with _limiters_lock:
+        limiter = _limiters.get(settings)
+        if limiter is None:
+            if settings.backend == 'memory':
+                limiter = RateLimiter(settings)
+            elif settings.backend == 'sqlite':
+                limiter = SqliteRateLimiter(settings)
+            else:
+                raise ValueError(f"Unknown rate limit backend '{settings.backend}'. Available: memory, sqlite")
+            _limiters[settings] = limiter
+        return limiter
@@ -0,0 +1,163 @@
+"""Retry policy with exponential backoff, jitter and Retry-After support for the web service clients."""
+import random
+import time
+
+from dataclasses import dataclass, field, fields
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, FrozenSet, Mapping, Optional
+
+import requests
+
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is sent again, read from the 'retry' entry of
+    AppConfigWSClient.parameters.
+
+    The default retries a connection error once and never retries on a status code.
+
+    Attributes:
+        total: Maximum number of retries of a request.
+        backoff_factor: The delay before retry n is backoff_factor * 2 ** n seconds.
+        max_backoff: The longest delay between two attempts.
+        jitter: Whether to randomize the delay (full jitter) so many clients do not retry in lockstep.
+        statuses: The status codes to retry, e.g. [429, 502, 503, 504].
+        status_rules: Maximum number of retries per status code, overriding 'total', e.g. {429: 10}.
+        methods: The methods retried on a status code or after a timeout. Other methods, e.g. POST, are only retried
+                 after errors raised before the request reached the server (see sent_before_error).
+        respect_retry_after: Whether to wait for the time given in the Retry-After header.
+        max_retry_after: A Retry-After longer than this gives up instead of waiting.
+        retry_connection_errors: Whether to retry connection errors and timeouts.
+    """
+    total: int = 1
+    backoff_factor: float = 0.0
+    max_backoff: float = 30.0
+    jitter: bool = True
+    statuses: FrozenSet[int] = frozenset()
+    status_rules: Dict[int, int] = field(default_factory=dict)
+    methods: FrozenSet[str] = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'TRACE'})
+    respect_retry_after: bool = True
+    max_retry_after: float = 300.0
+    retry_connection_errors: bool = True
+
+    @classmethod
+    def from_parameters(cls, parameters: Dict[str, Any]) -> "RetryPolicy":
+        """
+        Builds the policy from the 'retry' mapping of a parameters mapping.
+
+        Args:
+            parameters: Client parameters, e.g. AppConfigWSClient.parameters.
+
+        Returns:
+            The retry policy.
+        """
+        retry = parameters.get('retry')
+        if not isinstance(retry, Mapping):
+            return cls()
+
+        names = {f.name for f in fields(cls)}
+        values = {k: v for k, v in retry.items() if k in names and v is not None}
+        if 'status_rules' in values:
+            values['status_rules'] = {int(k): int(v) for k, v in values['status_rules'].items()}
+        values['statuses'] = frozenset(int(s) for s in values.get('statuses', ())) | set(values.get('status_rules', ()))
+        if 'methods' in values:
+            values['methods'] = frozenset(m.upper() for m in values['methods'])
+        return cls(**values)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Returns the delay before a retry.
+
+        Args:
+            attempt: The number of retries already made.
+
+        Returns:
+            The delay in seconds.
+        """
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    @staticmethod
+    def retry_after(response: requests.Response) -> Optional[float]:
+        """
+        Reads the Retry-After header of a response, given either in seconds or as an HTTP date.
+
+        Args:
+            response: The response.
+
+        Returns:
+            The delay in seconds, or None if the header is missing or invalid.
+        """
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def sent_before_error(error: Exception) -> bool:
+        """
+        Tells whether the server may have received the request before the error, e.g. a read timeout or a
+        connection aborted while waiting for the response.
+
+        Args:
+            error: The error raised when sending the request.
+
+        Returns:
+            False for a connect timeout or a connection that could not be opened (refused, DNS failure), raised
+            before the request was sent; True otherwise.
+        """
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return False
+        if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+            reason = error.args[0]
+            if isinstance(reason, MaxRetryError):
+                reason = reason.reason
+            return not isinstance(reason, NewConnectionError)
+        return True
+
+    def next_delay(self, attempt: int, method: str, response: Optional[requests.Response] = None,
+                   error: Optional[Exception] = None) -> Optional[float]:
+        """
+        Decides whether to retry after a response or an error.
+
+        Args:
+            attempt: The number of retries already made.
+            method: The HTTP method of the request.
+            response: The response received, if any.
+            error: The error raised instead, if any.
+
+        Returns:
+            The delay in seconds before the retry, or None to stop retrying.
+        """
+        if error is not None:
+            if not self.retry_connection_errors or attempt >= self.total:
+                return None
+            if method.upper() not in self.methods and self.sent_before_error(error):
+                # the server may already have applied a write: sending it again could apply it twice
+                return None
+            return self.backoff(attempt)
+
+        status = response.status_code
+        if status not in self.statuses or method.upper() not in self.methods:
+            return None
+        if attempt >= self.status_rules.get(status, self.total):
+            return None
+
+        delay = self.backoff(attempt)
+        if self.respect_retry_after:
+            retry_after = self.retry_after(response)
+            if retry_after is not None:
+                if retry_after > self.max_retry_after:
+                    return None
+                delay = max(delay, retry_after)
+        return delay
@@ -9,6 +9,16 @@ class AppConfigWSClient(BaseAppConfigModel):
     """
     Base configuration object for web services.
     Tracks which attributes were changed.
+
+    Besides the defaults below, `parameters` accepts the connection pool settings of the process-wide
+    pooled transport: pool_connections, pool_maxsize, pool_block, keep_alive and idle_timeout.
+    With `stream` enabled, response bodies are read lazily so large arrays can be iterated with
+    Response.iter_data; `stream_chunk_size` sets the bytes read at a time.
+    `cache` enables the HTTP cache, either as `true` or as a mapping of CacheSettings, e.g.
+    `{"backend": "sqlite", "path": ".cache/http.sqlite", "max_bytes": 67108864, "default_ttl": 60}`.
+    `rate_limit` sets a per-host token bucket, e.g. `{"rate": 10, "per": 1, "burst": 10, "backend": "sqlite"}`,
+    and `retry` the retry policy, e.g. `{"total": 3, "backoff_factor": 0.5, "statuses": [502, 503, 504],
+    "status_rules": {429: 8}}`.
     """
 
     client: Optional[str] = None
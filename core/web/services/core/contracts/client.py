@@ -1,5 +1,5 @@
 from abc import abstractmethod, ABC
-from typing import TypeVar, Type, Dict
+from typing import TypeVar, Type, Dict, Iterable, AsyncIterator
 
 from .response import IResponse
 from .request import IWebServiceRequest
@@ -81,11 +81,57 @@ class IWebClient(ABC):
         ...
 
     @abstractmethod
-    def get_errors(self) -> Type[TClient]:
+    def get_errors(self, response: IResponse = None) -> Type[TClient]:
         """
         Get the errors from the web client.
 
+        Args:
+            response: The response to read the errors of. Defaults to the last response.
+
         Return:
             The errors from the web client.
         """
         ...
+
+
+class IAsyncWebClient(ABC):
+    """
+    Interface for an asyncio web client that can execute web service requests concurrently.
+    """
+    @abstractmethod
+    async def execute_request(self, request: IWebServiceRequest, response_hook: Type[TResponse] = dict,
+                              **kwargs) -> IResponse[TClient]:
+        """
+        Execute a web service request without blocking the event loop and return the response.
+
+        Args:
+            request: The request object to be executed.
+            response_hook: The type to deserialize the response data into.
+
+        Return:
+            The response object.
+        """
+        ...
+
+    @abstractmethod
+    def execute_many(self, requests: Iterable[IWebServiceRequest], response_hook: Type[TResponse] = dict,
+                     max_concurrency: int = None, **kwargs) -> AsyncIterator[IResponse[TClient]]:
+        """
+        Execute several web service requests concurrently, yielding responses as they complete.
+
+        Args:
+            requests: The request objects to be executed.
+            response_hook: The type to deserialize the response data into.
+            max_concurrency: The maximum number of requests in flight at any time.
+
+        Return:
+            An async iterator of response objects in completion order.
+        """
+        ...
+
+    @abstractmethod
+    async def close(self):
+        """
+        Release the resources held by the web client.
+        """
+        ...
@@ -8,6 +8,7 @@ class IWebServiceRequest(ABC):
     """
     Interface for a web service request.
     """
+    __slots__ = ()
 
     @abstractmethod
     def set_request_method(self, method: HttpMethod):
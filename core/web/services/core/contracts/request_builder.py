@@ -15,6 +15,7 @@ class IWebRequestBuilder(ABC):
     """
     Interface for a chainable web request builder.
     """
+    __slots__ = ()
 
     @abstractmethod
     def set_method(self, method: HttpMethod) -> "IWebRequestBuilder":
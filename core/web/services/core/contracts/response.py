@@ -9,6 +9,7 @@ class IResponse(Generic[TResponse]):
     """
     A generic container for encapsulating HTTP responses.
     """
+    __slots__ = ()
 
     @property
     @abstractmethod
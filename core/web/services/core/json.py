@@ -4,16 +4,56 @@ import json
 import jsonpickle
 
 from collections import OrderedDict
+from dataclasses import is_dataclass
 from json import JSONDecodeError
-from typing import TypeVar, Generic, Type, Union
+from typing import TypeVar, Generic, Type, Union, Any
 
 from core.utilities.logging.custom_logger import create_logger
+from core.web.services.core import json_backends
 
 log = create_logger()
 TJsonObject = TypeVar('TJsonObject')
 TResponse = TypeVar('TResponse')
 
 
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+class _CircularReference(Exception):
+    pass
+
+
+def _to_primitive(obj: Any, active: set) -> Any:
+    obj_type = type(obj)
+    if obj_type in _PRIMITIVE_TYPES:
+        return obj
+
+    if obj_type is list or obj_type is tuple or obj_type is set or obj_type is frozenset:
+        items = obj
+        members = None
+    elif obj_type is dict or obj_type is OrderedDict:
+        members = obj
+        if not all(type(k) is str for k in members):
+            return json.loads(jsonpickle.encode(obj, unpicklable=False))
+    elif isinstance(obj, JsonObject) or (is_dataclass(obj) and hasattr(obj, '__dict__')):
+        members = vars(obj)
+    else:
+        # anything else (datetime, enums, custom classes) keeps the jsonpickle representation
+        return json.loads(jsonpickle.encode(obj, unpicklable=False))
+
+    marker = id(obj)
+    if marker in active:
+        raise _CircularReference()
+    active.add(marker)
+    try:
+        # scalars are inlined to avoid a call per value
+        if members is not None:
+            return {k: v if type(v) in _PRIMITIVE_TYPES else _to_primitive(v, active) for k, v in members.items()}
+        return [v if type(v) in _PRIMITIVE_TYPES else _to_primitive(v, active) for v in items]
+    finally:
+        active.discard(marker)
+
+
 def keys_exists(element: dict, *keys) -> Union[None, dict]:
     """
     Check if a nested sequence of keys exists in a given dictionary.
@@ -110,8 +150,7 @@ class JsonObject(Generic[TJsonObject]):
 
     def get_dict(self) -> dict:
         """Converts the object to a dictionary."""
-        s = JsonUtility.serialize(self)
-        return JsonUtility.deserialize(s, type_hook=OrderedDict)
+        return JsonUtility.to_primitive(self)
 
     def sanitize(self, remove_characters: [] = None):
         """
@@ -149,10 +188,29 @@ class JsonObject(Generic[TJsonObject]):
 class JsonUtility:
     """A utility class for serializing and deserializing JSON."""
 
+    @staticmethod
+    def to_primitive(obj: Any) -> Any:
+        """
+        Converts an object to JSON-compatible dictionaries, lists and scalars without going through a string.
+
+        JsonObject and dataclass instances are walked directly through their attributes; any other type
+        falls back to its jsonpickle representation, so the result matches serialize().
+
+        Args:
+            obj: The object to convert.
+
+        Returns:
+            The JSON-compatible representation of the object.
+        """
+        try:
+            return _to_primitive(obj, set())
+        except _CircularReference:
+            return json.loads(jsonpickle.encode(obj, unpicklable=False))
+
     @staticmethod
     def serialize(obj: TJsonObject) -> str:
         """
-        Serializes an object to a JSON string.
+        Serializes an object to a JSON string using the selected JSON backend.
 
         Args:
             obj (T): The object to serialize.
@@ -160,15 +218,15 @@ class JsonUtility:
         Returns:
             A JSON string representation of the object.
         """
-        return jsonpickle.encode(obj, unpicklable=False)
+        return json_backends.backend.dumps(JsonUtility.to_primitive(obj))
 
     @staticmethod
-    def deserialize(obj: str, type_hook: Type[TResponse] = JsonObject[TJsonObject], **kwargs) -> TJsonObject:
+    def deserialize(obj: Union[str, bytes], type_hook: Type[TResponse] = JsonObject[TJsonObject], **kwargs) -> TJsonObject:
         """
         Deserializes a JSON string to an object.
 
         Args:
-            obj (str): The JSON string to deserialize.
+            obj (str | bytes): The JSON string to deserialize, or UTF-8/16/32 encoded bytes.
             type_hook (Type[T]): The type of the object to deserialize to.
 
         Returns:
@@ -177,8 +235,16 @@ class JsonUtility:
         Raises:
             JSONDecodeError: If the JSON string cannot be decoded.
         """
+        engine = json_backends.backend
         try:
-            return json.loads(obj, object_hook=type_hook, **kwargs)
+            if kwargs:
+                return json.loads(obj, object_hook=type_hook, **kwargs)
+            if type_hook is dict or type_hook is None:
+                return engine.loads(obj)
+            if engine.supports_object_hook:
+                return engine.loads(obj, object_hook=type_hook)
+            # hooks run fastest inside the standard library parser
+            return json.loads(obj, object_hook=type_hook)
         except JSONDecodeError:
             raise Exception("Could not decode data. Please check the JSON format.")
 
@@ -195,8 +261,10 @@ class JsonUtility:
         Returns:
             An object of the specified type.
         """
-        raw_str = json.dumps(obj)
-        return JsonUtility.deserialize(raw_str, type_hook)
+        data = JsonUtility.to_primitive(obj)
+        if type_hook is dict:
+            return data
+        return json_backends.apply_object_hook(data, type_hook)
 
     @staticmethod
     def deserialize_from_file(full_path: str, type_hook: Type[TResponse] = JsonObject[TJsonObject]) -> TJsonObject:
@@ -0,0 +1,160 @@
+"""
+Pluggable JSON engines used by JsonUtility.
+
+The engine is selected once at import time from the JSON_BACKEND environment variable:
+- 'json' (default): the standard library, output is identical to previous releases.
+- 'auto': the fastest installed engine among orjson, msgspec and ujson, falling back to 'json'.
+- 'orjson', 'msgspec' or 'ujson': that engine, falling back to 'json' with a warning if it is not installed.
+
+Fast engines write compact JSON (no spaces after separators) and do not support object hooks, so
+JsonUtility parses with them when plain dictionaries are requested and uses the standard library otherwise.
+"""
+import os
+import json
+
+from typing import Any, Callable, Dict, List, Optional, Type, Union
+
+from core.utilities.logging.custom_logger import create_logger
+
+log = create_logger("JSON Backends")
+
+
+class JsonBackend:
+    """
+    Standard library JSON engine; the base for every other engine.
+    """
+    name = 'json'
+    supports_object_hook = True
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+    def loads(self, s: Union[str, bytes], object_hook: Optional[Callable[[dict], Any]] = None, **kwargs) -> Any:
+        return json.loads(s, object_hook=object_hook, **kwargs)
+
+
+class OrjsonBackend(JsonBackend):
+    name = 'orjson'
+    supports_object_hook = False
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> str:
+        return self._orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, s: Union[str, bytes], object_hook: Optional[Callable[[dict], Any]] = None, **kwargs) -> Any:
+        return self._orjson.loads(s)
+
+
+class MsgspecBackend(JsonBackend):
+    name = 'msgspec'
+    supports_object_hook = False
+
+    def __init__(self):
+        import msgspec
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._decode_error = msgspec.DecodeError
+
+    def dumps(self, obj: Any) -> str:
+        return self._encoder.encode(obj).decode('utf-8')
+
+    def loads(self, s: Union[str, bytes], object_hook: Optional[Callable[[dict], Any]] = None, **kwargs) -> Any:
+        try:
+            return self._decoder.decode(s)
+        except self._decode_error as e:
+            raise json.JSONDecodeError(str(e), s if isinstance(s, str) else '', 0) from e
+
+
+class UjsonBackend(JsonBackend):
+    name = 'ujson'
+    supports_object_hook = False
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+
+    def dumps(self, obj: Any) -> str:
+        return self._ujson.dumps(obj)
+
+    def loads(self, s: Union[str, bytes], object_hook: Optional[Callable[[dict], Any]] = None, **kwargs) -> Any:
+        try:
+            return self._ujson.loads(s)
+        except self._ujson.JSONDecodeError as e:
+            raise json.JSONDecodeError(str(e), s if isinstance(s, str) else '', 0) from e
+
+
+BACKENDS: Dict[str, Type[JsonBackend]] = {
+    JsonBackend.name: JsonBackend,
+    OrjsonBackend.name: OrjsonBackend,
+    MsgspecBackend.name: MsgspecBackend,
+    UjsonBackend.name: UjsonBackend,
+}
+
+# order of preference for 'auto'
+FAST_BACKENDS = (OrjsonBackend.name, MsgspecBackend.name, UjsonBackend.name)
+
+
+def available_backends() -> List[str]:
+    """
+    Returns the names of the JSON engines that can be loaded in this environment.
+    """
+    names = []
+    for name, backend_class in BACKENDS.items():
+        try:
+            backend_class()
+            names.append(name)
+        except ImportError:
+            continue
+    return names
+
+
+def get_backend(name: str = 'json') -> JsonBackend:
+    """
+    Creates a JSON engine by name.
+
+    Args:
+        name: 'json', 'auto', 'orjson', 'msgspec' or 'ujson'.
+
+    Returns:
+        The JSON engine, or the standard library engine if the requested one is not installed.
+
+    Raises:
+        ValueError: If the name is unknown.
+    """
+    name = (name or 'json').strip().lower()
+    candidates = FAST_BACKENDS if name == 'auto' else (name,)
+
+    for candidate in candidates:
+        if candidate not in BACKENDS:
+            raise ValueError(f"Unknown JSON backend '{candidate}'. Available: {', '.join(BACKENDS)}, auto")
+        try:
+            return BACKENDS[candidate]()
+        except ImportError:
+            if name != 'auto':
+                log.warning("JSON backend '%s' is not installed, using the standard library.", candidate)
+
+    return JsonBackend()
+
+
+def apply_object_hook(data: Any, object_hook: Callable[[dict], Any]) -> Any:
+    """
+    Applies an object hook to every dictionary of parsed JSON data, innermost first, like json.loads does.
+
+    Args:
+        data: The parsed JSON data.
+        object_hook: The callable to convert each dictionary with.
+
+    Returns:
+        The converted data.
+    """
+    if isinstance(data, dict):
+        return object_hook({k: apply_object_hook(v, object_hook) for k, v in data.items()})
+    if isinstance(data, list):
+        return [apply_object_hook(v, object_hook) for v in data]
+    return data
+
+
+backend: JsonBackend = get_backend(os.environ.get('JSON_BACKEND', 'json'))
@@ -4,7 +4,7 @@ from typing import Optional, Dict
 from requests.structures import CaseInsensitiveDict
 from core.web.services.core.constants.http_methods import HttpMethod
 from core.web.services.core.contracts.request import IWebServiceRequest
-from core.utilities.logging.custom_logger import create_logger
+from core.utilities.logging.custom_logger import ClassLogger
 
 
 class Request(IWebServiceRequest, ABC):
@@ -21,6 +21,10 @@ class Request(IWebServiceRequest, ABC):
         __strip_right_url (bool): Flag to indicate whether to strip the right side of the URL.
 
     """
+    __slots__ = ('_logger', 'body', 'full_uri', 'request_type', 'headers', 'query_string', 'auth',
+                 '__strip_right_url', 'kwargs')
+
+    log = ClassLogger()
 
     def __init__(self, **kwargs):
         """
@@ -29,7 +33,8 @@ class Request(IWebServiceRequest, ABC):
         Args:
             **kwargs: Optional keyword arguments to set the request properties.
         """
-        self.log = kwargs.get('logger', create_logger(self.__class__.__name__))
+        if 'logger' in kwargs:
+            self.log = kwargs['logger']
 
         self.body: Dict[str, str] = kwargs.get('body', {})
         self.full_uri: str = kwargs.get('full_uri', "")
@@ -9,7 +9,7 @@ from core.web.services.core.constants.http_methods import HttpMethod
 from core.web.services.core.request import Request
 
 from core.web.services.core.json import JsonObject
-from core.utilities.logging.custom_logger import create_logger
+from core.utilities.logging.custom_logger import ClassLogger
 
 from enum import Enum
 from typing import TypeVar, List
@@ -21,6 +21,10 @@ class RequestBuilder(IWebRequestBuilder):
     """
     A builder class for constructing web service requests.
     """
+    __slots__ = ('_logger', 'routing_separator', '_header', '_query_strings', '_uri_params', '_body', '_method',
+                 '_base_segments', 'strip_right_url_path', 'kwargs')
+
+    log = ClassLogger()
 
     def __init__(self, **kwargs):
         """
@@ -29,7 +33,8 @@ class RequestBuilder(IWebRequestBuilder):
         Args:
             routing_separator: The separator used in the URI routing. Defaults to "/".
         """
-        self.log = kwargs.get('logger', create_logger(self.__class__.__name__))
+        if 'logger' in kwargs:
+            self.log = kwargs['logger']
         self.routing_separator = kwargs.get('routing_separator', "/")
 
         self._header = CaseInsensitiveDict()
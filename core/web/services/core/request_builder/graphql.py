@@ -18,6 +18,8 @@ class RequestBuilderGraphQL(RequestBuilder):
     """
     A builder class for constructing web service requests.
     """
+    __slots__ = ('gql_file', 'base_path')
+
     def __init__(self, gql_file: str, **kwargs):
         super(RequestBuilderGraphQL, self).__init__(**kwargs)
         self.gql_file = gql_file
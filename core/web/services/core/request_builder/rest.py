@@ -5,4 +5,5 @@ class RequestBuilderRest(RequestBuilder):
     """
     A builder class for constructing web service requests.
     """
+    __slots__ = ()
     ...
\ No newline at end of file
@@ -1,20 +1,54 @@
 from abc import ABC
 from http import HTTPStatus
-from typing import TypeVar, Type, Optional
+from typing import TypeVar, Type, Optional, Callable, Any, Iterable, Iterator
 from requests.structures import CaseInsensitiveDict
 
 from core.web.services.core.contracts.response import IResponse
 from core.web.services.core.json import JsonUtility, JsonObject
-from core.utilities.logging.custom_logger import create_logger
+from core.web.services.core.stream import iter_json_array
+from core.utilities.logging.custom_logger import ClassLogger
 
 TResponse = TypeVar("TResponse")
 TTypeHook = TypeVar("TTypeHook")
 
+_UNSET = object()
+_CONSUMED = object()
+
+
+def compile_data_accessor(data_key: Optional[str]) -> Callable[[Any], Any]:
+    """
+    Compiles a data key such as 'data' or 'data.items' into an accessor function.
+
+    Each part of the key is read as an attribute from JsonObject instances and as a key from anything else,
+    so the same accessor works for every type hook.
+
+    Args:
+        data_key: The dotted path to the data, or None to return the data as-is.
+
+    Returns:
+        A function that reads the path from deserialized data.
+    """
+    if data_key is None:
+        return lambda data: data
+
+    parts = tuple(data_key.split('.'))
+
+    def access(data):
+        for part in parts:
+            data = getattr(data, part) if isinstance(data, JsonObject) else data[part]
+        return data
+
+    return access
+
 
 class Response(IResponse[TResponse], ABC):
     """
     A class representing a web service response.
     """
+    __slots__ = ('_logger', '__data_key', '__access_data', '__decode_bytes', '__type_hook', '__data', '__parsed',
+                 '__stream', '__encoding', '__headers', '__status_code')
+
+    log = ClassLogger()
 
     def __init__(self, type_hook: Type[TTypeHook], data: Optional[bytes], response_encoding: str = "ascii", **kwargs):
         """
@@ -24,12 +58,19 @@ class Response(IResponse[TResponse], ABC):
             type_hook: The type to deserialize the response data into.
             data: The raw response data.
             response_encoding: The encoding of the response data.
+            **kwargs: Optional 'data_key' to read the data from (e.g. 'data' for GraphQL) and 'decode_bytes'
+                      to parse the raw bytes directly, skipping the intermediate decoded string.
         """
-        self.log = kwargs.get('logger', create_logger(self.__class__.__name__))
+        if 'logger' in kwargs:
+            self.log = kwargs['logger']
         self.__data_key = kwargs.get('data_key', None)
+        self.__access_data = compile_data_accessor(self.__data_key)
+        self.__decode_bytes = kwargs.get('decode_bytes', False)
 
         self.__type_hook = type_hook
         self.__data = data
+        self.__parsed = _UNSET
+        self.__stream = None
         self.__encoding = response_encoding
         self.__headers = CaseInsensitiveDict()
         self.__status_code: Optional[HTTPStatus] = None
@@ -53,6 +94,48 @@ class Response(IResponse[TResponse], ABC):
             data: The raw data to set.
         """
         self.__data = data
+        self.__parsed = _UNSET
+        self.__stream = None
+
+    def set_stream(self, chunks: Iterable[bytes]):
+        """
+        Sets the body of the response as a stream of chunks that has not been read yet.
+        The stream is either iterated lazily with iter_data or read completely on the first access to the data.
+
+        Args:
+            chunks: The body chunks, e.g. from requests.Response.iter_content().
+        """
+        self.set_raw_data(None)
+        self.__stream = chunks
+
+    def __read_stream(self):
+        if self.__stream is _CONSUMED:
+            raise ValueError("The response stream has already been consumed by iter_data.")
+        if self.__stream is not None:
+            chunks, self.__stream = self.__stream, None
+            self.__data = b''.join(chunks)
+
+    def iter_data(self, child: Optional[str] = None) -> Iterator[Any]:
+        """
+        Yields the elements of the JSON array in the response one by one.
+        A streamed body is parsed while it is read, keeping a single element in memory at a time;
+        a body that was already read is parsed from memory.
+
+        Args:
+            child: Optional dotted path to the array below the data key, e.g. 'items'.
+
+        Returns:
+            An iterator over the elements, deserialized with the type hook of the response.
+        """
+        if self.__stream is None or self.__stream is _CONSUMED:
+            self.__read_stream()
+            chunks = [self.raw_bytes]
+        else:
+            chunks, self.__stream = self.__stream, _CONSUMED
+
+        path = '.'.join(p for p in (self.__data_key, child) if p) or None
+        encoding = 'utf-8' if self.__decode_bytes else self.__encoding
+        return iter_json_array(chunks, path, encoding=encoding, object_hook=self.__type_hook)
 
     def set_status_code(self, status_code: int):
         """
@@ -67,18 +150,22 @@ class Response(IResponse[TResponse], ABC):
     def data(self) -> TResponse:
         """
         Returns the deserialized JSON data of the response.
+        The raw data is parsed on first access only; later accesses return the same object
+        until new raw data is set.
 
         Returns:
             The deserialized JSON data.
         """
+        if self.__parsed is not _UNSET:
+            return self.__parsed
+
+        self.__read_stream()
         try:
-            data = JsonUtility.deserialize(self.__data.decode(self.__encoding), self.__type_hook)
-            if self.__data_key is not None:
-                if isinstance(data, JsonObject):
-                    return eval(f"data.{self.__data_key}")
-                else:
-                    return data[self.__data_key]
-            return data
+            raw = self.__data
+            if isinstance(raw, (bytes, bytearray)) and not self.__decode_bytes:
+                raw = raw.decode(self.__encoding)
+            self.__parsed = self.__access_data(JsonUtility.deserialize(raw, self.__type_hook))
+            return self.__parsed
 
         except Exception as e:
             self.log.error(f"Error deserializing JSON data: {e}")
@@ -92,6 +179,7 @@ class Response(IResponse[TResponse], ABC):
         Returns:
             The raw bytes of the response.
         """
+        self.__read_stream()
         if self.__data is None:
             return bytes()
 
@@ -108,6 +196,7 @@ class Response(IResponse[TResponse], ABC):
         Returns:
             The raw data of the response.
         """
+        self.__read_stream()
         return self.__data
 
     @property
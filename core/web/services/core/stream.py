@@ -0,0 +1,235 @@
+"""
+Incremental parsing of large JSON arrays from a chunked response body.
+
+Only the array at the requested path is materialized, one element at a time, so memory stays bounded by the
+largest single element instead of the whole document.
+"""
+import codecs
+import json
+import re
+
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+import requests
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# the characters that change the nesting depth or start a string, used to skip unwanted values
+_STRUCTURAL = re.compile(r'["{}\[\]]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+
+class _Reader:
+    """
+    A text buffer over a stream of chunks that reads more data on demand and discards what has been consumed.
+    """
+
+    def __init__(self, chunks: Iterable[Union[bytes, str]], encoding: str):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors='strict')
+        self.buffer = ''
+        self.pos = 0
+        self.exhausted = False
+
+    def fill(self) -> bool:
+        """
+        Appends the next chunk to the buffer.
+
+        Returns:
+            False if the stream has no more data.
+        """
+        if self.exhausted:
+            return False
+
+        # drop the consumed prefix so the buffer does not grow with the document
+        if self.pos:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk) if isinstance(chunk, (bytes, bytearray)) else chunk
+            if text:
+                self.buffer += text
+                return True
+
+        self.buffer += self._decoder.decode(b'', final=True)
+        self.exhausted = True
+        return True
+
+    def peek(self) -> str:
+        """
+        Skips whitespace and returns the next character without consuming it.
+
+        Returns:
+            The next character, or an empty string at the end of the stream.
+        """
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self.buffer, self.pos)
+        self.pos += 1
+
+    def decode(self, decoder: json.JSONDecoder) -> Any:
+        """
+        Decodes the next complete value, reading more chunks until it is fully buffered.
+
+        Args:
+            decoder: The decoder to parse the value with.
+
+        Returns:
+            The decoded value.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.pos)
+                # a number at the very end of the buffer may continue in the next chunk
+                if end < len(self.buffer) or self.exhausted:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.exhausted:
+                    raise
+            # at least double the pending text before retrying, so a large value is parsed a bounded number of times
+            wanted = 2 * (len(self.buffer) - self.pos) or 1
+            while len(self.buffer) - self.pos < wanted and self.fill():
+                pass
+
+    def skip(self):
+        """
+        Skips the next value without decoding it, keeping only the current chunk in memory.
+        """
+        if self.peek() not in '{[':
+            self.decode(_plain_decoder)
+            return
+
+        depth = 0
+        in_string = False
+        while True:
+            pattern = _STRING_SPECIAL if in_string else _STRUCTURAL
+            match = pattern.search(self.buffer, self.pos)
+            if match is None:
+                self.pos = len(self.buffer)
+                if not self.fill():
+                    raise json.JSONDecodeError("Unterminated value", self.buffer, self.pos)
+                continue
+
+            char = match.group()
+            if char == '\\':
+                # an escape needs the next character too
+                if match.end() >= len(self.buffer) and not self.exhausted:
+                    self.pos = match.start()
+                    self.fill()
+                    continue
+                self.pos = match.end() + 1
+                continue
+
+            self.pos = match.end()
+            if char == '"':
+                in_string = not in_string
+            elif char in '{[':
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+
+_plain_decoder = json.JSONDecoder()
+
+
+def _navigate(reader: _Reader, path: Optional[str]):
+    if not path:
+        return
+
+    for part in path.split('.'):
+        opening = reader.peek()
+        if opening == '[' and part.isdigit():
+            reader.pos += 1
+            for _ in range(int(part)):
+                if reader.peek() == ']':
+                    raise KeyError(f"Child path '{path}' not found in response data.")
+                reader.skip()
+                reader.expect(',')
+            if reader.peek() == ']':
+                raise KeyError(f"Child path '{path}' not found in response data.")
+            continue
+
+        if opening != '{':
+            raise KeyError(f"Child path '{path}' not found in response data.")
+
+        reader.pos += 1
+        while True:
+            if reader.peek() == '}':
+                raise KeyError(f"Child path '{path}' not found in response data.")
+            key = reader.decode(_plain_decoder)
+            reader.expect(':')
+            if key == part:
+                break
+            reader.skip()
+            if reader.peek() == ',':
+                reader.pos += 1
+
+
+def iter_json_array(chunks: Iterable[Union[bytes, str]], path: Optional[str] = None, encoding: str = 'utf-8',
+                    object_hook: Optional[Callable[[dict], Any]] = None) -> Iterator[Any]:
+    """
+    Yields the elements of a JSON array one by one while the document is still being read.
+
+    Args:
+        chunks: The document as an iterable of byte or text chunks, e.g. requests.Response.iter_content().
+        path: Optional dotted path to the array, e.g. 'data.items'; digits index into arrays.
+              Defaults to the top-level value.
+        encoding: The encoding of byte chunks.
+        object_hook: Optional type to convert every JSON object into, as in json.loads.
+
+    Returns:
+        An iterator over the elements of the array.
+
+    Raises:
+        KeyError: If the path is not found.
+        TypeError: If the value at the path is not an array.
+        JSONDecodeError: If the document is not valid JSON.
+    """
+    reader = _Reader(chunks, encoding)
+    decoder = json.JSONDecoder(object_hook=object_hook) if object_hook not in (None, dict) else _plain_decoder
+
+    _navigate(reader, path)
+    if reader.peek() != '[':
+        raise TypeError(f"Expected a JSON array at '{path or '$'}'.")
+    reader.pos += 1
+
+    if reader.peek() == ']':
+        return
+
+    while True:
+        yield reader.decode(decoder)
+        separator = reader.peek()
+        reader.pos += 1
+        if separator == ']':
+            return
+        if separator != ',':
+            raise json.JSONDecodeError("Expecting ',' delimiter", reader.buffer, reader.pos - 1)
+
+
+def iter_response_chunks(response: requests.Response, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """
+    Yields the body of a streamed requests.Response and releases its connection once it is fully read or abandoned.
+
+    Args:
+        response: A response sent with stream=True.
+        chunk_size: The number of bytes to read at a time.
+
+    Returns:
+        An iterator over the body chunks.
+    """
+    try:
+        yield from response.iter_content(chunk_size=chunk_size)
+    finally:
+        response.close()
@@ -0,0 +1,133 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+
+from http import HTTPStatus
+from unittest.mock import patch
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from core.web.services.core.clients.async_rest import AsyncRestClient
+from core.web.services.core.clients.async_graphql import AsyncGraphQLClient
+from core.web.services.core.request_builder.rest import RequestBuilderRest
+from core.web.services.core.json import JsonObject
+
+
+def fake_response(payload, status_code=HTTPStatus.OK):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict({'Content-Type': 'application/json'})
+    response._content = json.dumps(payload).encode('utf-8')
+    return response
+
+
+class Post(JsonObject):
+    id: int = None
+
+
+class TestsUnitAsyncWebClient(unittest.TestCase):
+    def setUp(self):
+        self.builder = RequestBuilderRest()
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def build_request(self, post_id):
+        return self.builder.get().add_uri_parameter('posts').add_uri_parameter(str(post_id)).build()
+
+    def slow_send(self, method, url, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.05)
+        with self.lock:
+            self.in_flight -= 1
+        return fake_response({'id': int(url.rstrip('/').split('/')[-1])})
+
+    def test_execute_request(self):
+        async def run():
+            async with AsyncRestClient('https://test.local', response_encoding='utf-8') as client:
+                return await client.execute_request(self.build_request(1), response_hook=Post)
+
+        with patch('requests.Session.request', side_effect=self.slow_send):
+            when = asyncio.run(run())
+
+        self.assertEqual(when.status_code, HTTPStatus.OK)
+        self.assertIsInstance(when.data, Post)
+        self.assertEqual(when.data.id, 1)
+
+    def test_execute_many_bounded_concurrency(self):
+        given_requests = [self.build_request(i) for i in range(12)]
+
+        async def run():
+            async with AsyncRestClient('https://test.local', max_concurrency=8) as client:
+                return [r async for r in client.execute_many(given_requests, max_concurrency=3)]
+
+        with patch('requests.Session.request', side_effect=self.slow_send):
+            when = asyncio.run(run())
+
+        self.assertEqual(len(when), 12)
+        self.assertCountEqual([r.data['id'] for r in when], list(range(12)))
+        self.assertLessEqual(self.peak, 3)
+        self.assertGreater(self.peak, 1)
+
+    def test_execute_many_return_exceptions(self):
+        def send(method, url, **kwargs):
+            if url.endswith('/1'):
+                raise requests.exceptions.Timeout('timed out')
+            return fake_response({'id': 0})
+
+        async def run(return_exceptions):
+            async with AsyncRestClient('https://test.local') as client:
+                return [r async for r in client.execute_many([self.build_request(0), self.build_request(1)],
+                                                             return_exceptions=return_exceptions)]
+
+        with patch('requests.Session.request', side_effect=send):
+            when = asyncio.run(run(True))
+            self.assertEqual(len(when), 2)
+            self.assertTrue(any(isinstance(r, requests.exceptions.Timeout) for r in when))
+
+            with self.assertRaises(requests.exceptions.Timeout):
+                asyncio.run(run(False))
+
+    def test_execute_many_above_client_concurrency(self):
+        async def run():
+            async with AsyncRestClient('https://test.local', max_concurrency=2) as client:
+                return [r async for r in client.execute_many([self.build_request(0)], max_concurrency=5)]
+
+        with self.assertRaises(ValueError):
+            asyncio.run(run())
+
+    def test_graphql_errors_per_response(self):
+        def send(method, url, **kwargs):
+            if kwargs['json']['query'] == 'bad':
+                time.sleep(0.05)
+                return fake_response({'data': None, 'errors': [{'message': 'bad query'}]})
+            return fake_response({'data': {'ok': True}, 'errors': []})
+
+        def build(query):
+            return RequestBuilderRest().post().add_json_payload({'query': query}).build()
+
+        async def run():
+            async with AsyncGraphQLClient('https://test.local') as client:
+                responses = [r async for r in client.execute_many([build('bad'), build('good')])]
+                return [(r.data, client.get_errors(r).data) for r in responses]
+
+        with patch('requests.Session.request', side_effect=send):
+            when = asyncio.run(run())
+
+        # the slow failing request completes last, after the good one is already the client's last response
+        self.assertEqual(when, [({'ok': True}, []), (None, [{'message': 'bad query'}])])
+
+    def test_graphql_data_key(self):
+        async def run():
+            async with AsyncGraphQLClient('https://test.local') as client:
+                return await client.execute_request(self.builder.post().build())
+
+        with patch('requests.Session.request', return_value=fake_response({'data': {'Media': {'id': 1}}})):
+            when = asyncio.run(run())
+
+        self.assertEqual(when.data, {'Media': {'id': 1}})
@@ -0,0 +1,200 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from core.web.services.core.clients.cache import CacheEntry, CacheSettings, HttpCache, MemoryCacheBackend, \
+    SqliteCacheBackend, get_cache
+from core.web.services.core.clients.pool import PooledTransport
+from core.web.services.core.clients.rest import RestClient
+from core.web.services.core.request_builder.rest import RequestBuilderRest
+
+
+class CachingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits = {}
+
+    ROUTES = {
+        "/fresh": {"Cache-Control": "max-age=60"},
+        "/etag": {"Cache-Control": "no-cache", "ETag": '"v1"'},
+        "/vary": {"Cache-Control": "max-age=60", "Vary": "Accept-Language"},
+        "/no-store": {"Cache-Control": "no-store"},
+        "/private": {"Cache-Control": "private, max-age=60"},
+    }
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        CachingHandler.hits[path] = CachingHandler.hits.get(path, 0) + 1
+        headers = self.ROUTES[path]
+
+        if headers.get("ETag") and self.headers.get("If-None-Match") == headers["ETag"]:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", headers["ETag"])
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = json.dumps({"path": self.path, "language": self.headers.get("Accept-Language")}).encode("utf-8")
+        self.send_response(HTTPStatus.OK)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestsUnitHttpCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), CachingHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        CachingHandler.hits = {}
+        self.transport = PooledTransport()
+        self.cache = HttpCache(CacheSettings(enabled=True))
+        self.client = RestClient(self.base_url, transport=self.transport, cache=self.cache)
+
+    def tearDown(self):
+        self.transport.close()
+
+    def get(self, path, **query):
+        builder = RequestBuilderRest().get().add_uri_parameter(path)
+        for name, value in query.items():
+            builder = builder.add_query_string(name, value)
+        return self.client.execute_request(builder.build())
+
+    def test_fresh_response_served_from_cache(self):
+        first = self.get("fresh", a=1, b=2)
+        second = self.get("fresh", b=2, a=1)
+
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(CachingHandler.hits["/fresh"], 1)
+        self.assertEqual(self.client.cache_stats["hits"], 1)
+        self.assertEqual(self.client.cache_stats["misses"], 1)
+
+    def test_etag_revalidation(self):
+        first = self.get("etag")
+        second = self.get("etag")
+
+        self.assertEqual(second.status_code, HTTPStatus.OK)
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(CachingHandler.hits["/etag"], 2)
+        self.assertEqual(self.client.cache_stats["revalidations"], 1)
+
+    def test_vary_and_no_store(self):
+        english = RequestBuilderRest().get().add_uri_parameter("vary").add_header("Accept-Language", "en").build()
+        french = RequestBuilderRest().get().add_uri_parameter("vary").add_header("Accept-Language", "fr").build()
+        self.client.execute_request(english)
+        self.assertEqual(self.client.execute_request(french).data["language"], "fr")
+        self.assertEqual(CachingHandler.hits["/vary"], 2)
+
+        self.get("no-store")
+        self.get("no-store")
+        self.assertEqual(CachingHandler.hits["/no-store"], 2)
+
+    def test_cookies_are_part_of_the_key(self):
+        def get_with_cookie(client, cookie):
+            request = RequestBuilderRest().get().add_uri_parameter("fresh").add_header("Cookie", cookie).build()
+            return client.execute_request(request)
+
+        other = RestClient(self.base_url, transport=self.transport, cache=self.cache)
+        get_with_cookie(self.client, "session=a")
+        get_with_cookie(self.client, "session=a")
+        get_with_cookie(other, "session=b")
+        self.assertEqual(CachingHandler.hits["/fresh"], 2)
+
+        # cookies sent from the client are matched like the same Cookie header
+        other.set_cookie_handler({"session": "b"})
+        self.get("fresh")
+        other.execute_request(RequestBuilderRest().get().add_uri_parameter("fresh").build())
+        self.assertEqual(CachingHandler.hits["/fresh"], 3)
+
+    def test_private_not_stored(self):
+        self.get("private")
+        self.get("private")
+        self.assertEqual(CachingHandler.hits["/private"], 2)
+
+    def test_revalidation_forbidding_storage_removes_the_entry(self):
+        response = requests.Response()
+        response.status_code = HTTPStatus.OK
+        response.headers = CaseInsensitiveDict({'Cache-Control': 'no-cache', 'ETag': '"v1"'})
+        response._content = b'{}'
+        entry = self.cache.store("key", {}, response)
+
+        not_modified = requests.Response()
+        not_modified.status_code = HTTPStatus.NOT_MODIFIED
+        not_modified.headers = CaseInsensitiveDict({'Cache-Control': 'no-store'})
+        refreshed = self.cache.refresh("key", entry, not_modified)
+
+        self.assertEqual(refreshed.content, b'{}')
+        self.assertIsNone(self.cache.backend.get("key"))
+
+    def test_malformed_age_is_ignored(self):
+        response = requests.Response()
+        response.status_code = HTTPStatus.OK
+        response.headers = CaseInsensitiveDict({'Cache-Control': 'max-age=60', 'Age': 'yesterday'})
+        response._content = b'{}'
+
+        entry = self.cache.store("key", {}, response)
+        self.assertIsNotNone(entry)
+        self.assertAlmostEqual(entry.expires_at - entry.stored_at, 60, delta=1)
+
+    def test_disabled_by_default_and_shared_when_enabled(self):
+        self.assertIsNone(RestClient(self.base_url).cache)
+
+        settings = {"cache": {"max_entries": 3, "methods": ["get"]}}
+        first, second = RestClient(self.base_url, **settings), RestClient(self.base_url, **settings)
+        self.assertIs(first.cache, second.cache)
+        self.assertIs(first.cache, get_cache(CacheSettings.from_parameters(settings)))
+        self.assertEqual(first.cache.settings.methods, ("GET",))
+
+
+class TestsUnitCacheBackends(unittest.TestCase):
+    @staticmethod
+    def entry(size):
+        return CacheEntry(200, {}, b"x" * size, {}, time.time(), time.time() + 60)
+
+    def check_eviction(self, backend):
+        for key in "abc":
+            backend.set(key, self.entry(10))
+        backend.get("a")
+        backend.set("d", self.entry(10))
+
+        self.assertIsNone(backend.get("b"))
+        self.assertIsNotNone(backend.get("a"))
+        self.assertEqual(len(backend), 3)
+
+        backend.set("e", self.entry(25))
+        self.assertLessEqual(len(backend), 2)
+        self.assertGreaterEqual(backend.stats.evictions, 2)
+
+    def test_memory_lru(self):
+        self.check_eviction(MemoryCacheBackend(max_entries=3, max_bytes=40))
+
+    def test_sqlite_lru(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sqlite")
+            self.check_eviction(SqliteCacheBackend(path, max_entries=3, max_bytes=40))
+
+            entry = SqliteCacheBackend(path, max_entries=3, max_bytes=40).get("e")
+            self.assertEqual(entry.content, b"x" * 25)
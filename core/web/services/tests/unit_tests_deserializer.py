@@ -0,0 +1,85 @@
+import unittest
+
+from dataclasses import dataclass
+from unittest.mock import patch
+
+from core.web.services.core.decorators import deserializer
+from core.web.services.core.decorators.deserializer import deserialized, get_constructor
+
+
+@dataclass
+class Item:
+    id: int
+    name: str = ''
+
+
+class Plain:
+    def __init__(self, id, name=''):
+        self.id = id
+        self.name = name
+
+
+class WithFromDict:
+    def __init__(self, value):
+        self.value = value
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d['id'] * 10)
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+
+class FakeConfig:
+    return_data_only = True
+
+
+class FakeService:
+    config = FakeConfig()
+
+    def __init__(self, data):
+        self.payload = data
+
+    @deserialized(list[Item])
+    def get_items(self):
+        return FakeResponse(self.payload)
+
+    @deserialized(Plain, child='result')
+    def get_plain(self):
+        return FakeResponse(self.payload)
+
+    @deserialized(WithFromDict, many=True)
+    def get_from_dict(self):
+        return FakeResponse(self.payload)
+
+
+class TestsUnitDeserialized(unittest.TestCase):
+    def test_list_of_dataclasses_ignores_unknown_keys(self):
+        when = FakeService([{'id': 1, 'name': 'a', 'extra': True}, {'id': 2}]).get_items()
+        self.assertEqual(when, [Item(1, 'a'), Item(2)])
+
+    def test_auto_many_from_data_envelope(self):
+        when = FakeService({'result': {'data': [{'id': 1, 'unknown': 0}, {'id': 2}]}}).get_plain()
+        self.assertEqual([p.id for p in when], [1, 2])
+
+    def test_from_dict(self):
+        when = FakeService([{'id': 1}, {'id': 2}]).get_from_dict()
+        self.assertEqual([w.value for w in when], [10, 20])
+
+    def test_constructor_compiled_once_per_class(self):
+        deserializer._constructors.pop(Plain, None)
+        with patch.object(deserializer, '_compile_constructor',
+                          wraps=deserializer._compile_constructor) as compile_constructor:
+            FakeService({'result': [{'id': i} for i in range(50)]}).get_plain()
+            FakeService({'result': {'id': 1}}).get_plain()
+
+        self.assertEqual(compile_constructor.call_count, 1)
+        self.assertIs(get_constructor(Plain), get_constructor(Plain))
+
+    def test_failure_returns_response(self):
+        service = FakeService([1, 2])
+        when = service.get_items()
+        self.assertIsInstance(when, FakeResponse)
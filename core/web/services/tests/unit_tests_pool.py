@@ -0,0 +1,124 @@
+import json
+import threading
+import unittest
+
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from core.web.services.core.clients.pool import PooledTransport, PoolSettings
+from core.web.services.core.clients.rest import RestClient
+from core.web.services.core.request_builder.rest import RequestBuilderRest
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps({"path": self.path}).encode("utf-8")
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", "session=abc")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestsUnitPooledTransport(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.transport = PooledTransport()
+        self.builder = RequestBuilderRest()
+
+    def tearDown(self):
+        self.transport.close()
+
+    def test_session_shared_per_host(self):
+        settings = PoolSettings()
+        session = self.transport.session_for("https://a.local/x", settings)
+        self.assertIs(session, self.transport.session_for("https://a.local/y", settings))
+        self.assertIsNot(session, self.transport.session_for("https://b.local/x", settings))
+        self.assertIsNot(session, self.transport.session_for("https://a.local/x", PoolSettings(pool_maxsize=2)))
+
+    def test_settings_from_parameters(self):
+        given = {"base_url": "https://a.local", "pool_maxsize": 32, "keep_alive": None}
+        settings = PoolSettings.from_parameters(given)
+        self.assertEqual(settings.pool_maxsize, 32)
+        self.assertTrue(settings.keep_alive)
+
+        adapter = self.transport.session_for("https://a.local", settings).get_adapter("https://a.local")
+        self.assertEqual(adapter._pool_maxsize, 32)
+
+    def test_connections_are_reused_across_clients(self):
+        first = RestClient(self.base_url, transport=self.transport)
+        second = RestClient(self.base_url, transport=self.transport)
+
+        for client in (first, second, first):
+            response = client.execute_request(self.builder.get().add_uri_parameter("ping").build())
+            self.assertEqual(response.status_code, HTTPStatus.OK)
+
+        self.assertEqual(first.connection_stats, {"new": 1, "reused": 2, "total": 3})
+
+        # shared sessions never keep cookies set by a response
+        session = self.transport.session_for(self.base_url, first.pool_settings)
+        self.assertEqual(len(session.cookies), 0)
+
+    def test_keep_alive_disabled(self):
+        client = RestClient(self.base_url, transport=self.transport, keep_alive=False)
+        for _ in range(2):
+            client.execute_request(self.builder.get().add_uri_parameter("ping").build())
+
+        self.assertEqual(client.connection_stats["reused"], 0)
+
+    def test_idle_eviction_keeps_counters(self):
+        client = RestClient(self.base_url, transport=self.transport, idle_timeout=0)
+        client.execute_request(self.builder.get().add_uri_parameter("ping").build())
+        session = self.transport.session_for(self.base_url, client.pool_settings)
+
+        self.transport.evict_idle()
+
+        self.assertIsNot(session, self.transport.session_for(self.base_url, client.pool_settings))
+        self.assertEqual(client.connection_stats["total"], 1)
+
+    def test_sweep_keeps_sessions_handed_out_since_the_previous_sweep(self):
+        settings = PoolSettings(idle_timeout=0)
+        clock = [100.0]
+        self.transport._last_sweep = 0.0
+
+        def pooled_sessions():
+            return [entry.session for entry in self.transport._entries.values()]
+
+        with patch("core.web.services.core.clients.pool.time.monotonic", side_effect=lambda: clock[0]):
+            session = self.transport.session_for("https://a.local/x", settings)
+
+            # another caller sweeps while the first one may still use its session
+            clock[0] = 102.0
+            self.transport.session_for("https://b.local/x", settings)
+            self.assertIn(session, pooled_sessions())
+
+            # not handed out since the previous sweep: evicted
+            clock[0] = 104.0
+            self.transport.session_for("https://b.local/x", settings)
+            self.assertNotIn(session, pooled_sessions())
+
+    def test_dedicated_session(self):
+        client = RestClient(self.base_url, use_session=True, transport=self.transport)
+        for _ in range(2):
+            client.execute_request(self.builder.get().add_uri_parameter("ping").build())
+
+        self.assertEqual(client.connection_stats, {"new": 1, "reused": 1, "total": 2})
+        self.assertEqual(client.session.cookies.get("session"), "abc")
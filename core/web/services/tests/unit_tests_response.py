@@ -0,0 +1,65 @@
+import logging
+import unittest
+
+from unittest.mock import patch
+
+from core.web.services.core.json import JsonObject, JsonUtility
+from core.web.services.core.request_builder.rest import RequestBuilderRest
+from core.web.services.core.response import Response, compile_data_accessor
+
+
+class TestsUnitResponse(unittest.TestCase):
+    def setUp(self):
+        self.raw = b'{"data": {"Media": {"id": 1, "title": "caf\\u00e9"}}, "errors": []}'
+
+    def test_data_is_parsed_once(self):
+        given = Response(dict, data=self.raw, response_encoding='utf-8')
+        with patch.object(JsonUtility, 'deserialize', wraps=JsonUtility.deserialize) as deserialize:
+            first = given.data
+            second = given.data
+
+        self.assertIs(first, second)
+        self.assertEqual(deserialize.call_count, 1)
+
+    def test_set_raw_data_resets_cache(self):
+        given = Response(dict, data=self.raw, response_encoding='utf-8')
+        self.assertIn('data', given.data)
+
+        given.set_raw_data(b'{"other": true}')
+        self.assertEqual(given.data, {'other': True})
+
+    def test_data_key_dict(self):
+        given = Response(dict, data=self.raw, response_encoding='utf-8', data_key='data.Media')
+        self.assertEqual(given.data['id'], 1)
+
+    def test_data_key_json_object(self):
+        given = Response(JsonObject, data=self.raw, response_encoding='utf-8', data_key='data')
+        self.assertEqual(given.data.Media.title, 'café')
+
+    def test_data_key_missing(self):
+        given = Response(dict, data=self.raw, response_encoding='utf-8', data_key='missing')
+        with self.assertRaises(KeyError):
+            _ = given.data
+
+    def test_decode_bytes(self):
+        given = Response(dict, data='{"name": "café"}'.encode('utf-8'), response_encoding='ascii',
+                         decode_bytes=True)
+        self.assertEqual(given.data, {'name': 'café'})
+
+    def test_compile_data_accessor(self):
+        self.assertEqual(compile_data_accessor(None)({'a': 1}), {'a': 1})
+        self.assertEqual(compile_data_accessor('a.b')({'a': {'b': 2}}), 2)
+
+    def test_compact_objects_share_class_loggers(self):
+        first = Response(dict, data=self.raw)
+        second = Response(dict, data=self.raw)
+        request = RequestBuilderRest().get().add_query_string('q', '1').build()
+
+        for given in (first, request):
+            self.assertFalse(hasattr(given, '__dict__'))
+        self.assertIs(first.log, second.log)
+        self.assertEqual(first.log.name, 'Response')
+
+        custom = logging.getLogger('custom response logger')
+        self.assertIs(Response(dict, data=self.raw, logger=custom).log, custom)
+        self.assertIs(first.log, second.log)
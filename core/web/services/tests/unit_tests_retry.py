@@ -0,0 +1,175 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from http import HTTPStatus
+from http.client import RemoteDisconnected
+from unittest.mock import patch
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from core.web.services.core.clients.rate_limit import RateLimiter, RateLimitSettings, SqliteRateLimiter, \
+    get_rate_limiter
+from core.web.services.core.clients.rest import RestClient
+from core.web.services.core.clients.retry import RetryPolicy
+from core.web.services.core.request_builder.rest import RequestBuilderRest
+
+
+def fake_response(status_code=HTTPStatus.OK, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict({'Content-Type': 'application/json', **(headers or {})})
+    response._content = json.dumps({'status': int(status_code)}).encode('utf-8')
+    return response
+
+
+def refused_error():
+    # as raised by requests when the connection cannot be opened
+    reason = NewConnectionError(None, 'Failed to establish a new connection: [Errno 111] Connection refused')
+    return requests.exceptions.ConnectionError(MaxRetryError(None, '/items', reason))
+
+
+def aborted_error():
+    # as raised by requests when a kept-alive connection is closed while waiting for the response
+    reason = RemoteDisconnected('Remote end closed connection without response')
+    return requests.exceptions.ConnectionError(ProtocolError('Connection aborted.', reason))
+
+
+class TestsUnitRetryPolicy(unittest.TestCase):
+    def test_from_parameters(self):
+        policy = RetryPolicy.from_parameters({'retry': {'total': 3, 'statuses': [503], 'status_rules': {'429': 8},
+                                                        'methods': ['get', 'post']}})
+        self.assertEqual(policy.statuses, {429, 503})
+        self.assertEqual(policy.status_rules, {429: 8})
+        self.assertIn('POST', policy.methods)
+        self.assertEqual(RetryPolicy.from_parameters({}), RetryPolicy())
+
+    def test_next_delay(self):
+        policy = RetryPolicy(total=2, backoff_factor=1, jitter=False, statuses=frozenset({429, 503}),
+                             status_rules={429: 4}, max_retry_after=60)
+
+        self.assertEqual(policy.next_delay(1, 'GET', response=fake_response(503)), 2)
+        self.assertIsNone(policy.next_delay(2, 'GET', response=fake_response(503)))
+        self.assertIsNone(policy.next_delay(0, 'POST', response=fake_response(503)))
+        self.assertIsNone(policy.next_delay(0, 'GET', response=fake_response(500)))
+
+        self.assertEqual(policy.next_delay(3, 'GET', response=fake_response(429, {'Retry-After': '5'})), 8)
+        self.assertEqual(policy.next_delay(0, 'GET', response=fake_response(429, {'Retry-After': '5'})), 5)
+        self.assertIsNone(policy.next_delay(0, 'GET', response=fake_response(429, {'Retry-After': '120'})))
+
+        self.assertEqual(policy.next_delay(0, 'POST', error=refused_error()), 1)
+        self.assertIsNone(policy.next_delay(2, 'GET', error=requests.exceptions.ConnectionError()))
+
+    def test_timeouts_of_writes(self):
+        policy = RetryPolicy(total=2, backoff_factor=1, jitter=False)
+
+        self.assertEqual(policy.next_delay(0, 'POST', error=requests.exceptions.ConnectTimeout()), 1)
+        self.assertIsNone(policy.next_delay(0, 'POST', error=requests.exceptions.ReadTimeout()))
+        self.assertIsNone(policy.next_delay(0, 'PATCH', error=requests.exceptions.Timeout()))
+        self.assertEqual(policy.next_delay(0, 'GET', error=requests.exceptions.ReadTimeout()), 1)
+        self.assertEqual(policy.next_delay(0, 'PUT', error=requests.exceptions.ReadTimeout()), 1)
+
+        self.assertIsNone(policy.next_delay(0, 'POST', error=aborted_error()))
+        self.assertIsNone(policy.next_delay(0, 'POST', error=requests.exceptions.ConnectionError('down')))
+        self.assertEqual(policy.next_delay(0, 'GET', error=aborted_error()), 1)
+
+    def test_jitter_bounds(self):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=3)
+        self.assertTrue(all(0 <= policy.backoff(5) <= 3 for _ in range(100)))
+
+
+class TestsUnitRateLimiter(unittest.TestCase):
+    def test_rate_across_threads(self):
+        limiter = RateLimiter(RateLimitSettings(rate=50, per=1, burst=1))
+        started = time.monotonic()
+        threads = [threading.Thread(target=limiter.acquire, args=('api.local',)) for _ in range(11)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # the first token is free, the next ten are spaced 20ms apart
+        self.assertGreaterEqual(time.monotonic() - started, 0.18)
+        self.assertEqual(limiter.reserve('other.local'), 0)
+
+    def test_block(self):
+        limiter = RateLimiter(RateLimitSettings(rate=10, per=1))
+        limiter.block('api.local', 2)
+        self.assertAlmostEqual(limiter.reserve('api.local'), 2.1, places=1)
+
+    def test_sqlite_buckets_are_shared(self):
+        with tempfile.TemporaryDirectory() as directory:
+            settings = RateLimitSettings(rate=1, per=10, burst=2, backend='sqlite',
+                                         path=os.path.join(directory, 'limits.sqlite'))
+            first, second = SqliteRateLimiter(settings), SqliteRateLimiter(settings)
+
+            self.assertEqual(first.reserve('api.local'), 0)
+            self.assertEqual(second.reserve('api.local'), 0)
+            self.assertGreater(first.reserve('api.local'), 9)
+
+    def test_registry(self):
+        self.assertIsNone(get_rate_limiter(RateLimitSettings()))
+        settings = RateLimitSettings.from_parameters({'rate_limit': {'rate': 5}})
+        self.assertIs(get_rate_limiter(settings), get_rate_limiter(settings))
+
+
+class TestsUnitClientRetries(unittest.TestCase):
+    def setUp(self):
+        self.request = RequestBuilderRest().get().add_uri_parameter('items').build()
+
+    def test_retries_status_then_succeeds(self):
+        client = RestClient('https://test.local', retry={'total': 3, 'statuses': [503], 'backoff_factor': 0.5})
+        responses = [fake_response(503), fake_response(503), fake_response(200)]
+
+        with patch('requests.Session.request', side_effect=responses) as send, \
+                patch('core.web.services.core.clients.base.time.sleep') as sleep:
+            when = client.execute_request(self.request)
+
+        self.assertEqual(when.status_code, HTTPStatus.OK)
+        self.assertEqual(send.call_count, 3)
+        self.assertEqual(sleep.call_count, 2)
+
+    def test_too_many_requests_blocks_host(self):
+        limiter = RateLimiter(RateLimitSettings(rate=100, per=1))
+        client = RestClient('https://test.local', rate_limit=limiter,
+                            retry=RetryPolicy(statuses=frozenset({429}), jitter=False))
+
+        with patch('requests.Session.request',
+                   side_effect=[fake_response(429, {'Retry-After': '1'}), fake_response(200)]), \
+                patch('core.web.services.core.clients.rate_limit.time.sleep') as sleep:
+            client.execute_request(self.request)
+
+        self.assertGreaterEqual(sleep.call_args[0][0], 0.9)
+
+    def test_connection_error_retried_once_by_default(self):
+        client = RestClient('https://test.local')
+        with patch('requests.Session.request', side_effect=requests.exceptions.ConnectionError('down')) as send:
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                client.execute_request(self.request)
+
+        self.assertEqual(send.call_count, 2)
+
+    def test_read_timeout_of_post_not_retried(self):
+        client = RestClient('https://test.local', retry={'total': 3})
+        request = RequestBuilderRest().post().add_uri_parameter('items').build()
+        with patch('requests.Session.request', side_effect=requests.exceptions.ReadTimeout('slow')) as send, \
+                patch('core.web.services.core.clients.base.time.sleep'):
+            with self.assertRaises(requests.exceptions.ReadTimeout):
+                client.execute_request(request)
+
+        self.assertEqual(send.call_count, 1)
+
+    def test_aborted_post_not_retried(self):
+        client = RestClient('https://test.local', retry={'total': 3})
+        request = RequestBuilderRest().post().add_uri_parameter('items').build()
+        with patch('requests.Session.request', side_effect=aborted_error()) as send, \
+                patch('core.web.services.core.clients.base.time.sleep'):
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                client.execute_request(request)
+
+        self.assertEqual(send.call_count, 1)
@@ -0,0 +1,142 @@
+import json
+import threading
+import unittest
+
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from core.web.services.core.clients.pool import PooledTransport
+from core.web.services.core.clients.rest import RestClient
+from core.web.services.core.decorators.deserializer import deserialized
+from core.web.services.core.json import JsonObject
+from core.web.services.core.request_builder.rest import RequestBuilderRest
+from core.web.services.core.stream import iter_json_array
+
+DOCUMENT = {
+    "meta": {"note": "skip [me] {please} \"quoted\" \\", "pages": [1, [2, 3]], "n": 12345},
+    "data": {"total": 3, "items": [{"id": 1, "name": "café"}, {"id": 2, "nested": {"a": [1, 2]}}, {"id": 30}]},
+}
+
+
+def chunked(text, size):
+    raw = text.encode("utf-8")
+    return [raw[i:i + size] for i in range(0, len(raw), size)]
+
+
+class ChunkedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for chunk in chunked(json.dumps(DOCUMENT), 7):
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Item:
+    def __init__(self, id, name=None):
+        self.id = id
+        self.name = name
+
+
+class TestsUnitStreamParser(unittest.TestCase):
+    def test_child_path_any_chunk_size(self):
+        text = json.dumps(DOCUMENT)
+        for size in (1, 2, 3, 7, 64, 4096):
+            when = list(iter_json_array(chunked(text, size), "data.items"))
+            self.assertEqual(when, DOCUMENT["data"]["items"], f"chunk size {size}")
+
+    def test_top_level_array_of_scalars(self):
+        when = list(iter_json_array(chunked("[1, 22, 333, -4.5e3, \"x\", null, true]", 1)))
+        self.assertEqual(when, [1, 22, 333, -4500.0, "x", None, True])
+
+    def test_empty_array_and_array_index(self):
+        self.assertEqual(list(iter_json_array([b"[ ]"])), [])
+        self.assertEqual(list(iter_json_array([b'[[1], [2, 3]]'], "1")), [2, 3])
+
+    def test_object_hook(self):
+        when = list(iter_json_array(chunked(json.dumps(DOCUMENT), 5), "data.items", object_hook=JsonObject))
+        self.assertEqual(when[1].nested.a, [1, 2])
+
+    def test_is_lazy(self):
+        consumed = []
+
+        def chunks():
+            for chunk in chunked(json.dumps(DOCUMENT), 4):
+                consumed.append(chunk)
+                yield chunk
+
+        first = next(iter_json_array(chunks(), "data.items"))
+        self.assertEqual(first["id"], 1)
+        self.assertLess(len(consumed), len(chunked(json.dumps(DOCUMENT), 4)))
+
+    def test_errors(self):
+        with self.assertRaises(KeyError):
+            list(iter_json_array([json.dumps(DOCUMENT)], "data.missing"))
+        with self.assertRaises(TypeError):
+            list(iter_json_array([json.dumps(DOCUMENT)], "data.total"))
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_json_array([b'[{"id": 1}, {"id": ']))
+
+
+class FakeConfig:
+    return_data_only = True
+
+
+class ItemsService:
+    config = FakeConfig()
+
+    def __init__(self, client):
+        self.client = client
+
+    @deserialized(list[Item], child="data.items", stream=True)
+    def get_items(self):
+        return self.client.execute_request(RequestBuilderRest().get().add_uri_parameter("items").build(), stream=True)
+
+
+class TestsUnitStreamedResponse(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), ChunkedHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.transport = PooledTransport()
+        self.client = RestClient(self.base_url, transport=self.transport, response_encoding="utf-8",
+                                 stream_chunk_size=16)
+
+    def tearDown(self):
+        self.transport.close()
+
+    def test_iter_data(self):
+        response = self.client.execute_request(RequestBuilderRest().get().build(), stream=True)
+        self.assertEqual([i["id"] for i in response.iter_data("data.items")], [1, 2, 30])
+
+        with self.assertRaises(ValueError):
+            _ = response.data
+
+    def test_data_reads_stream(self):
+        response = self.client.execute_request(RequestBuilderRest().get().build(), stream=True)
+        self.assertEqual(response.data, DOCUMENT)
+        self.assertEqual(len(list(response.iter_data("data.items"))), 3)
+
+    def test_deserialized_stream(self):
+        when = ItemsService(self.client).get_items()
+        self.assertFalse(isinstance(when, list))
+
+        items = list(when)
+        self.assertEqual([i.id for i in items], [1, 2, 30])
+        self.assertEqual(items[0].name, "café")